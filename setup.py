@@ -18,6 +18,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/sahmadzai/finterm",
     packages=find_packages(),
+    package_data={"src.data": ["universes/*.csv"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Financial and Insurance Industry",
@@ -48,6 +49,9 @@ setup(
         "pytz>=2023.3",
     ],
     extras_require={
+        "streaming": [
+            "websockets>=13.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
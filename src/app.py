@@ -2,9 +2,11 @@
 FinTerm - A professional TUI for financial market analysis.
 """
 
+import asyncio
+from functools import partial
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, Grid
-from textual.widgets import Header, Footer, Static
+from textual.widgets import Header, Footer, Input, Static
 from textual.binding import Binding
 from textual.screen import Screen
 from rich.text import Text
@@ -18,6 +20,10 @@ from .widgets import (
     SentimentWidget,
     MarketTickerWidget,
 )
+from .data.cache import market_cache
+from .data.news import NewsFetcher
+from .data.stocks import StockDataFetcher
+from .data.streaming import quote_producer
 from .utils.config import config
 from .utils.logger import logger
 
@@ -26,15 +32,22 @@ class DashboardScreen(Screen):
     """Main dashboard screen."""
 
     BINDINGS = [
-        Binding("q", "quit", "Quit", priority=True),
+        Binding("q", "quit", "Quit"),
         Binding("r", "refresh", "Refresh All"),
         Binding("1", "show_spy", "SPY"),
         Binding("2", "show_qqq", "QQQ"),
         Binding("3", "show_aapl", "AAPL"),
         Binding("4", "show_tsla", "TSLA"),
+        Binding("o", "cycle_overlay", "Overlay"),
+        Binding("p", "cycle_panel", "Panel"),
+        Binding("slash", "search_news", "Search"),
+        Binding("escape", "clear_search", "Clear search", show=False),
         Binding("h", "toggle_help", "Help"),
     ]
 
+    # Keys are hotkeys until the user asks to search
+    AUTO_FOCUS = ""
+
     CSS = """
     DashboardScreen {
         layout: vertical;
@@ -72,10 +85,20 @@ class DashboardScreen(Screen):
         width: 1fr;
     }
 
-    #news {
+    #news-column {
         width: 1fr;
     }
 
+    #news-search {
+        height: 1;
+        border: none;
+        padding: 0 1;
+    }
+
+    #news {
+        height: 1fr;
+    }
+
     #sentiment {
         width: 1fr;
     }
@@ -110,15 +133,41 @@ class DashboardScreen(Screen):
             # Bottom row: Market Movers, News, Sentiment
             with Horizontal(id="bottom-row"):
                 yield MarketMoversWidget(id="market-movers")
-                yield NewsWidget(limit=5, id="news")
+                with Vertical(id="news-column"):
+                    yield Input(placeholder="/ search news", id="news-search")
+                    yield NewsWidget(limit=5, id="news")
                 yield SentimentWidget(id="sentiment")
 
         yield Footer()
 
+    def on_mount(self):
+        """Warm the fundamentals and ticker news caches for the watchlist in the background."""
+        StockDataFetcher().warm_fundamentals(config.default_tickers)
+        self.news_fetcher = NewsFetcher()
+        self.run_worker(self.warm_news())
+        # Reload cached ticker news once it is past half its TTL, checked every
+        # third of the TTL, so it is replaced well before it expires and ticker
+        # hotkeys stay instant
+        news_ttl = market_cache.ttl_for('news')
+        self.set_interval(news_ttl / 3, partial(self.warm_news, refresh_within=news_ttl / 2))
+
+    async def warm_news(self, refresh_within: float = 0.0):
+        """
+        Prefetch news for watchlist tickers missing from the cache, then re-blend sentiment.
+
+        Args:
+            refresh_within: Also reload news expiring within this many seconds
+        """
+        futures = self.news_fetcher.warm_ticker_news(config.default_tickers, refresh_within)
+        if not futures:
+            return
+        await asyncio.gather(*(asyncio.wrap_future(future) for future in futures), return_exceptions=True)
+        self.query_one(SentimentWidget).update_news()
+
     def action_refresh(self):
         """Refresh all widgets."""
         for widget in self.query("BaseWidget"):
-            widget.refresh_data()
+            widget.run_worker(widget.refresh_data(), exclusive=True)
 
     def action_show_spy(self):
         """Show SPY data."""
@@ -136,6 +185,34 @@ class DashboardScreen(Screen):
         """Show TSLA data."""
         self._update_ticker("TSLA")
 
+    def action_cycle_overlay(self):
+        """Show the next chart overlay."""
+        self.query_one("#chart-main", ChartWidget).cycle_overlay()
+
+    def action_cycle_panel(self):
+        """Show the next chart indicator panel."""
+        self.query_one("#chart-main", ChartWidget).cycle_panel()
+
+    def action_search_news(self):
+        """Focus the news search box."""
+        self.query_one("#news-search", Input).focus()
+
+    def action_clear_search(self):
+        """Clear the news search and leave the search box."""
+        search = self.query_one("#news-search", Input)
+        search.value = ""
+        self.set_focus(None)
+
+    def on_input_changed(self, event: Input.Changed):
+        """Filter the news panel as the search query is typed."""
+        if event.input.id == "news-search":
+            self.query_one("#news", NewsWidget).set_query(event.value)
+
+    def on_input_submitted(self, event: Input.Submitted):
+        """Leave the search box, keeping the results on screen."""
+        if event.input.id == "news-search":
+            self.set_focus(None)
+
     def _update_ticker(self, ticker: str):
         """Update the current ticker across relevant widgets."""
         self.current_ticker = ticker
@@ -148,9 +225,9 @@ class DashboardScreen(Screen):
         info = self.query_one("#ticker-info", TickerInfoWidget)
         info.set_ticker(ticker)
 
-        # Optionally update news to ticker-specific
-        # news = self.query_one("#news", NewsWidget)
-        # news.set_ticker(ticker)
+        # Ticker news is prefetched for the watchlist, so this is served from cache
+        news = self.query_one("#news", NewsWidget)
+        news.set_ticker(ticker)
 
     def action_toggle_help(self):
         """Toggle help screen."""
@@ -280,6 +357,9 @@ class HelpScreen(Screen):
             ("2", "Show QQQ ticker"),
             ("3", "Show AAPL ticker"),
             ("4", "Show TSLA ticker"),
+            ("o", "Cycle chart overlay (SMA, EMA, Bollinger, VWAP)"),
+            ("p", "Cycle chart panel (RSI, MACD, ATR)"),
+            ("/", "Search news (Enter keeps results, ESC clears)"),
             ("ESC", "Close help screen"),
         ]
 
@@ -320,7 +400,7 @@ class FinTermApp(App):
     """
 
     BINDINGS = [
-        Binding("q", "quit", "Quit", priority=True),
+        Binding("q", "quit", "Quit"),
     ]
 
     def on_mount(self):
@@ -329,8 +409,12 @@ class FinTermApp(App):
         self.push_screen(DashboardScreen())
         self.push_screen(DisclaimerScreen())
 
+        # Single producer publishing quotes for every subscribed symbol
+        quote_producer.start()
+
     def action_quit(self):
         """Quit the application."""
+        quote_producer.stop()
         self.exit()
 
 
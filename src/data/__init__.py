@@ -1,6 +1,90 @@
 """Data fetching modules for FinTerm."""
-from .stocks import StockDataFetcher
-from .news import NewsFetcher
-from .sentiment import SentimentAnalyzer
+from .cache import TTLCache, market_cache
+from .singleflight import SingleFlight, single_flight
+from .history import HistoryStore, history_store
+from .executor import DeadlineExceeded, FetchExecutor, TokenBucket, fetch_executor
+from .fundamentals import FundamentalsCache, fundamentals_cache
+from .providers import (
+    MarketDataProvider,
+    YFinanceProvider,
+    RecordingProvider,
+    ReplayProvider,
+    get_provider,
+    set_provider,
+)
+from .stocks import StockDataFetcher, QuoteTable
+from .feeds import FeedCache, feed_cache
+from .search import NewsIndex, news_index, tokenize
+from .headline_sentiment import HeadlineScorer, headline_scorer
+from .news import NewsFetcher, NewsAggregator, SeenIndex, article_key, seen_index
+from .movers import MoversEngine, TopK
+from .scanner import MarketScanner, load_universe
+from .sentiment import SentimentAnalyzer, RollingSentiment
+from .indicators import Indicator, IndicatorCache, indicator_cache, parse_indicator
+from .quote_bus import (
+    QuoteBus,
+    Subscription,
+    PollingQuoteProducer,
+    quote_bus,
+)
+from .streaming import (
+    StreamingQuoteProducer,
+    create_quote_producer,
+    quote_producer,
+)
+from .async_fetchers import AsyncStockDataFetcher, AsyncNewsFetcher, run_blocking
 
-__all__ = ["StockDataFetcher", "NewsFetcher", "SentimentAnalyzer"]
+__all__ = [
+    "TTLCache",
+    "market_cache",
+    "SingleFlight",
+    "single_flight",
+    "HistoryStore",
+    "history_store",
+    "DeadlineExceeded",
+    "FetchExecutor",
+    "TokenBucket",
+    "fetch_executor",
+    "FundamentalsCache",
+    "fundamentals_cache",
+    "MarketDataProvider",
+    "YFinanceProvider",
+    "RecordingProvider",
+    "ReplayProvider",
+    "get_provider",
+    "set_provider",
+    "StockDataFetcher",
+    "QuoteTable",
+    "FeedCache",
+    "feed_cache",
+    "NewsIndex",
+    "news_index",
+    "tokenize",
+    "HeadlineScorer",
+    "headline_scorer",
+    "NewsFetcher",
+    "NewsAggregator",
+    "SeenIndex",
+    "article_key",
+    "seen_index",
+    "MoversEngine",
+    "TopK",
+    "MarketScanner",
+    "load_universe",
+    "SentimentAnalyzer",
+    "RollingSentiment",
+    "Indicator",
+    "IndicatorCache",
+    "indicator_cache",
+    "parse_indicator",
+    "QuoteBus",
+    "Subscription",
+    "PollingQuoteProducer",
+    "quote_bus",
+    "StreamingQuoteProducer",
+    "create_quote_producer",
+    "quote_producer",
+    "AsyncStockDataFetcher",
+    "AsyncNewsFetcher",
+    "run_blocking",
+]
@@ -0,0 +1,107 @@
+"""
+Async facades over the blocking data fetchers.
+
+yfinance and feedparser are synchronous, so calling them inside a widget's
+``fetch_data`` coroutine would freeze the Textual event loop (and keyboard
+input) for the whole network round-trip. These facades run the blocking calls
+on a bounded thread pool and await the result instead.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import asyncio
+import functools
+import logging
+
+import pandas as pd
+
+from .stocks import StockDataFetcher, QuoteTable
+from .news import NewsFetcher
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on blocking data calls running at the same time
+DEFAULT_MAX_WORKERS = 8
+
+_executor = ThreadPoolExecutor(
+    max_workers=DEFAULT_MAX_WORKERS,
+    thread_name_prefix="finterm-data",
+)
+
+
+async def run_blocking(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking callable on the shared data thread pool and await its result.
+
+    Cancelling the awaiting task (e.g. when a Textual worker is replaced) cancels
+    the call if it has not started yet; a call already running completes in the
+    background and its result is discarded.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
+
+
+class AsyncStockDataFetcher:
+    """Awaitable wrapper around StockDataFetcher."""
+
+    def __init__(self, fetcher: Optional[StockDataFetcher] = None):
+        self.fetcher = fetcher or StockDataFetcher()
+
+    async def get_quote(self, ticker: str) -> Optional[Dict]:
+        """Get current quote for a ticker."""
+        return await run_blocking(self.fetcher.get_quote, ticker)
+
+    async def get_quotes(self, tickers: List[str]) -> Dict[str, Dict]:
+        """Get current quotes for many tickers using bulk downloads."""
+        return await run_blocking(self.fetcher.get_quotes, tickers)
+
+    async def get_quote_table(self, tickers: List[str]) -> QuoteTable:
+        """Get current quotes for many tickers as a columnar QuoteTable."""
+        return await run_blocking(self.fetcher.get_quote_table, tickers)
+
+    async def get_ticker_snapshot(self, ticker: str) -> Optional[Dict]:
+        """Get quote, company info and financials for a ticker in one round-trip."""
+        return await run_blocking(self.fetcher.get_ticker_snapshot, ticker)
+
+    async def get_historical_data(
+        self,
+        ticker: str,
+        period: str = "1mo",
+        interval: str = "1d"
+    ) -> Optional[pd.DataFrame]:
+        """Get historical price data."""
+        return await run_blocking(self.fetcher.get_historical_data, ticker, period, interval)
+
+    async def get_company_info(self, ticker: str) -> Optional[Dict]:
+        """Get detailed company information."""
+        return await run_blocking(self.fetcher.get_company_info, ticker)
+
+    async def get_financials(self, ticker: str) -> Optional[Dict]:
+        """Get financial statements for a ticker."""
+        return await run_blocking(self.fetcher.get_financials, ticker)
+
+    async def get_market_movers(self, tickers: List[str]) -> List[Tuple[str, float, float]]:
+        """Get top movers from a list of tickers."""
+        return await run_blocking(self.fetcher.get_market_movers, tickers)
+
+
+class AsyncNewsFetcher:
+    """Awaitable wrapper around NewsFetcher."""
+
+    def __init__(self, fetcher: Optional[NewsFetcher] = None):
+        self.fetcher = fetcher or NewsFetcher()
+
+    async def get_market_news(self, limit: int = 10) -> List[Dict]:
+        """Get general market news."""
+        return await run_blocking(self.fetcher.get_market_news, limit)
+
+    async def get_ticker_news(self, ticker: str, limit: int = 5) -> List[Dict]:
+        """Get news for a specific ticker."""
+        return await run_blocking(self.fetcher.get_ticker_news, ticker, limit)
+
+    def search(self, query: str, limit: int = 50) -> List[Dict]:
+        """Search fetched articles (in memory, fast enough to run on the UI thread)."""
+        return self.fetcher.search(query, limit)
+
+    async def mark_seen(self, articles: List[Dict]) -> Set[str]:
+        """Record articles as shown, returning the IDs never shown before."""
+        return await run_blocking(self.fetcher.mark_seen, articles)
@@ -0,0 +1,183 @@
+"""
+Process-wide in-memory cache for market data.
+
+All StockDataFetcher instances share a single cache so that widgets asking for
+the same symbol during a refresh only trigger one network request.
+"""
+from collections import OrderedDict
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TYPE_CHECKING
+import threading
+import time
+import logging
+
+if TYPE_CHECKING:
+    from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Root directory for on-disk caches
+CACHE_DIR = Path.home() / ".finterm" / "cache"
+
+# Time-to-live per kind of data. Quotes move constantly, company data barely at all.
+DEFAULT_TTLS: Dict[str, timedelta] = {
+    'quote': timedelta(seconds=30),
+    'quotes': timedelta(seconds=30),
+    'history': timedelta(minutes=5),
+    'bars': timedelta(minutes=5),
+    'company': timedelta(hours=24),
+    'financials': timedelta(hours=24),
+    'news': timedelta(minutes=5),
+}
+DEFAULT_TTL = timedelta(minutes=5)
+DEFAULT_MAX_ENTRIES = 2048
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a per-kind TTL.
+
+    Keys are ``(kind, symbol, *args)`` tuples, where ``kind`` selects the TTL
+    (e.g. ``'quote'`` or ``'history'``).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttls: Optional[Dict[str, timedelta]] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, kind: str) -> float:
+        """Return the TTL in seconds for a kind of data."""
+        return self.ttls.get(kind, DEFAULT_TTL).total_seconds()
+
+    def get(self, key: Tuple[Hashable, ...], default: Any = None) -> Any:
+        """
+        Look up a key, counting a hit or a miss.
+
+        Args:
+            key: Cache key, first element is the data kind
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def expires_in(self, key: Tuple[Hashable, ...]) -> Optional[float]:
+        """Return the seconds until a key expires, or None if it is missing or expired (not counted)."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        remaining = entry[0] - time.monotonic()
+        return remaining if remaining > 0 else None
+
+    def set(self, key: Tuple[Hashable, ...], value: Any, ttl: Optional[float] = None):
+        """
+        Store a value, evicting the least recently used entries if full.
+
+        Args:
+            key: Cache key, first element is the data kind
+            value: Value to store
+            ttl: Optional TTL in seconds overriding the per-kind default
+        """
+        if ttl is None:
+            ttl = self.ttl_for(key[0])
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(
+        self,
+        key: Tuple[Hashable, ...],
+        loader: Callable[[], Any],
+        flight: Optional["SingleFlight"] = None,
+        refresh: bool = False,
+    ) -> Any:
+        """
+        Return the cached value for key, calling loader on a miss.
+
+        ``None`` results are not cached so failed fetches are retried.
+
+        Args:
+            key: Cache key, first element is the data kind
+            loader: Zero-argument callable fetching the value
+            flight: Optional SingleFlight group so concurrent misses share one load
+            refresh: Load even if the key is cached; the cached value stays
+                until a non-None result replaces it
+        """
+        if not refresh:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+        def load():
+            loaded = loader()
+            if loaded is not None:
+                self.set(key, loaded)
+            return loaded
+
+        if flight is not None:
+            return flight.do(key, load)
+        return load()
+
+    def invalidate(self, symbol: Optional[str] = None, kind: Optional[str] = None):
+        """
+        Drop entries matching a symbol and/or kind (everything if neither given).
+        """
+        with self._lock:
+            if symbol is None and kind is None:
+                self._entries.clear()
+                return
+            for key in list(self._entries):
+                if kind is not None and key[0] != kind:
+                    continue
+                if symbol is not None and (len(key) < 2 or key[1] != symbol):
+                    continue
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Shared cache used by every StockDataFetcher in the process
+market_cache = TTLCache()
@@ -0,0 +1,231 @@
+"""
+Shared, rate-limited executor for network fetches.
+
+Fetching hundreds of symbols serially takes minutes, while unbounded parallelism
+gets us throttled by Yahoo. The FetchExecutor runs requests on a bounded worker
+pool, spaces them with a per-host token bucket, and retries rate-limit (429)
+and server (5xx) errors with exponential backoff.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+import random
+import threading
+import time
+import logging
+
+from ..utils.config import config, AppConfig
+
+try:
+    from yfinance.exceptions import YFRateLimitError
+except ImportError:  # older yfinance releases
+    YFRateLimitError = None
+
+logger = logging.getLogger(__name__)
+
+# Logical host for all Yahoo Finance API requests made through yfinance
+YAHOO_HOST = "finance.yahoo.com"
+
+# Never sleep longer than this between retries
+MAX_BACKOFF_SECONDS = 30.0
+
+
+def host_of(url: str) -> str:
+    """Return the host name of a URL, for per-host rate limiting."""
+    return urlparse(url).netloc or url
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Return True for rate-limit (429) and server (5xx) errors."""
+    if YFRateLimitError is not None and isinstance(error, YFRateLimitError):
+        return True
+
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None) or getattr(error, 'status', None)
+    if isinstance(status, int):
+        return status == 429 or 500 <= status < 600
+
+    message = str(error)
+    return '429' in message or 'Too Many Requests' in message
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Return the server's Retry-After delay in seconds, if it sent one."""
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        return float(headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a rate-limited request could not start before its deadline."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` calls per second with bursts."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1, deadline: Optional[float] = None) -> bool:
+        """
+        Block until ``tokens`` are available, then take them.
+
+        A request for more tokens than the burst waits for a full bucket and
+        leaves it in debt, so later callers wait until the debt is repaid.
+
+        Args:
+            tokens: Tokens to take
+            deadline: time.monotonic() value after which to give up
+
+        Returns:
+            True once the tokens are taken, or False (taking nothing) as soon as
+            they would not be available before the deadline
+        """
+        needed = min(tokens, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= needed:
+                    self._tokens -= tokens
+                    return True
+                wait = (needed - self._tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class FetchExecutor:
+    """Bounded worker pool with per-host rate limiting and retry with backoff."""
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        rate_per_second: float = 4.0,
+        burst: int = 8,
+        max_retries: int = 3,
+        backoff_seconds: float = 0.5,
+    ):
+        self.max_workers = max_workers
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="finterm-fetch",
+        )
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
+        self._local = threading.local()
+
+    @classmethod
+    def from_config(cls, app_config: AppConfig) -> "FetchExecutor":
+        """Create an executor using the limits set in AppConfig."""
+        return cls(
+            max_workers=app_config.fetch_workers,
+            rate_per_second=app_config.rate_limit_per_second,
+            burst=app_config.rate_limit_burst,
+            max_retries=app_config.fetch_max_retries,
+            backoff_seconds=app_config.fetch_backoff_seconds,
+        )
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._buckets_lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate_per_second, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def call(
+        self,
+        host: str,
+        fn: Callable[..., Any],
+        *args,
+        cost: int = 1,
+        deadline: Optional[float] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Call fn in the current thread, rate limited and retried for host.
+
+        Args:
+            host: Host the request goes to (selects the token bucket)
+            fn: Callable performing the network request(s)
+            cost: Number of requests fn sends, charged against the bucket on
+                every attempt (e.g. one per symbol of a bulk download)
+            deadline: time.monotonic() value after which no attempt is started
+                (and nothing more is charged)
+
+        Returns:
+            The result of fn
+
+        Raises:
+            DeadlineExceeded: If an attempt could not start before the deadline
+            The last error once retries are exhausted, or any non-retryable error
+        """
+        bucket = self._bucket(host)
+        attempt = 0
+        while True:
+            if not bucket.acquire(cost, deadline):
+                raise DeadlineExceeded(f"Request to {host} could not start before its deadline")
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+                delay = _retry_after(e)
+                if delay is None:
+                    delay = self.backoff_seconds * (2 ** attempt)
+                    delay += random.uniform(0, self.backoff_seconds)
+                delay = min(delay, MAX_BACKOFF_SECONDS)
+                attempt += 1
+                logger.warning(
+                    f"Retrying request to {host} in {delay:.1f}s "
+                    f"(attempt {attempt}/{self.max_retries}): {e}"
+                )
+                time.sleep(delay)
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Run fn on the worker pool.
+
+        fn is not rate limited itself; use call() inside it for each request.
+        When called from a worker thread, fn runs inline so nested fan-outs
+        cannot deadlock the pool.
+        """
+        if getattr(self._local, 'in_worker', False):
+            future: Future = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        return self._pool.submit(self._run_in_worker, fn, *args, **kwargs)
+
+    def _run_in_worker(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        self._local.in_worker = True
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._local.in_worker = False
+
+    def map(self, fn: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """Apply fn to every item on the worker pool, returning results in input order."""
+        futures = [self.submit(fn, item) for item in items]
+        return [future.result() for future in futures]
+
+
+# Shared executor used by the data fetchers
+fetch_executor = FetchExecutor.from_config(config)
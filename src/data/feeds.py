@@ -0,0 +1,240 @@
+"""
+Conditional RSS/Atom feed fetching with an on-disk cache.
+
+Feeds are refreshed far more often than they change. Each feed's ETag and
+Last-Modified validators are kept on disk next to its parsed entries, so every
+request (including the first one after a restart) is conditional: an unchanged
+feed costs a 304 and no parsing, and the cached entries are served. A feed is
+not requested at all more often than its minimum poll interval.
+"""
+from pathlib import Path
+from typing import Dict, List, Optional
+import calendar
+import hashlib
+import json
+import os
+import threading
+import time
+import logging
+
+from .cache import CACHE_DIR
+from .executor import FetchExecutor, fetch_executor, host_of
+from .providers import MarketDataProvider
+from ..utils.config import config
+
+logger = logging.getLogger(__name__)
+
+FEEDS_DIR = CACHE_DIR / "feeds"
+DEFAULT_MIN_POLL_SECONDS = 120.0
+
+
+def normalize_entry(entry: Dict) -> Dict:
+    """
+    Reduce a parsed feed entry to the JSON-serializable fields FinTerm uses.
+
+    Args:
+        entry: Entry as returned by feedparser
+
+    Returns:
+        Dictionary with 'id', 'title', 'summary', 'link', 'published' and
+        'published_ts' (UTC epoch seconds, or None if the feed gives no date)
+    """
+    published = entry.get('published_parsed') or entry.get('updated_parsed')
+    return {
+        'id': entry.get('id') or entry.get('link', ''),
+        'title': entry.get('title', ''),
+        'summary': entry.get('summary', ''),
+        'link': entry.get('link', ''),
+        'published': entry.get('published', entry.get('updated', '')),
+        'published_ts': calendar.timegm(tuple(published)) if published else None,
+    }
+
+
+class FeedCache:
+    """
+    Persistent per-feed validators and parsed entries.
+
+    Each feed has two JSON files under ``~/.finterm/cache/feeds``: a small one
+    with its validators and last poll time, rewritten on every poll, and one
+    with its entries, rewritten only when the feed changed.
+    """
+
+    def __init__(
+        self,
+        root: Path = FEEDS_DIR,
+        min_interval: float = DEFAULT_MIN_POLL_SECONDS,
+        executor: Optional[FetchExecutor] = None
+    ):
+        self.root = root
+        self.min_interval = min_interval
+        self._executor = executor if executor is not None else fetch_executor
+        self._feeds: Dict[str, Dict] = {}
+        self._feed_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        url: str,
+        provider: MarketDataProvider,
+        min_interval: Optional[float] = None
+    ) -> List[Dict]:
+        """
+        Return a feed's entries, requesting it only when due and parsing it only if changed.
+
+        Args:
+            url: Feed URL
+            provider: Provider that performs the conditional request
+            min_interval: Seconds between requests for this feed (defaults to
+                the cache's; a longer <ttl> published by the feed wins)
+
+        Returns:
+            Normalized entries (see normalize_entry), newest as ordered by the feed
+        """
+        with self._feed_lock(url):
+            state = self._load(url)
+            now = time.time()
+            if state is not None and now - state['checked_at'] < self._interval(state, min_interval):
+                return state['entries']
+
+            try:
+                response = self._executor.call(
+                    host_of(url),
+                    provider.fetch_feed,
+                    url,
+                    etag=state['etag'] if state else None,
+                    modified=state['modified'] if state else None,
+                )
+            except Exception as e:
+                if state is None:
+                    raise
+                logger.error(f"Error fetching feed {url}, serving cached entries: {e}")
+                return state['entries']
+
+            if response.get('status') == 304 and state is not None:
+                state['checked_at'] = now
+                state['etag'] = response.get('etag') or state['etag']
+                state['modified'] = response.get('modified') or state['modified']
+                self._write_meta(url, state)
+                return state['entries']
+
+            entries = response.get('entries') or []
+            if not entries:
+                # A failed request or an empty body: keep the last good entries,
+                # and save nothing new, so the next call retries
+                logger.warning(f"Feed {url} returned no entries (status {response.get('status')})")
+                return state['entries'] if state is not None else []
+
+            state = {
+                'url': url,
+                'etag': response.get('etag'),
+                'modified': response.get('modified'),
+                'ttl': response.get('ttl'),
+                'checked_at': now,
+                'entries': self._normalize(entries, state),
+            }
+            with self._lock:
+                self._feeds[url] = state
+            # Entries first: validators must never describe entries not on disk
+            self._write(self._path(url, 'entries'), state['entries'])
+            self._write_meta(url, state)
+            return state['entries']
+
+    def invalidate(self, url: Optional[str] = None):
+        """Drop cached validators and entries for one feed, or for every feed."""
+        with self._lock:
+            if url is None:
+                self._feeds.clear()
+            else:
+                self._feeds.pop(url, None)
+
+        if url is not None:
+            self._path(url, 'meta').unlink(missing_ok=True)
+            self._path(url, 'entries').unlink(missing_ok=True)
+        elif self.root.exists():
+            for path in self.root.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _normalize(entries: List[Dict], previous: Optional[Dict]) -> List[Dict]:
+        """Normalize entries, reusing the unchanged ones from the previous poll."""
+        known = {entry['id']: entry for entry in previous['entries']} if previous else {}
+        normalized = []
+        for entry in entries:
+            cached = known.get(entry.get('id') or entry.get('link', ''))
+            if cached is not None and cached['title'] == entry.get('title', ''):
+                normalized.append(cached)
+            else:
+                normalized.append(normalize_entry(entry))
+        return normalized
+
+    def _feed_lock(self, url: str) -> threading.Lock:
+        """Per-feed lock, so concurrent refreshes of one feed send one request."""
+        with self._lock:
+            return self._feed_locks.setdefault(url, threading.Lock())
+
+    def _interval(self, state: Dict, min_interval: Optional[float]) -> float:
+        interval = self.min_interval if min_interval is None else min_interval
+        try:
+            # RSS <ttl> is in minutes
+            return max(interval, float(state.get('ttl') or 0) * 60)
+        except ValueError:
+            return interval
+
+    def _path(self, url: str, kind: str) -> Path:
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.root / f"{key}.{kind}.json"
+
+    def _write_meta(self, url: str, state: Dict):
+        self._write(
+            self._path(url, 'meta'),
+            {key: value for key, value in state.items() if key != 'entries'},
+        )
+
+    def _write(self, path: Path, data):
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.error(f"Error writing feed cache {path.name}: {e}")
+
+    def _load(self, url: str) -> Optional[Dict]:
+        """Return a feed's state from memory, reading it from disk the first time."""
+        with self._lock:
+            state = self._feeds.get(url)
+        if state is not None:
+            return state
+
+        meta_path = self._path(url, 'meta')
+        entries_path = self._path(url, 'entries')
+        if not meta_path.exists() or not entries_path.exists():
+            return None
+
+        try:
+            with open(meta_path, 'r') as f:
+                state = json.load(f)
+            with open(entries_path, 'r') as f:
+                state['entries'] = json.load(f)
+        except Exception as e:
+            logger.error(f"Error reading feed cache for {url}: {e}")
+            return None
+
+        with self._lock:
+            self._feeds[url] = state
+        return state
+
+
+# Feed requests get their own pool and rate limits, so a news refresh fanning
+# out over dozens of feeds neither queues behind nor starves quote fetches
+feed_executor = FetchExecutor(
+    max_workers=config.news_feed_workers,
+    rate_per_second=config.news_feed_rate_per_second,
+    burst=config.news_feed_workers,
+    max_retries=config.fetch_max_retries,
+    backoff_seconds=config.fetch_backoff_seconds,
+)
+
+# Shared cache used by every NewsFetcher in the process
+feed_cache = FeedCache(min_interval=config.news_min_poll_seconds, executor=feed_executor)
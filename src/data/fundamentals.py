@@ -0,0 +1,123 @@
+"""
+Disk-backed cache for company profiles and fundamentals.
+
+Sector, industry, employees and valuation inputs change at most quarterly, so
+they are kept on disk for a day or more and survive restarts. Tickers seen
+before render their company and metrics sections without any network access.
+"""
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+import json
+import os
+import re
+import threading
+import time
+import logging
+
+from .cache import CACHE_DIR
+from ..utils.config import config
+
+logger = logging.getLogger(__name__)
+
+FUNDAMENTALS_DIR = CACHE_DIR / "fundamentals"
+DEFAULT_FUNDAMENTALS_TTL = timedelta(days=1)
+
+
+class FundamentalsCache:
+    """
+    Persistent per-ticker store of company info and financials with a long TTL.
+
+    Entries are JSON files under ``~/.finterm/cache/fundamentals``, mirrored in
+    memory after the first read.
+    """
+
+    def __init__(self, root: Path = FUNDAMENTALS_DIR, ttl: timedelta = DEFAULT_FUNDAMENTALS_TTL):
+        self.root = root
+        self.ttl = ttl
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def get(self, ticker: str) -> Optional[Dict]:
+        """
+        Return cached fundamentals for a ticker if they are still fresh.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Dictionary with 'company' and 'financials' keys, or None
+        """
+        entry = self._load(ticker)
+        if entry is None:
+            return None
+        if time.time() - entry['fetched_at'] > self.ttl.total_seconds():
+            return None
+        return {'company': entry['company'], 'financials': entry['financials']}
+
+    def set(self, ticker: str, company: Dict, financials: Dict):
+        """Store fundamentals for a ticker in memory and on disk."""
+        entry = {
+            'fetched_at': time.time(),
+            'company': company,
+            'financials': financials,
+        }
+        with self._lock:
+            self._entries[ticker] = entry
+
+        path = self._path(ticker)
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.error(f"Error writing fundamentals cache for {ticker}: {e}")
+
+    def missing(self, tickers: List[str]) -> List[str]:
+        """Return the tickers with no fresh cached fundamentals."""
+        return [ticker for ticker in tickers if self.get(ticker) is None]
+
+    def invalidate(self, ticker: Optional[str] = None):
+        """Drop cached fundamentals for one ticker, or for every ticker."""
+        with self._lock:
+            if ticker is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(ticker, None)
+
+        if ticker is not None:
+            self._path(ticker).unlink(missing_ok=True)
+        elif self.root.exists():
+            for path in self.root.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def _path(self, ticker: str) -> Path:
+        return self.root / f"{re.sub(r'[^A-Za-z0-9.-]', '_', ticker)}.json"
+
+    def _load(self, ticker: str) -> Optional[Dict]:
+        """Return the entry from memory, reading it from disk the first time."""
+        with self._lock:
+            entry = self._entries.get(ticker)
+        if entry is not None:
+            return entry
+
+        path = self._path(ticker)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except Exception as e:
+            logger.error(f"Error reading fundamentals cache for {ticker}: {e}")
+            return None
+
+        with self._lock:
+            self._entries[ticker] = entry
+        return entry
+
+
+# Shared cache used by every StockDataFetcher in the process
+fundamentals_cache = FundamentalsCache(ttl=timedelta(hours=config.fundamentals_ttl_hours))
@@ -0,0 +1,240 @@
+"""
+Lexicon-based sentiment of news headlines.
+
+DISCLAIMER: Headline sentiment is a crude word count, provided for informational
+purposes only. It should NOT be interpreted as investment advice or trading signals.
+
+Each headline is scored from finance word lists: positive and negative words
+(some weighted double) are summed, a negation up to three words before a word
+flips it ("not profitable", "no sign of recovery") unless punctuation comes
+between, and the sum is squashed into [-1, 1]. Scores are cached by article
+ID, so a headline is only scored the first time it is fetched.
+"""
+from typing import Dict, Iterable, List, Optional
+import itertools
+import re
+import threading
+import numpy as np
+
+from .search import stem
+
+DEFAULT_SCORE_CACHE_SIZE = 50000
+
+# A negation flips words this many positions after it
+NEGATION_WINDOW = 3
+
+# Larger values make a single word count for less
+NORMALIZATION_ALPHA = 4.0
+
+# Distinct tokens remembered with their kind before the memo is reset
+TOKEN_MEMO_SIZE = 100000
+
+# Joins the headlines of a batch, so one split tokenizes all of them
+_SEPARATOR_TOKEN = "\x00"
+_SEPARATOR = f" {_SEPARATOR_TOKEN} "
+
+# Punctuation ending a negation's scope ("doesn't miss: profit soars")
+_BREAK_CHARS = ".,;:!?"
+
+_WORD_RE = re.compile(r"[a-z]+(?:'[a-z]+)?")
+
+POSITIVE_WORDS = """
+advance advantage approval approve beat best boost bullish buyback climb
+confident dividend expand gain good grow growth higher improve increase
+innovative jump lift optimism optimistic outperform profit profitable raise
+rebound recover recovery rise rising robust strong stronger success
+upbeat upgrade upside win
+"""
+
+STRONG_POSITIVE_WORDS = """
+blowout breakthrough rally skyrocket soar surge
+"""
+
+NEGATIVE_WORDS = """
+bearish concern cut decline decrease deficit delay downgrade downside drop
+fall fear fell layoff loss lose lower miss probe recall recession risk
+selloff slide slip slow slowdown slump sink tariff threat trouble
+uncertainty volatile warn warning weak weaker worry worse worst
+"""
+
+STRONG_NEGATIVE_WORDS = """
+bankruptcy collapse crash default fraud lawsuit plunge plummet scandal tumble
+"""
+
+NEGATIONS = frozenset("""
+no not never none nor without cannot lack fails
+""".split())
+
+
+def _build_lexicon() -> Dict[str, float]:
+    """Map the stem of every lexicon word to its weight."""
+    lexicon = {}
+    for words, weight in (
+        (POSITIVE_WORDS, 1.0),
+        (STRONG_POSITIVE_WORDS, 2.0),
+        (NEGATIVE_WORDS, -1.0),
+        (STRONG_NEGATIVE_WORDS, -2.0),
+    ):
+        for word in words.split():
+            lexicon[word] = weight
+            lexicon[stem(word)] = weight
+    return lexicon
+
+
+LEXICON = _build_lexicon()
+
+# Token kinds: the low bits index a word's weight in _KIND_WEIGHTS, and
+# BREAK_AFTER marks tokens followed by punctuation or a headline boundary
+NEUTRAL, NEGATION, END = 0, 5, 6
+BREAK_AFTER = 8
+_KIND_MASK = 7
+_WEIGHT_KINDS = {1.0: 1, 2.0: 2, -1.0: 3, -2.0: 4}
+_KIND_WEIGHTS = np.array([0.0, 1.0, 2.0, -1.0, -2.0, 0.0, 0.0, 0.0])
+
+
+def _token_kind(token: str) -> int:
+    """Classify one whitespace-separated token (see NEUTRAL, NEGATION, END and BREAK_AFTER)."""
+    if token == _SEPARATOR_TOKEN:
+        return END | BREAK_AFTER
+    words = _WORD_RE.findall(token.lower().replace('’', "'"))
+    kind = NEUTRAL
+    if len(words) == 1:
+        word = words[0]
+        if word in NEGATIONS or word.endswith("n't"):
+            kind = NEGATION
+        else:
+            weight = LEXICON.get(word, LEXICON.get(stem(word)))
+            kind = _WEIGHT_KINDS[weight] if weight else NEUTRAL
+    trimmed = token.rstrip('"\'”)]')
+    if trimmed and trimmed[-1] in _BREAK_CHARS:
+        kind |= BREAK_AFTER
+    return kind
+
+
+class _TokenKinds(dict):
+    """Token -> kind memo that classifies tokens on first lookup."""
+
+    def __missing__(self, token: str) -> int:
+        kind = self[token] = _token_kind(token)
+        return kind
+
+
+class HeadlineScorer:
+    """
+    Scores headlines and caches the score of each article.
+
+    A batch is scored together: its headlines are joined and split on
+    whitespace in one call, each token is mapped to its kind through a
+    dictionary memoized per distinct token (so a word is lowercased, classified
+    and stemmed once, not per occurrence), and negation scopes and
+    per-headline sums are computed with NumPy.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_SCORE_CACHE_SIZE):
+        self.capacity = capacity
+        # Article ID -> score, oldest first
+        self._scores: Dict[str, float] = {}
+        # Token -> kind, for every token seen so far
+        self._kinds: Dict[str, int] = _TokenKinds()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def score_text(self, text: str) -> float:
+        """
+        Score one headline.
+
+        Args:
+            text: Headline text
+
+        Returns:
+            Sentiment from -1 (negative) to 1 (positive), 0 when no lexicon
+            word appears
+        """
+        return float(self.score_texts([text])[0])
+
+    def score_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Score several headlines in one pass, without caching.
+
+        Args:
+            texts: Headline texts
+
+        Returns:
+            Array with one score per headline (see score_text)
+        """
+        tokens = (_SEPARATOR.join(texts) + _SEPARATOR).split()
+        if len(self._kinds) > TOKEN_MEMO_SIZE:
+            self._kinds.clear()
+        kinds = np.fromiter(map(self._kinds.__getitem__, tokens), dtype=np.int8, count=len(tokens))
+        word_kinds = kinds & _KIND_MASK
+
+        # A token is negated when the last negation before it is within the
+        # window and no punctuation or headline boundary lies between them
+        positions = np.arange(len(kinds))
+        last_negation = np.maximum.accumulate(np.where(word_kinds == NEGATION, positions, -1))
+        last_break = np.maximum.accumulate(np.where(kinds & BREAK_AFTER, positions, -1))
+        last_break_before = np.concatenate(([-1], last_break[:-1]))
+        negated = (last_negation > last_break_before) & (positions - last_negation <= NEGATION_WINDOW)
+        weights = np.where(negated, -_KIND_WEIGHTS[word_kinds], _KIND_WEIGHTS[word_kinds])
+
+        ends = word_kinds == END
+        headlines = np.cumsum(ends) - ends
+        totals = np.bincount(headlines, weights=weights, minlength=len(texts))[:len(texts)]
+        return totals / np.sqrt(totals * totals + NORMALIZATION_ALPHA)
+
+    def score_many(self, articles: Iterable[Dict]) -> List[float]:
+        """
+        Score a batch of articles, reusing cached scores.
+
+        Args:
+            articles: Articles with 'id' and 'title' keys (articles without an
+                ID are scored but not cached)
+
+        Returns:
+            One score per article, in input order
+        """
+        articles = list(articles)
+        ids = [article.get('id') for article in articles]
+        with self._lock:
+            scores = list(map(self._scores.get, ids))
+            missing = [position for position, score in enumerate(scores) if score is None]
+            if missing:
+                new_scores = self.score_texts([articles[position].get('title', '') for position in missing]).tolist()
+                for position, score in zip(missing, new_scores):
+                    scores[position] = score
+                self._scores.update(
+                    (ids[position], score) for position, score in zip(missing, new_scores) if ids[position]
+                )
+                # Evict the oldest scores; a headline evicted and fetched again is simply rescored
+                excess = len(self._scores) - self.capacity
+                if excess > 0:
+                    for article_id in list(itertools.islice(self._scores, excess)):
+                        del self._scores[article_id]
+        return scores
+
+    def summarize(self, articles: Iterable[Dict]) -> Optional[Dict]:
+        """
+        Aggregate the headline sentiment of several articles.
+
+        Args:
+            articles: Articles with 'id' and 'title' keys
+
+        Returns:
+            Dictionary with the mean 'score' (-1 to 1), 'count', and the number
+            of 'positive' and 'negative' headlines, or None without articles
+        """
+        scores = self.score_many(articles)
+        if not scores:
+            return None
+        return {
+            'score': sum(scores) / len(scores),
+            'count': len(scores),
+            'positive': sum(1 for score in scores if score > 0),
+            'negative': sum(1 for score in scores if score < 0),
+        }
+
+
+# Scores of every headline fetched in this process
+headline_scorer = HeadlineScorer()
@@ -0,0 +1,400 @@
+"""
+Persistent on-disk store for historical OHLCV bars.
+
+Bars are kept per (symbol, interval) in a columnar NumPy ``.npz`` file, one array
+per column. When a chart asks for history, only the missing tail since the last
+stored bar is downloaded and appended; a full download happens only when the
+store does not reach back far enough.
+
+Requests are answered from cached supersets where possible: shorter periods are
+sliced out of longer stored series, and coarse intervals (15m, 1h, 1d, ...) are
+resampled from stored finer bars (1m, 5m, ...).
+"""
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+import os
+import re
+import threading
+import time
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .cache import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+HISTORY_DIR = CACHE_DIR / "history"
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# How long stored bars are trusted before the tail is re-requested
+TAIL_REFRESH_SECONDS = 5 * 60
+
+# Calendar span of month/year periods, as understood by Yahoo Finance
+_PERIOD_OFFSETS = {
+    '1mo': pd.DateOffset(months=1),
+    '3mo': pd.DateOffset(months=3),
+    '6mo': pd.DateOffset(months=6),
+    '1y': pd.DateOffset(years=1),
+    '2y': pd.DateOffset(years=2),
+    '5y': pd.DateOffset(years=5),
+    '10y': pd.DateOffset(years=10),
+}
+
+# Finer intervals each interval can be resampled from, finest first
+_RESAMPLE_SOURCES = {
+    '15m': ['1m', '2m', '5m'],
+    '30m': ['1m', '2m', '5m', '15m'],
+    '60m': ['1m', '2m', '5m', '15m', '30m'],
+    '1h': ['1m', '2m', '5m', '15m', '30m'],
+    '90m': ['1m', '5m', '15m', '30m'],
+    '1d': ['1m', '2m', '5m', '15m', '30m', '60m', '1h', '90m'],
+    '1wk': ['1d'],
+    '1mo': ['1d'],
+}
+
+# pandas resample rules for each target interval
+_RESAMPLE_RULES = {
+    '15m': '15min',
+    '30m': '30min',
+    '60m': '60min',
+    '1h': '60min',
+    '90m': '90min',
+    '1d': '1D',
+    '1wk': 'W-MON',
+    '1mo': 'MS',
+}
+
+# Daily-or-coarser downloads are widened to at least this period, so that later
+# shorter requests can be sliced from the store without another download
+_MIN_DAILY_BACKFILL = '1y'
+_SHORTER_THAN_MIN_BACKFILL = {'1d', '5d', '1mo', '3mo', '6mo', 'ytd'}
+
+_OHLCV_AGGREGATION = {
+    'Open': 'first',
+    'High': 'max',
+    'Low': 'min',
+    'Close': 'last',
+    'Volume': 'sum',
+}
+
+# Sentinel for "covers the full available history" (period="max")
+_COVERS_ALL = np.iinfo(np.int64).min
+
+# Signature: fetch(ticker, interval, period=None, start=None) -> DataFrame
+HistoryFetch = Callable[..., Optional[pd.DataFrame]]
+
+
+def is_intraday(interval: str) -> bool:
+    """Return True for minute and hour intervals."""
+    return interval.endswith(('m', 'h'))
+
+
+def period_sessions(period: str) -> Optional[int]:
+    """Return the number of trading sessions for day periods like '5d', else None."""
+    match = re.fullmatch(r'(\d+)d', period)
+    return int(match.group(1)) if match else None
+
+
+def period_start(period: str, now: pd.Timestamp) -> Optional[pd.Timestamp]:
+    """
+    Return the calendar start of a month/year/ytd period.
+
+    Returns None for session-based periods ('5d') and for 'max'.
+    """
+    if period == 'ytd':
+        return now.normalize().replace(month=1, day=1)
+    offset = _PERIOD_OFFSETS.get(period)
+    return now - offset if offset is not None else None
+
+
+def resample_bars(bars: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """
+    Aggregate OHLCV bars into a coarser interval (vectorized).
+
+    Intraday bins are aligned to the first bar's time of day, so hourly bars of a
+    market opening at 9:30 run 9:30-10:30 like the provider's own hourly bars.
+    """
+    rule = _RESAMPLE_RULES[interval]
+    if is_intraday(interval):
+        first = bars.index[0]
+        offset = (first - first.normalize()) % pd.Timedelta(rule)
+        resampled = bars.resample(rule, origin='start_day', offset=offset)
+    elif interval == '1d':
+        resampled = bars.resample(rule)
+    else:
+        resampled = bars.resample(rule, label='left', closed='left')
+
+    return resampled.agg(_OHLCV_AGGREGATION).dropna(subset=['Open'])
+
+
+class _Series:
+    """In-memory copy of one (symbol, interval) file."""
+
+    def __init__(self, bars: pd.DataFrame, covered_from: int, fetched_at: float):
+        self.bars = bars
+        self.covered_from = covered_from  # UTC ns of the earliest time known to be complete
+        self.fetched_at = fetched_at      # epoch seconds of the last network fetch
+
+    def covers(self, period: str) -> bool:
+        """
+        Return True if the stored bars can answer period with at most a tail fetch.
+
+        The store must reach back to the start of the period, and its newest bar
+        must lie inside the period (otherwise the gap is as large as the period).
+        """
+        if self.bars.empty:
+            return False
+        if period == 'max':
+            return self.covered_from == _COVERS_ALL
+
+        now = pd.Timestamp.now(tz='UTC')
+        last = self.bars.index[-1]
+        sessions = period_sessions(period)
+        if sessions is not None:
+            # Allow for weekends and holidays between sessions
+            recent_enough = last >= now - pd.Timedelta(days=sessions + 4)
+            return recent_enough and self.bars.index.normalize().nunique() >= sessions
+
+        start = period_start(period, now)
+        if start is None:
+            return False
+        return self.covered_from <= start.value and last >= start
+
+    def slice(self, period: str) -> pd.DataFrame:
+        """Return the stored bars that fall inside period."""
+        if period == 'max':
+            return self.bars
+
+        sessions = period_sessions(period)
+        if sessions is not None:
+            days = self.bars.index.normalize()
+            keep = days.unique()[-sessions:]
+            return self.bars[days.isin(keep)]
+
+        start = period_start(period, pd.Timestamp.now(tz='UTC'))
+        return self.bars[self.bars.index >= start]
+
+
+class HistoryStore:
+    """
+    Disk-backed OHLCV store with incremental gap-only fetches.
+
+    Survives restarts: every update is written back to ``~/.finterm/cache/history``.
+    """
+
+    def __init__(self, root: Path = HISTORY_DIR):
+        self.root = root
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def get(
+        self,
+        ticker: str,
+        period: str,
+        interval: str,
+        fetch: HistoryFetch
+    ) -> Optional[pd.DataFrame]:
+        """
+        Return bars for period, fetching only what the store is missing.
+
+        Args:
+            ticker: Stock ticker symbol
+            period: Data period (5d, 1mo, 1y, ytd, max, ...)
+            interval: Data interval (1m, 1h, 1d, ...)
+            fetch: Callable downloading bars, called as
+                ``fetch(ticker, interval, period=...)`` or ``fetch(ticker, interval, start=...)``
+
+        Returns:
+            DataFrame with OHLCV data or None if nothing could be loaded
+        """
+        key = (ticker, interval)
+        with self._lock_for(key):
+            series = self._load(key)
+            if series is not None and series.covers(period):
+                self._refresh_if_stale(key, series, fetch)
+                return series.slice(period).copy()
+
+            resampled = self._from_finer_interval(ticker, period, interval, fetch)
+            if resampled is not None:
+                return resampled
+
+            series = self._backfill(key, period, fetch) or series
+            if series is None or series.bars.empty:
+                return None
+            return series.slice(period).copy()
+
+    def _refresh_if_stale(self, key: Tuple[str, str], series: _Series, fetch: HistoryFetch):
+        """Append the missing tail if the series has not been fetched recently."""
+        if time.time() - series.fetched_at > TAIL_REFRESH_SECONDS:
+            self._append_tail(key, series, fetch)
+
+    def _from_finer_interval(
+        self,
+        ticker: str,
+        period: str,
+        interval: str,
+        fetch: HistoryFetch
+    ) -> Optional[pd.DataFrame]:
+        """Resample a stored finer-interval series covering period, if there is one."""
+        for source in _RESAMPLE_SOURCES.get(interval, []):
+            # Locks are always taken coarse before fine, so this cannot deadlock
+            source_key = (ticker, source)
+            with self._lock_for(source_key):
+                series = self._load(source_key)
+                if series is None or not series.covers(period):
+                    continue
+                self._refresh_if_stale(source_key, series, fetch)
+                bars = series.slice(period)
+
+            resampled = resample_bars(bars, interval)
+            resampled.index.name = 'Datetime' if is_intraday(interval) else 'Date'
+            logger.debug(f"Resampled {ticker} {source} bars to {interval} for {period}")
+            return resampled
+
+        return None
+
+    def last_timestamp(self, ticker: str, interval: str) -> Optional[pd.Timestamp]:
+        """Return the timestamp of the newest stored bar, if any."""
+        series = self._load((ticker, interval))
+        if series is None or series.bars.empty:
+            return None
+        return series.bars.index[-1]
+
+    def clear(self, ticker: Optional[str] = None):
+        """Delete stored bars for one ticker, or for every ticker."""
+        with self._locks_guard:
+            for key in list(self._series):
+                if ticker is None or key[0] == ticker:
+                    del self._series[key]
+        pattern = f"{self._safe_name(ticker)}__*.npz" if ticker else "*.npz"
+        for path in self.root.glob(pattern):
+            path.unlink(missing_ok=True)
+
+    def _backfill(self, key: Tuple[str, str], period: str, fetch: HistoryFetch) -> Optional[_Series]:
+        """Download the full period and replace the stored series."""
+        ticker, interval = key
+        if not is_intraday(interval) and period in _SHORTER_THAN_MIN_BACKFILL:
+            period = _MIN_DAILY_BACKFILL
+
+        df = fetch(ticker, interval, period=period)
+        if df is None or df.empty:
+            return None
+
+        bars = self._normalize(df)
+        if period == 'max':
+            covered_from = _COVERS_ALL
+        else:
+            start = period_start(period, pd.Timestamp.now(tz='UTC'))
+            first = bars.index[0].value
+            covered_from = min(start.value, first) if start is not None else first
+
+        existing = self._series.get(key)
+        if (existing is not None and not existing.bars.empty
+                and existing.bars.index[-1] >= bars.index[0]):
+            # Keep older stored bars that overlap with and extend the new download
+            older = existing.bars[existing.bars.index < bars.index[0]]
+            if not older.empty:
+                bars = pd.concat([older, bars])
+                covered_from = min(covered_from, existing.covered_from)
+
+        series = _Series(bars, covered_from, time.time())
+        self._save(key, series)
+        return series
+
+    def _append_tail(self, key: Tuple[str, str], series: _Series, fetch: HistoryFetch):
+        """Download bars from the last stored one onwards and append them."""
+        ticker, interval = key
+        last = series.bars.index[-1]
+        # The last stored bar may have been incomplete, so request it again
+        start = last if is_intraday(interval) else last.normalize()
+
+        try:
+            df = fetch(ticker, interval, start=start)
+        except Exception as e:
+            logger.error(f"Error fetching new {ticker} {interval} bars, serving stored ones: {e}")
+            return
+        # A failed or empty fetch leaves fetched_at alone, so the next call retries
+        if df is None or df.empty:
+            return
+
+        tail = self._normalize(df)
+        kept = series.bars[series.bars.index < tail.index[0]]
+        series.bars = pd.concat([kept, tail])
+        series.fetched_at = time.time()
+        self._save(key, series)
+        logger.debug(f"Appended {len(tail)} bars to {ticker} {interval} history")
+
+    @staticmethod
+    def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+        """Keep OHLCV columns, sorted by time and without duplicate timestamps."""
+        bars = df[OHLCV_COLUMNS].astype('float64')
+        if bars.index.tz is None:
+            bars.index = bars.index.tz_localize('UTC')
+        bars = bars[~bars.index.duplicated(keep='last')]
+        return bars.sort_index()
+
+    def _lock_for(self, key: Tuple[str, str]) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    @staticmethod
+    def _safe_name(ticker: str) -> str:
+        return re.sub(r'[^A-Za-z0-9.-]', '_', ticker)
+
+    def _path(self, key: Tuple[str, str]) -> Path:
+        ticker, interval = key
+        return self.root / f"{self._safe_name(ticker)}__{interval}.npz"
+
+    def _load(self, key: Tuple[str, str]) -> Optional[_Series]:
+        """Return the series from memory, reading it from disk the first time."""
+        series = self._series.get(key)
+        if series is not None:
+            return series
+
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                index = pd.to_datetime(data['timestamp'], utc=True).tz_convert(str(data['tz']))
+                index.name = 'Datetime' if is_intraday(key[1]) else 'Date'
+                bars = pd.DataFrame(
+                    {column: data[column] for column in OHLCV_COLUMNS},
+                    index=index,
+                )
+                series = _Series(bars, int(data['covered_from']), float(data['fetched_at']))
+        except Exception as e:
+            logger.error(f"Error reading history store {path}: {e}")
+            return None
+
+        self._series[key] = series
+        return series
+
+    def _save(self, key: Tuple[str, str], series: _Series):
+        """Write a series to disk atomically and keep it in memory."""
+        self._series[key] = series
+        path = self._path(key)
+        tmp_path = path.with_suffix('.tmp.npz')
+        index = series.bars.index
+
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            np.savez(
+                tmp_path,
+                timestamp=index.tz_convert('UTC').as_unit('ns').asi8,
+                tz=np.array(str(index.tz)),
+                covered_from=np.array(series.covered_from, dtype=np.int64),
+                fetched_at=np.array(series.fetched_at),
+                **{column: series.bars[column].to_numpy() for column in OHLCV_COLUMNS},
+            )
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.error(f"Error writing history store {path}: {e}")
+
+
+# Shared store used by every StockDataFetcher in the process
+history_store = HistoryStore()
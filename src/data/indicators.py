@@ -0,0 +1,482 @@
+"""
+Technical indicators computed over OHLCV arrays.
+
+Each indicator fills its output arrays from a given bar onwards, so the same
+code serves a full computation (from bar 0) and an incremental one (only the
+bars appended, plus the last bar in case it was revised). IndicatorCache keeps
+the bars and results per (symbol, period, interval) and per (indicator, params):
+when a chart refreshes with new bars only those bars are computed, and reading
+an indicator that is already cached costs nothing. The period is part of the
+key because EMA seeds and daily VWAP depend on where the history starts, so a
+chart shows the same values whichever period was viewed first.
+
+All indicators are causal (a value depends only on bars up to and including
+its own), which is what makes extending them valid.
+"""
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Type
+import threading
+import logging
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .history import OHLCV_COLUMNS, is_intraday
+
+logger = logging.getLogger(__name__)
+
+# Bars arrays passed to indicators: OHLCV columns plus 'Session' (VWAP resets)
+Bars = Dict[str, np.ndarray]
+
+# (symbol, period, interval) series kept in an IndicatorCache
+DEFAULT_MAX_SERIES = 64
+
+
+def _rolling(values: np.ndarray, period: int, start: int, out: np.ndarray, fn):
+    """Fill out[start:] with fn over trailing windows of ``period`` values."""
+    end = len(values)
+    first = max(start, period - 1)
+    out[start:first] = np.nan
+    if first >= end:
+        return
+    windows = sliding_window_view(values[first - period + 1:end], period)
+    out[first:end] = fn(windows, axis=1)
+
+
+def _ema(values: np.ndarray, out: np.ndarray, start: int, alpha: float):
+    """Fill out[start:] with an exponential moving average seeded by the first value."""
+    if start == 0:
+        out[0] = values[0]
+        start = 1
+    previous = out[start - 1]
+    for i in range(start, len(values)):
+        previous += alpha * (values[i] - previous)
+        out[i] = previous
+
+
+def _wilder(values: np.ndarray, out: np.ndarray, start: int, period: int, first: int):
+    """
+    Fill out[start:] with Wilder's smoothing of values.
+
+    The first average (at index ``first + period - 1``) is the simple mean of
+    ``period`` values from ``first``; later values are (prev * (n - 1) + x) / n.
+    """
+    seed = first + period - 1
+    for i in range(start, len(values)):
+        if i < seed:
+            out[i] = np.nan
+        elif i == seed:
+            out[i] = values[first:seed + 1].mean()
+        else:
+            out[i] = (out[i - 1] * (period - 1) + values[i]) / period
+
+
+class Indicator:
+    """
+    Base class for indicators.
+
+    Subclasses declare their visible ``outputs`` and any internal ``state``
+    series, and implement ``extend``.
+    """
+
+    name = ""
+    label = ""
+    outputs: Tuple[str, ...] = ()
+    state: Tuple[str, ...] = ()
+    # Drawn over the price chart (True) or in a panel below it (False)
+    overlay = True
+
+    def __init__(self, *params):
+        self.params = tuple(params)
+
+    @property
+    def key(self) -> Tuple:
+        """Cache key: indicator name and parameters."""
+        return (self.name,) + self.params
+
+    def describe(self) -> str:
+        """Short label such as ``SMA(20)``."""
+        if not self.params:
+            return self.label
+        return f"{self.label}({','.join(f'{p:g}' for p in self.params)})"
+
+    def extend(self, bars: Bars, out: Dict[str, np.ndarray], start: int):
+        """
+        Compute outputs (and state) for bars[start:].
+
+        Values before ``start`` are already correct and may be used.
+
+        Args:
+            bars: OHLCV arrays
+            out: Output and state arrays, sized to the number of bars
+            start: First bar to compute
+        """
+        raise NotImplementedError
+
+
+class SMA(Indicator):
+    """Simple moving average of the close."""
+
+    name = "sma"
+    label = "SMA"
+    outputs = ("sma",)
+
+    def __init__(self, period: int = 20):
+        super().__init__(int(period))
+        self.period = int(period)
+
+    def extend(self, bars, out, start):
+        _rolling(bars['Close'], self.period, start, out['sma'], np.mean)
+
+
+class EMA(Indicator):
+    """Exponential moving average of the close."""
+
+    name = "ema"
+    label = "EMA"
+    outputs = ("ema",)
+
+    def __init__(self, period: int = 20):
+        super().__init__(int(period))
+        self.alpha = 2 / (int(period) + 1)
+
+    def extend(self, bars, out, start):
+        _ema(bars['Close'], out['ema'], start, self.alpha)
+
+
+class RSI(Indicator):
+    """Relative strength index with Wilder's smoothing."""
+
+    name = "rsi"
+    label = "RSI"
+    outputs = ("rsi",)
+    state = ("gain", "loss", "avg_gain", "avg_loss")
+    overlay = False
+
+    def __init__(self, period: int = 14):
+        super().__init__(int(period))
+        self.period = int(period)
+
+    def extend(self, bars, out, start):
+        close = bars['Close']
+        if start == 0:
+            change = np.diff(close, prepend=np.nan)
+        else:
+            change = np.diff(close[start - 1:])
+        out['gain'][start:] = np.where(change > 0, change, 0.0)
+        out['loss'][start:] = np.where(change < 0, -change, 0.0)
+
+        # Changes start at bar 1, so the first average lands on bar `period`
+        _wilder(out['gain'], out['avg_gain'], start, self.period, first=1)
+        _wilder(out['loss'], out['avg_loss'], start, self.period, first=1)
+
+        avg_gain = out['avg_gain'][start:]
+        avg_loss = out['avg_loss'][start:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        # No losses: 100, unless there were no gains either (a flat series: 50)
+        flat = np.where(avg_gain == 0, 50.0, 100.0)
+        out['rsi'][start:] = np.where(avg_loss == 0, np.where(np.isnan(avg_gain), np.nan, flat), rsi)
+
+
+class MACD(Indicator):
+    """Moving average convergence/divergence with signal line and histogram."""
+
+    name = "macd"
+    label = "MACD"
+    outputs = ("macd", "signal", "histogram")
+    state = ("fast", "slow")
+    overlay = False
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        super().__init__(int(fast), int(slow), int(signal))
+        self.fast = 2 / (int(fast) + 1)
+        self.slow = 2 / (int(slow) + 1)
+        self.signal = 2 / (int(signal) + 1)
+
+    def extend(self, bars, out, start):
+        close = bars['Close']
+        _ema(close, out['fast'], start, self.fast)
+        _ema(close, out['slow'], start, self.slow)
+        out['macd'][start:] = out['fast'][start:] - out['slow'][start:]
+        _ema(out['macd'], out['signal'], start, self.signal)
+        out['histogram'][start:] = out['macd'][start:] - out['signal'][start:]
+
+
+class BollingerBands(Indicator):
+    """Moving average with bands ``width`` standard deviations above and below."""
+
+    name = "bb"
+    label = "BB"
+    outputs = ("middle", "upper", "lower")
+
+    def __init__(self, period: int = 20, width: float = 2.0):
+        super().__init__(int(period), float(width))
+        self.period = int(period)
+        self.width = float(width)
+
+    def extend(self, bars, out, start):
+        close = bars['Close']
+        std = np.empty(len(close))
+        _rolling(close, self.period, start, out['middle'], np.mean)
+        _rolling(close, self.period, start, std, np.std)
+        out['upper'][start:] = out['middle'][start:] + self.width * std[start:]
+        out['lower'][start:] = out['middle'][start:] - self.width * std[start:]
+
+
+class VWAP(Indicator):
+    """
+    Volume-weighted average price.
+
+    Resets each session for intraday bars; anchored to the first loaded bar
+    for daily and longer bars.
+    """
+
+    name = "vwap"
+    label = "VWAP"
+    outputs = ("vwap",)
+    state = ("cum_pv", "cum_v")
+
+    def extend(self, bars, out, start):
+        end = len(bars['Close'])
+        if start >= end:
+            return
+        session = bars['Session']
+        typical = (bars['High'][start:] + bars['Low'][start:] + bars['Close'][start:]) / 3
+        volume = bars['Volume'][start:]
+
+        # A session boundary resets the sums; bar `start` continues the
+        # previous bar's session unless the session changed there
+        boundary = np.empty(end - start, dtype=bool)
+        boundary[0] = start == 0 or session[start] != session[start - 1]
+        boundary[1:] = session[start + 1:] != session[start:-1]
+
+        cum_pv = np.cumsum(typical * volume)
+        cum_v = np.cumsum(volume)
+        if not boundary[0]:
+            cum_pv += out['cum_pv'][start - 1]
+            cum_v += out['cum_v'][start - 1]
+
+        last_boundary = np.maximum.accumulate(np.where(boundary, np.arange(end - start), -1))
+        before = last_boundary - 1
+        has_base = last_boundary > 0
+        cum_pv -= np.where(has_base, cum_pv[np.maximum(before, 0)], 0.0)
+        cum_v -= np.where(has_base, cum_v[np.maximum(before, 0)], 0.0)
+
+        out['cum_pv'][start:] = cum_pv
+        out['cum_v'][start:] = cum_v
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out['vwap'][start:] = np.where(cum_v > 0, cum_pv / cum_v, np.nan)
+
+
+class ATR(Indicator):
+    """Average true range with Wilder's smoothing."""
+
+    name = "atr"
+    label = "ATR"
+    outputs = ("atr",)
+    state = ("true_range",)
+    overlay = False
+
+    def __init__(self, period: int = 14):
+        super().__init__(int(period))
+        self.period = int(period)
+
+    def extend(self, bars, out, start):
+        high, low, close = bars['High'], bars['Low'], bars['Close']
+        previous_close = np.concatenate(([np.nan], close[:-1]))[start:]
+        true_range = np.fmax(
+            high[start:] - low[start:],
+            np.fmax(np.abs(high[start:] - previous_close), np.abs(low[start:] - previous_close))
+        )
+        out['true_range'][start:] = true_range
+        _wilder(out['true_range'], out['atr'], start, self.period, first=0)
+
+
+INDICATORS: Dict[str, Type[Indicator]] = {
+    cls.name: cls for cls in (SMA, EMA, RSI, MACD, BollingerBands, VWAP, ATR)
+}
+
+
+def parse_indicator(spec: str) -> Indicator:
+    """
+    Create an indicator from a spec such as ``"sma:50"`` or ``"macd:12,26,9"``.
+
+    Args:
+        spec: Indicator name, optionally followed by ``:`` and comma-separated
+            parameters
+
+    Returns:
+        Indicator instance
+    """
+    name, _, params = spec.strip().lower().partition(':')
+    if name not in INDICATORS:
+        raise ValueError(f"Unknown indicator '{name}' (available: {', '.join(INDICATORS)})")
+    values = [float(p) for p in params.split(',') if p.strip()]
+    return INDICATORS[name](*values)
+
+
+class _Series:
+    """Bars of one (symbol, period, interval) and the indicator results computed on them."""
+
+    def __init__(self, bars: pd.DataFrame, interval: str):
+        self.interval = interval
+        self.index = bars.index
+        self.arrays: Bars = {}
+        self.results: Dict[Tuple, Dict[str, np.ndarray]] = {}
+        # Number of leading bars each result is valid for
+        self.valid: Dict[Tuple, int] = {}
+        self._set_bars(bars)
+
+    def _set_bars(self, bars: pd.DataFrame):
+        self.index = bars.index
+        self.arrays = {column: bars[column].to_numpy(dtype=float) for column in OHLCV_COLUMNS}
+        self.arrays['Volume'] = np.nan_to_num(self.arrays['Volume'])
+        if is_intraday(self.interval):
+            self.arrays['Session'] = bars.index.normalize().asi8
+        else:
+            self.arrays['Session'] = np.zeros(len(bars), dtype=np.int64)
+
+    def merge(self, bars: pd.DataFrame) -> int:
+        """
+        Merge freshly fetched bars into the series.
+
+        Returns:
+            Position of ``bars`` within the merged series, or -1 if the series
+            had to be rebuilt (the new bars reach further back)
+        """
+        if len(self.index) == 0 or bars.index[0] < self.index[0]:
+            self._set_bars(bars)
+            self.valid = {key: 0 for key in self.valid}
+            return 0
+
+        offset = int(self.index.searchsorted(bars.index[0]))
+        overlap = min(len(self.index) - offset, len(bars))
+        dirty = offset + overlap
+        if overlap:
+            same = self.index[offset:offset + overlap] == bars.index[:overlap]
+            for column in ('Open', 'High', 'Low', 'Close', 'Volume'):
+                old = self.arrays[column][offset:offset + overlap]
+                new = bars[column].to_numpy(dtype=float)[:overlap]
+                if column == 'Volume':
+                    new = np.nan_to_num(new)
+                same &= (old == new) | (np.isnan(old) & np.isnan(new))
+            changed = np.flatnonzero(~same)
+            if len(changed):
+                dirty = offset + int(changed[0])
+
+        if dirty == len(self.index) and offset + len(bars) == len(self.index):
+            return offset
+
+        merged = pd.concat([
+            pd.DataFrame(
+                {column: self.arrays[column][:offset] for column in OHLCV_COLUMNS},
+                index=self.index[:offset],
+            ),
+            bars[OHLCV_COLUMNS],
+        ])
+        self._set_bars(merged)
+        self.valid = {key: min(valid, dirty) for key, valid in self.valid.items()}
+        return offset
+
+    def compute(self, indicator: Indicator) -> Dict[str, np.ndarray]:
+        """Bring one indicator up to date, computing only bars it lacks."""
+        key = indicator.key
+        size = len(self.index)
+        out = self.results.get(key)
+        start = self.valid.get(key, 0)
+
+        if out is None or len(next(iter(out.values()))) != size:
+            grown = {}
+            for name in indicator.outputs + indicator.state:
+                array = np.full(size, np.nan)
+                if out is not None:
+                    keep = min(start, len(out[name]), size)
+                    array[:keep] = out[name][:keep]
+                grown[name] = array
+            out = grown
+            self.results[key] = out
+
+        if start < size:
+            indicator.extend(self.arrays, out, start)
+            self.valid[key] = size
+        return out
+
+
+class IndicatorCache:
+    """
+    Indicator results per (symbol, period, interval, indicator, params).
+
+    Results are extended incrementally when refreshed bars only add to (or
+    revise the tail of) what was computed before.
+    """
+
+    def __init__(self, max_series: int = DEFAULT_MAX_SERIES):
+        self.max_series = max_series
+        self._series: "OrderedDict[Tuple[str, str, str], _Series]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def compute(
+        self,
+        symbol: str,
+        period: str,
+        interval: str,
+        bars: pd.DataFrame,
+        indicators: List[Indicator]
+    ) -> Dict[Tuple, pd.DataFrame]:
+        """
+        Compute indicators over bars, reusing cached results.
+
+        Args:
+            symbol: Ticker symbol
+            period: Period the bars were fetched for
+            interval: Bar interval
+            bars: OHLCV frame, oldest bar first
+            indicators: Indicators to compute
+
+        Returns:
+            Dictionary mapping each indicator's key to a frame of its outputs,
+            aligned with ``bars``
+        """
+        if bars is None or bars.empty:
+            return {}
+
+        with self._lock:
+            key = (symbol, period, interval)
+            series = self._series.get(key)
+            if series is None:
+                series = _Series(bars, interval)
+                self._series[key] = series
+                offset = 0
+            else:
+                offset = series.merge(bars)
+            self._series.move_to_end(key)
+            while len(self._series) > self.max_series:
+                self._series.popitem(last=False)
+
+            results = {}
+            for indicator in indicators:
+                try:
+                    out = series.compute(indicator)
+                except Exception as e:
+                    logger.error(f"Error computing {indicator.describe()} for {symbol}: {e}")
+                    continue
+                results[indicator.key] = pd.DataFrame(
+                    {name: out[name][offset:offset + len(bars)] for name in indicator.outputs},
+                    index=bars.index,
+                )
+            return results
+
+    def invalidate(self, symbol: Optional[str] = None):
+        """Drop cached results for one symbol, or for every symbol."""
+        with self._lock:
+            if symbol is None:
+                self._series.clear()
+            else:
+                for key in [key for key in self._series if key[0] == symbol]:
+                    del self._series[key]
+
+
+# Shared cache used by the chart widgets
+indicator_cache = IndicatorCache()
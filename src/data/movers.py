@@ -0,0 +1,204 @@
+"""
+Incremental top gainers and losers.
+
+Re-sorting a whole universe on every quote is wasteful when only the top few
+symbols are shown. The engine keeps the current top K in one heap and every
+other symbol in a second heap, so a single quote update costs O(log n) and the
+ranked lists are read without sorting the universe.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+import heapq
+import itertools
+import threading
+
+from .stocks import QuoteTable
+
+# Rebuild a heap once stale entries outnumber live ones by this factor
+COMPACT_FACTOR = 2
+
+
+class TopK:
+    """
+    The k largest values among keys whose values change over time.
+
+    Stale heap entries are invalidated lazily: each key's latest entry carries a
+    version number and older entries are discarded when they reach a heap top.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        # (value, version, key): min-heap of the current top k
+        self._top: List[Tuple[float, int, str]] = []
+        # (-value, version, key): max-heap of everything else
+        self._rest: List[Tuple[float, int, str]] = []
+        self._version: Dict[str, int] = {}
+        self._in_top: Dict[str, bool] = {}
+        self._values: Dict[str, float] = {}
+        self._top_size = 0
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def update(self, key: str, value: float):
+        """Set a key's value, re-ranking it in O(log n)."""
+        if key in self._values:
+            self._discard(key)
+
+        version = next(self._counter)
+        self._version[key] = version
+        self._values[key] = value
+
+        rest_max = self._peek_rest()
+        if rest_max is not None and value < -rest_max[0]:
+            self._push_rest(value, version, key)
+        else:
+            self._push_top(value, version, key)
+        self._rebalance()
+
+    def remove(self, key: str):
+        """Forget a key."""
+        if key in self._values:
+            self._discard(key)
+            del self._values[key]
+            del self._version[key]
+            self._rebalance()
+
+    def top(self) -> List[Tuple[str, float]]:
+        """Return the top k (key, value) pairs, largest first."""
+        entries = [
+            (value, key) for value, version, key in self._top
+            if self._version.get(key) == version
+        ]
+        entries.sort(reverse=True)
+        return [(key, value) for value, key in entries]
+
+    def _discard(self, key: str):
+        """Invalidate a key's live entry (its heap entry becomes stale)."""
+        if self._in_top.pop(key):
+            self._top_size -= 1
+        self._version[key] = -1
+
+    def _push_top(self, value: float, version: int, key: str):
+        heapq.heappush(self._top, (value, version, key))
+        self._in_top[key] = True
+        self._top_size += 1
+
+    def _push_rest(self, value: float, version: int, key: str):
+        heapq.heappush(self._rest, (-value, version, key))
+        self._in_top[key] = False
+
+    def _live(self, entry: Tuple[float, int, str]) -> bool:
+        return self._version.get(entry[2]) == entry[1]
+
+    def _peek_rest(self) -> Optional[Tuple[float, int, str]]:
+        while self._rest and not self._live(self._rest[0]):
+            heapq.heappop(self._rest)
+        return self._rest[0] if self._rest else None
+
+    def _rebalance(self):
+        """Restore exactly min(k, n) live entries in the top heap."""
+        while self._top_size > self.k:
+            value, version, key = heapq.heappop(self._top)
+            if self._version.get(key) == version:
+                self._top_size -= 1
+                self._push_rest(value, version, key)
+
+        while self._top_size < self.k:
+            entry = self._peek_rest()
+            if entry is None:
+                break
+            heapq.heappop(self._rest)
+            negated, version, key = entry
+            self._push_top(-negated, version, key)
+
+        self._compact()
+
+    def _compact(self):
+        """Drop stale entries once they dominate the heaps."""
+        live = len(self._values)
+        if len(self._top) + len(self._rest) > COMPACT_FACTOR * live + 64:
+            self._top = [entry for entry in self._top if self._live(entry)]
+            self._rest = [entry for entry in self._rest if self._live(entry)]
+            heapq.heapify(self._top)
+            heapq.heapify(self._rest)
+
+
+class MoversEngine:
+    """
+    Top-K gainers and losers by percent change, maintained incrementally.
+
+    Thread-safe: quotes may be applied from a producer thread while the UI reads
+    the ranked lists.
+    """
+
+    def __init__(self, k: int = 5):
+        self.k = k
+        self._gainers = TopK(k)
+        self._losers = TopK(k)
+        self._prices: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    def update(self, symbol: str, price: float, change_percent: float):
+        """Apply one symbol's latest price and percent change."""
+        with self._lock:
+            self._prices[symbol] = price
+            self._gainers.update(symbol, change_percent)
+            self._losers.update(symbol, -change_percent)
+
+    def update_quotes(self, quotes: Iterable[Dict]):
+        """Apply quote dictionaries (with 'symbol', 'price' and 'change_percent')."""
+        for quote in quotes:
+            self.update(quote['symbol'], quote['price'], quote['change_percent'])
+
+    def update_table(self, table: QuoteTable):
+        """Apply every quote held in a QuoteTable."""
+        rows = table.valid_rows()
+        prices = table.column('price')[rows].tolist()
+        changes = table.column('change_percent')[rows].tolist()
+        with self._lock:
+            for row, price, change in zip(rows.tolist(), prices, changes):
+                symbol = table.symbols[row]
+                self._prices[symbol] = price
+                self._gainers.update(symbol, change)
+                self._losers.update(symbol, -change)
+
+    def remove(self, symbol: str):
+        """Stop ranking a symbol."""
+        with self._lock:
+            self._prices.pop(symbol, None)
+            self._gainers.remove(symbol)
+            self._losers.remove(symbol)
+
+    def gainers(self) -> List[Tuple[str, float, float]]:
+        """
+        Return the top gainers.
+
+        Returns:
+            Up to k tuples (ticker, price, change_percent) with a positive change,
+            biggest gain first
+        """
+        with self._lock:
+            return [
+                (symbol, self._prices[symbol], change)
+                for symbol, change in self._gainers.top()
+                if change > 0
+            ]
+
+    def losers(self) -> List[Tuple[str, float, float]]:
+        """
+        Return the top losers.
+
+        Returns:
+            Up to k tuples (ticker, price, change_percent) with a negative change,
+            biggest loss first
+        """
+        with self._lock:
+            return [
+                (symbol, self._prices[symbol], -change)
+                for symbol, change in self._losers.top()
+                if change > 0
+            ]
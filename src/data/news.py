@@ -5,71 +5,469 @@ DISCLAIMER: News articles are provided for informational purposes only and shoul
 be interpreted as investment recommendations. Always verify information from multiple
 sources and consult qualified financial advisors before making investment decisions.
 """
-import requests
-import feedparser
-from typing import List, Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from pathlib import Path
+from typing import Iterable, List, Dict, Optional, Set, Tuple
 from datetime import datetime
+from urllib.parse import urlsplit
+import hashlib
+import json
+import os
+import re
+import threading
+import time
 import logging
+from ..utils.config import config
+from .cache import CACHE_DIR, TTLCache, market_cache
+from .executor import YAHOO_HOST, FetchExecutor, fetch_executor, host_of
+from .feeds import FeedCache, feed_cache, feed_executor
+from .headline_sentiment import headline_scorer
+from .providers import MarketDataProvider, get_provider
+from .search import news_index
+from .singleflight import single_flight
 
 logger = logging.getLogger(__name__)
 
+SEEN_INDEX_PATH = CACHE_DIR / "news_seen.jsonl"
+DEFAULT_SEEN_CAPACITY = 20000
+
+# Article dictionaries kept for reuse across refreshes
+ARTICLE_MEMO_SIZE = 2048
+
+# Articles cached per ticker, enough for any widget limit
+TICKER_NEWS_DEPTH = 20
+
+# Articles merged (and indexed for search) per market news refresh
+MARKET_NEWS_DEPTH = 200
+
+
+def article_key(url: str = '', title: str = '') -> str:
+    """
+    Stable hash identifying an article.
+
+    URLs are compared without their query string and fragment (feeds append
+    tracking parameters), titles case- and whitespace-insensitively.
+
+    Args:
+        url: Article link
+        title: Headline, used when there is no link
+
+    Returns:
+        Hex digest prefixed with "u:" for URL keys or "t:" for title keys
+    """
+    if url:
+        parts = urlsplit(url.strip())
+        basis = 'u:' + f"{parts.netloc.lower()}{parts.path.rstrip('/')}"
+    else:
+        basis = 't:' + re.sub(r'\s+', ' ', title).strip().lower()
+    return basis[:2] + hashlib.sha1(basis.encode('utf-8')).hexdigest()[:16]
+
+
+def _feed_source(url: str) -> str:
+    """Display name for a feed's publisher."""
+    host = host_of(url)
+    return 'Yahoo Finance' if 'yahoo.com' in host else host.removeprefix('www.')
+
+
+class SeenIndex:
+    """
+    Bounded, persistent set of the article keys already shown.
+
+    Keys are held in an OrderedDict from least to most recently seen, giving
+    O(1) membership tests. Seeing a key again moves it to the end; once the
+    index is over capacity the least recently seen keys are dropped. Memory
+    therefore stays flat however many feeds are polled for however long.
+
+    New keys are appended to a JSON-lines log after each batch that adds some,
+    so headlines shown before a restart are not new again and the disk cost of
+    a batch scales with its new keys. Once the log holds twice ``capacity``
+    lines it is compacted by rewriting the current keys, in recency order.
+    Re-sightings are not logged, so after a restart a key ranks by when it was
+    last written rather than last seen.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_SEEN_CAPACITY, path: Optional[Path] = SEEN_INDEX_PATH):
+        self.capacity = capacity
+        self.path = path
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._loaded = path is None
+        # Lines in the log file, including keys evicted since it was compacted
+        self._logged = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._seen)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            self._ensure_loaded()
+            return key in self._seen
+
+    def add_many(self, keys: Iterable[str]) -> Set[str]:
+        """
+        Mark keys as seen.
+
+        Args:
+            keys: Article keys (see article_key)
+
+        Returns:
+            The keys that had not been seen before
+        """
+        with self._lock:
+            self._ensure_loaded()
+            new = []
+            for key in keys:
+                if key not in self._seen:
+                    new.append(key)
+                self._touch(key)
+            if new and self.path is not None:
+                self._save(new)
+        return set(new)
+
+    def _touch(self, key: str):
+        """Mark a key as the most recently seen, evicting the oldest past capacity (lock held)."""
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            return
+        self._seen[key] = None
+        while len(self._seen) > self.capacity:
+            self._seen.popitem(last=False)
+
+    def _save(self, new: List[str]):
+        """Append new keys to the log, compacting it when it has grown too long (lock held)."""
+        if self._logged + len(new) > 2 * self.capacity:
+            self._compact()
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a') as f:
+                f.writelines(json.dumps(key) + '\n' for key in new)
+            self._logged += len(new)
+        except Exception as e:
+            logger.error(f"Error writing seen-article index: {e}")
+
+    def _compact(self):
+        """Rewrite the log as the keys currently held (lock held)."""
+        tmp_path = self.path.with_suffix('.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                f.writelines(json.dumps(key) + '\n' for key in self._seen)
+            os.replace(tmp_path, self.path)
+            self._logged = len(self._seen)
+        except Exception as e:
+            logger.error(f"Error writing seen-article index: {e}")
+
+    def _ensure_loaded(self):
+        """Replay the saved log the first time the index is used (lock held)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r') as f:
+                lines = f.readlines()
+        except Exception as e:
+            logger.error(f"Error reading seen-article index: {e}")
+            return
+        self._logged = len(lines)
+        for line in lines:
+            try:
+                self._touch(json.loads(line))
+            except ValueError:
+                # A line cut short by a crash mid-append
+                continue
+
+
+class NewsAggregator:
+    """
+    Fetches many RSS feeds concurrently and merges them into one timeline.
+
+    Feeds run on a bounded pool (each one a conditional request through the
+    FeedCache), so a refresh takes about as long as the slowest feed rather
+    than the sum of all of them. Articles are merged newest first and
+    deduplicated by URL and by title, since the same story is syndicated
+    across ticker feeds. Feeds still outstanding when the time budget runs out
+    finish in the background and are served from the cache next time.
+    """
+
+    def __init__(
+        self,
+        provider: Optional[MarketDataProvider] = None,
+        feeds: Optional[FeedCache] = None,
+        executor: Optional[FetchExecutor] = None
+    ):
+        self._provider = provider
+        self.feeds = feeds if feeds is not None else feed_cache
+        self._executor = executor if executor is not None else feed_executor
+        # Articles built on earlier refreshes, reused instead of rebuilt
+        self._articles: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def provider(self) -> MarketDataProvider:
+        """Data provider in use (the process-wide one unless passed in)."""
+        return self._provider if self._provider is not None else get_provider()
+
+    @staticmethod
+    def feed_urls(tickers: Iterable[str] = (), market: bool = True) -> List[str]:
+        """
+        Return the configured feeds to aggregate.
+
+        Args:
+            tickers: Symbols to include a headline feed for
+            market: Include the top-stories and sector feeds
+
+        Returns:
+            Feed URLs without duplicates
+        """
+        urls = list(config.news_feeds) + list(config.news_sector_feeds) if market else []
+        urls += [config.news_ticker_feed_url.format(symbol=ticker) for ticker in tickers]
+        return list(dict.fromkeys(urls))
+
+    def aggregate(
+        self,
+        urls: List[str],
+        limit: int = 20,
+        time_budget: Optional[float] = None
+    ) -> List[Dict]:
+        """
+        Fetch feeds concurrently and merge their articles.
+
+        Args:
+            urls: Feed URLs
+            limit: Maximum number of articles to return
+            time_budget: Seconds after which the articles fetched so far are
+                returned (defaults to AppConfig.news_time_budget_seconds)
+
+        Returns:
+            Articles newest first (see merge)
+        """
+        budget = config.news_time_budget_seconds if time_budget is None else time_budget
+        deadline = time.monotonic() + budget
+
+        provider = self.provider
+        futures = {self._executor.submit(self.feeds.get, url, provider): url for url in urls}
+        pending = set(futures)
+        feeds: List[Tuple[str, List[Dict]]] = []
+
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                url = futures[future]
+                try:
+                    feeds.append((url, future.result()))
+                except Exception as e:
+                    logger.error(f"Error fetching feed {url}: {e}")
+
+        if pending:
+            logger.warning(
+                f"News aggregation hit its {budget:.0f}s budget with "
+                f"{len(pending)}/{len(urls)} feeds outstanding"
+            )
+            for future in pending:
+                future.cancel()
+
+        return self.merge(feeds, limit)
+
+    def merge(self, feeds: List[Tuple[str, List[Dict]]], limit: int) -> List[Dict]:
+        """
+        Merge feed entries into articles, newest first, without duplicates.
+
+        Args:
+            feeds: (feed URL, normalized entries) pairs
+            limit: Maximum number of articles to return
+
+        Returns:
+            Article dictionaries with 'id' (see article_key), 'title',
+            'description', 'source', 'url', 'published_at' and 'published_ts'
+        """
+        entries = [
+            (entry.get('published_ts') or 0, url, entry)
+            for url, feed in feeds
+            for entry in feed
+        ]
+        entries.sort(key=lambda item: item[0], reverse=True)
+
+        articles = []
+        seen = set()
+        for published_ts, url, entry in entries:
+            title = entry.get('title', '')
+            key = article_key(entry.get('link', ''), title)
+            title_key = article_key(title=title) if title else key
+            if key in seen or title_key in seen:
+                continue
+            seen.update((key, title_key))
+
+            with self._lock:
+                article = self._articles.get(key)
+                if article is None or article['title'] != (title or 'No title'):
+                    article = {
+                        'id': key,
+                        'title': title or 'No title',
+                        'description': entry.get('summary', ''),
+                        'source': _feed_source(url),
+                        'url': entry.get('link', ''),
+                        'published_at': datetime.fromtimestamp(published_ts).isoformat() if published_ts else entry.get('published', ''),
+                        'published_ts': published_ts or None,
+                    }
+                    self._articles[key] = article
+                    if len(self._articles) > ARTICLE_MEMO_SIZE:
+                        self._articles.popitem(last=False)
+                else:
+                    self._articles.move_to_end(key)
+
+            articles.append(article)
+            if len(articles) >= limit:
+                break
+
+        return articles
+
 
 class NewsFetcher:
     """Fetches financial news from free RSS feeds (Yahoo Finance)."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        provider: Optional[MarketDataProvider] = None,
+        feeds: Optional[FeedCache] = None,
+        cache: Optional[TTLCache] = None
+    ):
         # No API key needed for RSS feeds
         self.yahoo_rss_base = "https://finance.yahoo.com/rss/"
+        self._provider = provider
+        self.feeds = feeds if feeds is not None else feed_cache
+        self.aggregator = NewsAggregator(provider, self.feeds)
+        self.seen = seen_index
+        self.index = news_index
+        self.scorer = headline_scorer
+        self._cache = cache if cache is not None else market_cache
+        self._flight = single_flight
+
+    @property
+    def provider(self) -> MarketDataProvider:
+        """Data provider in use (the process-wide one unless passed in)."""
+        return self._provider if self._provider is not None else get_provider()
 
-    def get_market_news(self, limit: int = 10) -> List[Dict]:
+    def get_market_news(self, limit: int = 10, tickers: Optional[List[str]] = None) -> List[Dict]:
         """
-        Get general market news from Yahoo Finance RSS.
+        Get general market news from the configured RSS feeds.
+
+        Top stories, sector feeds and the headline feed of every watched ticker
+        are fetched concurrently and merged newest first.
 
         Args:
             limit: Maximum number of articles to return
+            tickers: Tickers whose headlines are included (defaults to the
+                watchlist in AppConfig.default_tickers)
 
         Returns:
             List of news articles
         """
         try:
-            # Yahoo Finance top stories RSS feed
-            feed_url = "https://finance.yahoo.com/rss/topstories"
-            feed = feedparser.parse(feed_url)
-
-            articles = []
-            for entry in feed.entries[:limit]:
-                articles.append({
-                    'title': entry.get('title', 'No title'),
-                    'description': entry.get('summary', ''),
-                    'source': 'Yahoo Finance',
-                    'url': entry.get('link', ''),
-                    'published_at': entry.get('published', ''),
-                })
-
-            return articles if articles else self._get_fallback_news(limit)
+            tickers = config.default_tickers if tickers is None else tickers
+            # Merge deeper than shown, so search covers the whole timeline
+            articles = self.aggregator.aggregate(
+                self.aggregator.feed_urls(tickers), max(limit, MARKET_NEWS_DEPTH)
+            )
+            self._ingest(articles)
+            return articles[:limit] if articles else self._get_fallback_news(limit)
         except Exception as e:
             logger.error(f"Error fetching market news: {e}")
             return self._get_fallback_news(limit)
 
-    def get_ticker_news(self, ticker: str, limit: int = 5) -> List[Dict]:
+    def get_ticker_news(self, ticker: str, limit: int = 5, refresh: bool = False) -> List[Dict]:
         """
-        Get news for a specific ticker using yfinance.
+        Get news for a specific ticker from its headline feed, or yfinance.
+
+        Results are cached per ticker for the 'news' TTL, so switching back to
+        a ticker (or one prefetched by warm_ticker_news) needs no request.
 
         Args:
             ticker: Stock ticker symbol
             limit: Maximum number of articles to return
+            refresh: Reload even if the ticker's news is cached
 
         Returns:
             List of news articles
         """
+        articles = self._cache.get_or_load(
+            ('news', ticker),
+            lambda: self._load_ticker_news(ticker),
+            self._flight,
+            refresh=refresh,
+        )
+        return articles[:limit] if articles else self._get_fallback_ticker_news(ticker, limit)
+
+    def cached_news_sentiment(self, ticker: str) -> Optional[Dict]:
+        """
+        Summarize the headline sentiment of a ticker's cached news.
+
+        Only news already fetched (by get_ticker_news or warm_ticker_news) is
+        read; this never makes a request.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Dictionary with the mean 'score' (-1 to 1), 'count', 'positive' and
+            'negative' (see HeadlineScorer.summarize), or None if no news is cached
+        """
+        articles = self._cache.get(('news', ticker))
+        return self.scorer.summarize(articles) if articles else None
+
+    def warm_ticker_news(self, tickers: List[str], refresh_within: float = 0.0) -> List[Future]:
+        """
+        Fetch news for every ticker not cached yet, in the background.
+
+        Args:
+            tickers: List of ticker symbols, e.g. the whole watchlist
+            refresh_within: Also reload tickers whose cached news expires
+                within this many seconds, so it is replaced before it expires
+
+        Returns:
+            One future per ticker being fetched
+        """
+        futures = []
+        for ticker in dict.fromkeys(tickers):
+            expires_in = self._cache.expires_in(('news', ticker))
+            if expires_in is None:
+                futures.append(feed_executor.submit(self.get_ticker_news, ticker))
+            elif expires_in <= refresh_within:
+                futures.append(feed_executor.submit(self.get_ticker_news, ticker, refresh=True))
+        return futures
+
+    def _ingest(self, articles: List[Dict]):
+        """Index new articles for search and score their headlines, as one batch each."""
+        self.index.add_many(articles)
+        self.scorer.score_many(articles)
+
+    def _load_ticker_news(self, ticker: str) -> Optional[List[Dict]]:
+        """Fetch up to TICKER_NEWS_DEPTH articles for a ticker (None if there are none)."""
         try:
-            import yfinance as yf
-            stock = yf.Ticker(ticker)
-            news = stock.news
+            urls = self.aggregator.feed_urls([ticker], market=False)
+            articles = self.aggregator.aggregate(urls, TICKER_NEWS_DEPTH)
+            if articles:
+                self._ingest(articles)
+                return articles
+        except Exception as e:
+            logger.error(f"Error fetching headline feed for {ticker}: {e}")
+
+        try:
+            news = fetch_executor.call(YAHOO_HOST, self.provider.get_news, ticker)
 
             articles = []
-            for item in news[:limit]:
+            for item in news[:TICKER_NEWS_DEPTH]:
                 articles.append({
+                    'id': article_key(item.get('link', ''), item.get('title', '')),
                     'title': item.get('title', 'No title'),
                     'description': item.get('summary', item.get('title', '')),
                     'source': item.get('publisher', 'Yahoo Finance'),
@@ -77,10 +475,36 @@ class NewsFetcher:
                     'published_at': datetime.fromtimestamp(item.get('providerPublishTime', 0)).isoformat() if item.get('providerPublishTime') else '',
                 })
 
-            return articles if articles else self._get_fallback_ticker_news(ticker, limit)
+            self._ingest(articles)
+            return articles or None
         except Exception as e:
             logger.error(f"Error fetching news for {ticker}: {e}")
-            return self._get_fallback_ticker_news(ticker, limit)
+            return None
+
+    def search(self, query: str, limit: int = 50) -> List[Dict]:
+        """
+        Search every article fetched so far.
+
+        Args:
+            query: Search text; the last word matches as a prefix
+            limit: Maximum number of results
+
+        Returns:
+            Matching articles, newest first
+        """
+        return self.index.search(query, limit)
+
+    def mark_seen(self, articles: List[Dict]) -> Set[str]:
+        """
+        Record articles as shown.
+
+        Args:
+            articles: Articles with an 'id' key
+
+        Returns:
+            IDs of the articles that had never been shown before
+        """
+        return self.seen.add_many(article['id'] for article in articles if article.get('id'))
 
     def _get_fallback_news(self, limit: int = 10) -> List[Dict]:
         """Fallback method when news fetching fails."""
@@ -105,3 +529,7 @@ class NewsFetcher:
                 'published_at': datetime.now().isoformat(),
             }
         ]
+
+
+# Articles already shown, shared by every NewsFetcher in the process
+seen_index = SeenIndex(capacity=config.news_seen_capacity)
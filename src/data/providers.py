@@ -0,0 +1,337 @@
+"""
+Pluggable market-data providers.
+
+StockDataFetcher and NewsFetcher talk to a MarketDataProvider instead of calling
+yfinance and feedparser directly. The default provider wraps yfinance; the
+recording provider saves every response to disk, and the replay provider serves
+recorded responses back deterministically (with optional injected latency) so
+performance can be measured offline.
+
+Recordings are plain JSON (DataFrames via ``to_json``), so replaying a
+recording shared by someone else cannot run code.
+"""
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol
+import hashlib
+import io
+import json
+import random
+import threading
+import time
+import logging
+
+import feedparser
+import pandas as pd
+import yfinance as yf
+
+from ..utils.config import config, AppConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RECORDINGS_DIR = Path.home() / ".finterm" / "recordings"
+
+
+class MarketDataProvider(Protocol):
+    """Source of quotes, history, company info and news."""
+
+    name: str
+
+    def get_info(self, symbol: str) -> Dict:
+        """Return the raw info payload (quote, profile and fundamentals) for a symbol."""
+        ...
+
+    def get_history(
+        self,
+        symbol: str,
+        interval: str,
+        period: Optional[str] = None,
+        start: Optional[Any] = None
+    ) -> pd.DataFrame:
+        """Return OHLCV bars for a period, or from a start time onwards."""
+        ...
+
+    def get_bars(self, symbols: List[str], period: str, interval: str) -> pd.DataFrame:
+        """Return OHLCV bars for many symbols, with (symbol, field) columns."""
+        ...
+
+    def get_news(self, symbol: str) -> List[Dict]:
+        """Return raw news items for a symbol."""
+        ...
+
+    def get_feed(self, url: str) -> List[Dict]:
+        """Return the entries of an RSS/Atom feed."""
+        ...
+
+    def fetch_feed(self, url: str, etag: Optional[str] = None, modified: Optional[str] = None) -> Dict:
+        """
+        Fetch an RSS/Atom feed conditionally.
+
+        Returns a dictionary with the HTTP 'status' (304 when the validators
+        still match, None if the request failed), the response's 'etag',
+        'modified' and 'ttl' (minutes), and the feed 'entries'.
+        """
+        ...
+
+
+class YFinanceProvider:
+    """Live data from Yahoo Finance (yfinance) and RSS feeds (feedparser)."""
+
+    name = "yfinance"
+
+    def get_info(self, symbol: str) -> Dict:
+        return yf.Ticker(symbol).info
+
+    def get_history(
+        self,
+        symbol: str,
+        interval: str,
+        period: Optional[str] = None,
+        start: Optional[Any] = None
+    ) -> pd.DataFrame:
+        stock = yf.Ticker(symbol)
+        if start is not None:
+            return stock.history(start=start, interval=interval, raise_errors=True)
+        return stock.history(period=period, interval=interval, raise_errors=True)
+
+    def get_bars(self, symbols: List[str], period: str, interval: str) -> pd.DataFrame:
+        return yf.download(
+            symbols,
+            period=period,
+            interval=interval,
+            group_by="ticker",
+            auto_adjust=False,
+            threads=True,
+            progress=False,
+        )
+
+    def get_news(self, symbol: str) -> List[Dict]:
+        return yf.Ticker(symbol).news
+
+    def get_feed(self, url: str) -> List[Dict]:
+        return [dict(entry) for entry in feedparser.parse(url).entries]
+
+    def fetch_feed(self, url: str, etag: Optional[str] = None, modified: Optional[str] = None) -> Dict:
+        parsed = feedparser.parse(url, etag=etag, modified=modified)
+        return {
+            'status': parsed.get('status'),
+            'etag': parsed.get('etag'),
+            'modified': parsed.get('modified'),
+            'ttl': parsed.feed.get('ttl'),
+            'entries': [dict(entry) for entry in parsed.entries],
+        }
+
+
+def _encode_result(result: Any) -> Dict:
+    """Make a provider result JSON-serializable, tagging DataFrames so they can be rebuilt."""
+    if not isinstance(result, pd.DataFrame):
+        return {'json': result}
+    index = result.index
+    return {
+        'frame': result.to_json(orient='split', date_format='iso', date_unit='ns'),
+        'multi_columns': isinstance(result.columns, pd.MultiIndex),
+        'column_names': list(result.columns.names),
+        'index_name': index.name,
+        'tz': str(index.tz) if isinstance(index, pd.DatetimeIndex) and index.tz is not None else None,
+        'unit': index.unit if isinstance(index, pd.DatetimeIndex) else None,
+        'dtypes': [str(dtype) for dtype in result.dtypes],
+    }
+
+
+def _decode_result(encoded: Dict) -> Any:
+    """Rebuild a result saved by _encode_result."""
+    if 'frame' not in encoded:
+        return encoded['json']
+
+    frame = pd.read_json(io.StringIO(encoded['frame']), orient='split', convert_dates=False)
+    if encoded['multi_columns']:
+        frame.columns = pd.MultiIndex.from_tuples([tuple(column) for column in frame.columns])
+    frame.columns.names = encoded['column_names']
+    if len(frame.columns):
+        frame = frame.astype(dict(zip(frame.columns, encoded['dtypes'])))
+    if isinstance(frame.index, pd.DatetimeIndex):
+        if encoded['tz'] is not None:
+            frame.index = frame.index.tz_convert(encoded['tz'])
+        if encoded['unit'] is not None:
+            frame.index = frame.index.as_unit(encoded['unit'])
+    frame.index.name = encoded['index_name']
+    return frame
+
+
+def _recording_key(method: str, args: tuple, kwargs: Dict) -> str:
+    """Stable file name for one call."""
+    call = repr((method, args, sorted(kwargs.items())))
+    return hashlib.sha1(call.encode('utf-8')).hexdigest()
+
+
+class RecordingProvider:
+    """Passes calls through to another provider and saves every response to disk."""
+
+    name = "record"
+
+    def __init__(self, delegate: MarketDataProvider, directory: Path = DEFAULT_RECORDINGS_DIR):
+        self.delegate = delegate
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+
+    def _path(self, method: str, args: tuple, kwargs: Dict) -> Path:
+        return self.directory / method / f"{_recording_key(method, args, kwargs)}.json"
+
+    def _record(self, method: str, *args, **kwargs) -> Any:
+        result = getattr(self.delegate, method)(*args, **kwargs)
+        self._save(method, args, kwargs, result)
+        return result
+
+    def _save(self, method: str, args: tuple, kwargs: Dict, result: Any):
+        subject = str(args[0]) if args else ''
+        path = self._path(method, args, kwargs)
+        try:
+            with self._lock:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, 'w') as f:
+                    # Values JSON has no type for (e.g. datetimes in info) are saved as text
+                    json.dump(
+                        {'subject': subject, 'recorded_at': time.time(), 'result': _encode_result(result)},
+                        f,
+                        default=str,
+                    )
+        except Exception as e:
+            logger.error(f"Error recording {method}({subject}): {e}")
+
+    def get_info(self, symbol: str) -> Dict:
+        return self._record('get_info', symbol)
+
+    def get_history(self, symbol, interval, period=None, start=None) -> pd.DataFrame:
+        return self._record('get_history', symbol, interval, period=period, start=start)
+
+    def get_bars(self, symbols: List[str], period: str, interval: str) -> pd.DataFrame:
+        return self._record('get_bars', list(symbols), period, interval)
+
+    def get_news(self, symbol: str) -> List[Dict]:
+        return self._record('get_news', symbol)
+
+    def get_feed(self, url: str) -> List[Dict]:
+        return self._record('get_feed', url)
+
+    def fetch_feed(self, url: str, etag: Optional[str] = None, modified: Optional[str] = None) -> Dict:
+        # Recordings are keyed by URL and hold the full feed. Requests stay
+        # conditional once a full copy is saved; until then the validators are
+        # dropped, so a 304 cannot leave the replay without the feed.
+        if not self._path('fetch_feed', (url,), {}).exists():
+            etag = modified = None
+        response = self.delegate.fetch_feed(url, etag=etag, modified=modified)
+        if response.get('status') != 304 and response.get('entries'):
+            self._save('fetch_feed', (url,), {}, response)
+        return response
+
+
+class ReplayProvider:
+    """
+    Serves responses captured by RecordingProvider, without network access.
+
+    Calls are matched on their exact arguments. Calls whose arguments vary from
+    run to run (e.g. a tail fetch from "the last stored bar") fall back to the
+    latest recording of the same method for the same symbol. Latency can be
+    injected per call, with seeded jitter so replays are repeatable.
+    """
+
+    name = "replay"
+
+    def __init__(
+        self,
+        directory: Path = DEFAULT_RECORDINGS_DIR,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int = 0
+    ):
+        self.directory = Path(directory)
+        self.latency = latency
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._by_subject: Optional[Dict[tuple, Path]] = None
+
+    def _index(self) -> Dict[tuple, Path]:
+        """Map (method, subject) to its most recent recording."""
+        if self._by_subject is None:
+            latest: Dict[tuple, tuple] = {}
+            for path in self.directory.glob("*/*.json"):
+                try:
+                    with open(path, 'r') as f:
+                        entry = json.load(f)
+                except Exception as e:
+                    logger.error(f"Skipping unreadable recording {path.name}: {e}")
+                    continue
+                key = (path.parent.name, entry['subject'])
+                if key not in latest or entry['recorded_at'] > latest[key][0]:
+                    latest[key] = (entry['recorded_at'], path)
+            self._by_subject = {key: path for key, (_, path) in latest.items()}
+        return self._by_subject
+
+    def _replay(self, method: str, *args, **kwargs) -> Any:
+        path = self.directory / method / f"{_recording_key(method, args, kwargs)}.json"
+        if not path.exists():
+            subject = str(args[0]) if args else ''
+            with self._lock:
+                path = self._index().get((method, subject))
+            if path is None:
+                raise LookupError(f"No recording for {method}({subject})")
+
+        if self.latency or self.jitter:
+            with self._lock:
+                delay = self.latency + self._random.uniform(0, self.jitter)
+            time.sleep(delay)
+
+        with open(path, 'r') as f:
+            return _decode_result(json.load(f)['result'])
+
+    def get_info(self, symbol: str) -> Dict:
+        return self._replay('get_info', symbol)
+
+    def get_history(self, symbol, interval, period=None, start=None) -> pd.DataFrame:
+        return self._replay('get_history', symbol, interval, period=period, start=start)
+
+    def get_bars(self, symbols: List[str], period: str, interval: str) -> pd.DataFrame:
+        return self._replay('get_bars', list(symbols), period, interval)
+
+    def get_news(self, symbol: str) -> List[Dict]:
+        return self._replay('get_news', symbol)
+
+    def get_feed(self, url: str) -> List[Dict]:
+        return self._replay('get_feed', url)
+
+    def fetch_feed(self, url: str, etag: Optional[str] = None, modified: Optional[str] = None) -> Dict:
+        return self._replay('fetch_feed', url)
+
+
+def create_provider(app_config: AppConfig) -> MarketDataProvider:
+    """Create the provider selected by AppConfig.data_provider."""
+    directory = Path(app_config.recordings_dir or DEFAULT_RECORDINGS_DIR).expanduser()
+
+    if app_config.data_provider == "record":
+        return RecordingProvider(YFinanceProvider(), directory)
+    if app_config.data_provider == "replay":
+        return ReplayProvider(
+            directory,
+            latency=app_config.replay_latency_ms / 1000,
+            jitter=app_config.replay_jitter_ms / 1000,
+        )
+    if app_config.data_provider != "yfinance":
+        logger.warning(f"Unknown data provider '{app_config.data_provider}', using yfinance")
+    return YFinanceProvider()
+
+
+_provider: Optional[MarketDataProvider] = None
+
+
+def get_provider() -> MarketDataProvider:
+    """Return the process-wide provider, creating it from config on first use."""
+    global _provider
+    if _provider is None:
+        _provider = create_provider(config)
+    return _provider
+
+
+def set_provider(provider: MarketDataProvider):
+    """Replace the process-wide provider (for benchmarks and tests)."""
+    global _provider
+    _provider = provider
@@ -0,0 +1,244 @@
+"""
+Push-based quote distribution.
+
+Widgets subscribe to the symbols they display instead of each pulling quotes on
+their own. A single producer (the polling loop below, a streaming source, or a
+fake producer in tests) publishes quote updates to the bus, which coalesces
+bursts and fans each batch out to the interested subscribers.
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Set
+import threading
+import logging
+
+from ..utils.config import config
+from .stocks import StockDataFetcher
+
+logger = logging.getLogger(__name__)
+
+# Updates arriving within this window are delivered as one batch
+DEFAULT_COALESCE_SECONDS = 0.25
+
+# Receives {symbol: quote} for the subscribed symbols that changed
+QuoteCallback = Callable[[Dict[str, Dict]], None]
+
+
+class Subscription:
+    """A subscriber's interest in a set of symbols."""
+
+    def __init__(self, bus: "QuoteBus", symbols: Iterable[str], callback: QuoteCallback):
+        self._bus = bus
+        self.symbols: Set[str] = set(symbols)
+        self.callback = callback
+
+    def update_symbols(self, symbols: Iterable[str]):
+        """Replace the subscribed symbols, e.g. when a widget switches ticker."""
+        self._bus._resubscribe(self, symbols)
+
+    def close(self):
+        """Stop receiving updates."""
+        self._bus.unsubscribe(self)
+
+
+class QuoteBus:
+    """Thread-safe publish/subscribe hub for quotes, keyed by symbol."""
+
+    def __init__(self, coalesce_seconds: float = DEFAULT_COALESCE_SECONDS):
+        self.coalesce_seconds = coalesce_seconds
+        self._subscriptions: List[Subscription] = []
+        self._latest: Dict[str, Dict] = {}
+        self._pending: Dict[str, Dict] = {}
+        # Last values owed to new subscribers, delivered with the next flush
+        self._replays: Dict[Subscription, Dict[str, Dict]] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._interest_listeners: List[Callable[[Set[str]], None]] = []
+
+    def subscribe(self, symbols: Iterable[str], callback: QuoteCallback) -> Subscription:
+        """
+        Subscribe to quote updates for symbols.
+
+        The callback runs on the bus's delivery thread, never on the caller's. The
+        latest known quotes for the symbols are delivered right away.
+
+        Args:
+            symbols: Ticker symbols of interest
+            callback: Called with {symbol: quote} for each coalesced batch
+
+        Returns:
+            Subscription handle
+        """
+        subscription = Subscription(self, symbols, callback)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        self._on_interest(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Remove a subscription."""
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            self._replays.pop(subscription, None)
+            listeners = list(self._interest_listeners)
+        # Producers may stop streaming symbols nobody watches any more
+        self._notify_listeners(listeners, set())
+
+    def _resubscribe(self, subscription: Subscription, symbols: Iterable[str]):
+        with self._lock:
+            subscription.symbols = set(symbols)
+        self._on_interest(subscription)
+
+    def _on_interest(self, subscription: Subscription):
+        """Replay cached quotes to a (re)subscriber and tell producers the symbols changed."""
+        with self._lock:
+            replay = {
+                symbol: self._latest[symbol]
+                for symbol in subscription.symbols
+                if symbol in self._latest
+            }
+            if replay:
+                self._replays[subscription] = replay
+                self._schedule_flush()
+            listeners = list(self._interest_listeners)
+        self._notify_listeners(listeners, set(subscription.symbols))
+
+    @staticmethod
+    def _notify_listeners(listeners: List[Callable[[Set[str]], None]], symbols: Set[str]):
+        for listener in listeners:
+            try:
+                listener(symbols)
+            except Exception as e:
+                logger.error(f"Error notifying quote producer of changed symbols: {e}")
+
+    def add_interest_listener(self, listener: Callable[[Set[str]], None]):
+        """
+        Register a producer hook called whenever the watched symbols change.
+
+        It receives the symbols of the new or changed subscription (empty when
+        one is removed); bus.symbols() gives the full watched set.
+        """
+        with self._lock:
+            self._interest_listeners.append(listener)
+
+    def symbols(self) -> Set[str]:
+        """Return every symbol at least one subscriber is interested in."""
+        with self._lock:
+            return set().union(*(s.symbols for s in self._subscriptions))
+
+    def latest(self, symbol: str) -> Optional[Dict]:
+        """Return the most recent quote published for a symbol."""
+        with self._lock:
+            return self._latest.get(symbol)
+
+    def publish(self, quote: Dict):
+        """Publish one quote update (must contain a 'symbol' key)."""
+        self.publish_many([quote])
+
+    def publish_many(self, quotes: Iterable[Dict]):
+        """Publish several quote updates; bursts are coalesced per symbol."""
+        with self._lock:
+            for quote in quotes:
+                symbol = quote['symbol']
+                self._latest[symbol] = quote
+                self._pending[symbol] = quote
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        """Start the coalescing timer if it is not already running (lock held)."""
+        if self._timer is None:
+            self._timer = threading.Timer(self.coalesce_seconds, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Deliver all pending updates to their subscribers now."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending, self._pending = self._pending, {}
+            replays, self._replays = self._replays, {}
+            deliveries = []
+            for subscription in self._subscriptions:
+                batch = dict(replays.get(subscription, {}))
+                batch.update(
+                    (symbol, quote) for symbol, quote in pending.items()
+                    if symbol in subscription.symbols
+                )
+                if batch:
+                    deliveries.append((subscription.callback, batch))
+
+        for callback, batch in deliveries:
+            try:
+                callback(batch)
+            except Exception as e:
+                logger.error(f"Error delivering quote update: {e}")
+
+
+class PollingQuoteProducer:
+    """
+    Publishes quotes for every subscribed symbol by polling in one background thread.
+
+    One bulk request per cycle serves all subscribers, so every widget showing a
+    symbol updates at the same moment.
+    """
+
+    def __init__(
+        self,
+        bus: QuoteBus,
+        fetcher: Optional[StockDataFetcher] = None,
+        interval: Optional[float] = None
+    ):
+        self.bus = bus
+        self.fetcher = fetcher or StockDataFetcher()
+        self.interval = interval if interval is not None else config.refresh_interval
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        bus.add_interest_listener(lambda symbols: self.request_refresh())
+
+    def start(self):
+        """Start polling in a daemon thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive() and not self._stop.is_set():
+            return
+        # A fresh stop event, so a previous thread that is still winding down
+        # exits on its own event and cannot swallow this restart
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(self._stop,),
+            name="finterm-quote-poller",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop polling."""
+        self._stop.set()
+        self._wake.set()
+
+    def request_refresh(self):
+        """Poll as soon as possible instead of waiting for the next cycle."""
+        self._wake.set()
+
+    def poll_once(self):
+        """Fetch quotes for all subscribed symbols and publish them."""
+        symbols = sorted(self.bus.symbols())
+        if not symbols:
+            return
+        quotes = self.fetcher.get_quotes(symbols)
+        if quotes:
+            self.bus.publish_many(quotes.values())
+
+    def _run(self, stop: threading.Event):
+        while not stop.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.error(f"Error polling quotes: {e}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+
+# Shared bus; the producer feeding it is chosen in streaming.create_quote_producer
+quote_bus = QuoteBus()
@@ -0,0 +1,200 @@
+"""
+Whole-universe market scans.
+
+Ranks an index universe (e.g. the Nasdaq-100, or an S&P 500 / Russell 2000
+constituents file supplied by the user) rather than just the watchlist. Quotes
+are fetched in chunked bulk requests on the scan executor; each finished
+chunk updates a QuoteTable, from which gainers, losers and most-active symbols
+are ranked with vectorized partial sorts. Partial results are reported as
+chunks arrive, and the scan stops when its time budget runs out.
+"""
+from concurrent.futures import FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import time
+import logging
+
+import pandas as pd
+
+from .executor import DeadlineExceeded, FetchExecutor
+from .stocks import QUOTE_CHUNK_SIZE, QuoteTable, StockDataFetcher
+from ..utils.config import config
+
+logger = logging.getLogger(__name__)
+
+# Constituents files shipped with FinTerm, selectable by name
+UNIVERSES_DIR = Path(__file__).parent / "universes"
+
+DEFAULT_SCAN_BUDGET_SECONDS = 30.0
+DEFAULT_SCAN_TOP = 5
+
+# Column names recognised as the symbol column of a constituents CSV
+SYMBOL_COLUMNS = ('symbol', 'ticker', 'code')
+
+# Receives partial scan results as chunks arrive
+ScanCallback = Callable[[Dict], None]
+
+
+def available_universes() -> List[str]:
+    """Return the names of the bundled universes."""
+    return sorted(path.stem for path in UNIVERSES_DIR.glob("*.csv"))
+
+
+def load_universe(name_or_path: str) -> List[str]:
+    """
+    Load the symbols of an index universe.
+
+    Args:
+        name_or_path: Name of a bundled universe (e.g. "nasdaq100") or the path
+            of a constituents CSV with a Symbol/Ticker column
+
+    Returns:
+        Yahoo ticker symbols in file order, without duplicates
+    """
+    path = Path(name_or_path).expanduser()
+    if not path.exists():
+        path = UNIVERSES_DIR / f"{name_or_path.lower()}.csv"
+    if not path.exists():
+        raise FileNotFoundError(
+            f"Unknown universe '{name_or_path}' "
+            f"(bundled: {', '.join(available_universes())})"
+        )
+
+    frame = pd.read_csv(path, dtype=str)
+    columns = {column.strip().lower(): column for column in frame.columns}
+    column = next((columns[name] for name in SYMBOL_COLUMNS if name in columns), frame.columns[0])
+
+    symbols = frame[column].dropna().str.strip().str.upper()
+    # Share classes are written BRK.B in index files but BRK-B on Yahoo
+    symbols = symbols[symbols != ''].str.replace('.', '-', regex=False)
+    return list(dict.fromkeys(symbols))
+
+
+def rank_quotes(table: QuoteTable, top: int = DEFAULT_SCAN_TOP) -> Dict[str, List[Tuple[str, float, float, int]]]:
+    """
+    Rank a QuoteTable into gainers, losers and most active.
+
+    Args:
+        table: Quotes to rank
+        top: Number of symbols per list
+
+    Returns:
+        Dictionary with 'gainers', 'losers' and 'most_active' lists of
+        (ticker, price, change_percent, volume) tuples
+    """
+    price = table.column('price')
+    change_percent = table.column('change_percent')
+    volume = table.column('volume')
+
+    def rows(symbols: List[str]) -> List[Tuple[str, float, float, int]]:
+        return [
+            (symbol, float(price[row]), float(change_percent[row]), int(volume[row]))
+            for symbol, row in ((symbol, table.row(symbol)) for symbol in symbols)
+        ]
+
+    gainers = [m for m in rows(table.top_k(top, 'change_percent')) if m[2] > 0]
+    losers = [m for m in rows(table.top_k(top, 'change_percent', largest=False)) if m[2] < 0]
+    return {
+        'gainers': gainers,
+        'losers': losers,
+        'most_active': rows(table.top_k(top, 'volume')),
+    }
+
+
+class MarketScanner:
+    """Scans a universe of symbols for gainers, losers and most-active names."""
+
+    def __init__(
+        self,
+        fetcher: Optional[StockDataFetcher] = None,
+        executor: Optional[FetchExecutor] = None
+    ):
+        self._executor = executor if executor is not None else scan_executor
+        self.fetcher = fetcher or StockDataFetcher(executor=self._executor)
+
+    def scan(
+        self,
+        symbols: List[str],
+        top: int = DEFAULT_SCAN_TOP,
+        time_budget: float = DEFAULT_SCAN_BUDGET_SECONDS,
+        chunk_size: int = QUOTE_CHUNK_SIZE,
+        on_progress: Optional[ScanCallback] = None
+    ) -> Dict:
+        """
+        Fetch quotes for a universe and rank them.
+
+        Chunks are fetched concurrently on the scanner's rate-limited executor.
+        Chunks that have not finished when the time budget runs out are
+        abandoned and the result is marked incomplete; chunks still waiting
+        for the rate limiter then give up without being charged, so an
+        overrun scan leaves no debt behind.
+
+        Args:
+            symbols: Universe to scan
+            top: Number of symbols per ranked list
+            time_budget: Seconds after which the scan returns what it has
+            chunk_size: Symbols per bulk request
+            on_progress: Called with the partial result after each chunk
+
+        Returns:
+            Dictionary with 'gainers', 'losers' and 'most_active' lists, plus
+            'scanned' (symbols with quotes), 'total', 'complete' and 'elapsed'
+        """
+        started = time.monotonic()
+        deadline = started + time_budget
+        table = QuoteTable(capacity=len(symbols))
+
+        chunks = [symbols[start:start + chunk_size] for start in range(0, len(symbols), chunk_size)]
+        pending = {
+            self._executor.submit(self.fetcher.get_quotes, chunk, deadline=deadline)
+            for chunk in chunks
+        }
+
+        def result(complete: bool) -> Dict:
+            ranked = rank_quotes(table, top)
+            ranked.update({
+                'scanned': len(table),
+                'total': len(symbols),
+                'complete': complete,
+                'elapsed': time.monotonic() - started,
+            })
+            return ranked
+
+        # Chunks that could not be requested before the deadline
+        skipped = 0
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    table.update_many(future.result().values())
+                except DeadlineExceeded:
+                    skipped += 1
+                except Exception as e:
+                    logger.error(f"Error scanning chunk: {e}")
+            if done and pending and on_progress is not None:
+                on_progress(result(complete=False))
+
+        if pending or skipped:
+            logger.warning(
+                f"Market scan hit its {time_budget:.0f}s budget with "
+                f"{len(pending) + skipped}/{len(chunks)} chunks not fetched"
+            )
+            for future in pending:
+                future.cancel()
+
+        return result(complete=not pending and not skipped)
+
+
+# Scans get their own pool and rate limits: a scan charges one token per
+# symbol, and on the shared executor it would queue chart, ticker-info and
+# quote requests behind it
+scan_executor = FetchExecutor(
+    max_workers=config.scan_workers,
+    rate_per_second=config.scan_rate_per_second,
+    burst=config.rate_limit_burst,
+    max_retries=config.fetch_max_retries,
+    backoff_seconds=config.fetch_backoff_seconds,
+)
@@ -0,0 +1,196 @@
+"""
+Full-text search over ingested news articles.
+
+NewsFetcher adds every article it fetches to an in-memory inverted index
+(stemmed token -> article IDs). Articles are tokenized once, when first seen,
+so keeping the index current costs only the new headlines. A query intersects
+the posting sets of its terms, smallest first, and treats the last term as a
+prefix so results can update as the user types.
+"""
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Set, Tuple
+import heapq
+import itertools
+import re
+import threading
+
+DEFAULT_INDEX_CAPACITY = 50000
+
+# Prefixes shorter than this match whole tokens only (one letter matches too much)
+MIN_PREFIX_LENGTH = 2
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[.&'][a-z0-9]+)*")
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in into is it its of on or that the
+this to was were will with
+""".split())
+
+
+def stem(token: str) -> str:
+    """
+    Reduce a token to a crude stem so inflections match.
+
+    Strips common English suffixes (plurals, -ing, -ed, -ly) and a final "e",
+    so "rallies", "rallied" and "rallying" all become "rally", and "hike",
+    "hikes" and "hiked" all become "hik". Short tokens such as tickers are
+    left alone.
+    """
+    if len(token) <= 3 or not token.isalpha():
+        return token
+    if token.endswith(("ies", "ied")) and len(token) > 4:
+        return token[:-3] + "y"
+    for suffix in ("ing", "ed"):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            # Undouble a final consonant: "stopped" -> "stop"
+            if len(token) > 3 and token[-1] == token[-2] and token[-1] not in "lsz":
+                token = token[:-1]
+            break
+    else:
+        if token.endswith("ly") and len(token) > 5:
+            token = token[:-2]
+        elif token.endswith("es") and token[-3] in "sxz":
+            token = token[:-2]
+        elif token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+    if token.endswith("e") and len(token) >= 4:
+        token = token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase, stemmed tokens, without stopwords."""
+    return [
+        stem(token) for token in _TOKEN_RE.findall(text.lower())
+        if token not in STOPWORDS
+    ]
+
+
+class NewsIndex:
+    """
+    Inverted index over articles, updated incrementally.
+
+    Articles get small integer document numbers, so posting sets hold ints and
+    ranking reads publish times with C-level lookups. The index holds at most
+    ``capacity`` articles; the oldest ingested are dropped (and removed from
+    their posting sets) once it is full.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_INDEX_CAPACITY):
+        self.capacity = capacity
+        # Article ID -> document number, in ingest order
+        self._docs: "OrderedDict[str, int]" = OrderedDict()
+        self._articles: Dict[int, Dict] = {}
+        self._published: Dict[int, float] = {}
+        self._tokens: Dict[int, Tuple[str, ...]] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        # Sorted vocabulary, for prefix lookups
+        self._vocabulary: List[str] = []
+        self._next_doc = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add_many(self, articles: Iterable[Dict]) -> int:
+        """
+        Index articles not indexed yet.
+
+        Args:
+            articles: Articles with 'id', 'title', 'description' and
+                'published_ts' keys
+
+        Returns:
+            Number of articles added
+        """
+        added = 0
+        with self._lock:
+            for article in articles:
+                article_id = article.get('id')
+                if not article_id or article_id in self._docs:
+                    continue
+                doc = next(self._next_doc)
+                tokens = tuple(set(tokenize(
+                    f"{article.get('title', '')} {article.get('description', '')}"
+                )))
+                self._docs[article_id] = doc
+                self._articles[doc] = article
+                self._published[doc] = article.get('published_ts') or 0
+                self._tokens[doc] = tokens
+                for token in tokens:
+                    postings = self._postings.get(token)
+                    if postings is None:
+                        postings = self._postings[token] = set()
+                        insort(self._vocabulary, token)
+                    postings.add(doc)
+                added += 1
+
+            while len(self._docs) > self.capacity:
+                self._remove(self._docs.popitem(last=False)[1])
+        return added
+
+    def search(self, query: str, limit: int = 50) -> List[Dict]:
+        """
+        Find articles containing every term of a query.
+
+        The last term also matches as a prefix ("fed" finds "federal"), unless
+        the query ends with a space.
+
+        Args:
+            query: Search text
+            limit: Maximum number of results
+
+        Returns:
+            Matching articles, newest first
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+        prefix = None
+        if not query[-1:].isspace():
+            words = _TOKEN_RE.findall(query.lower())
+            if words and words[-1] not in STOPWORDS and len(words[-1]) >= MIN_PREFIX_LENGTH:
+                prefix = words[-1]
+                terms = terms[:-1]
+
+        with self._lock:
+            candidates = sorted((self._postings.get(term, set()) for term in terms), key=len)
+            matches = candidates[0].intersection(*candidates[1:]) if candidates else None
+
+            if prefix is not None:
+                expansions = self._prefix_postings(prefix)
+                if matches is None:
+                    matches = set().union(*expansions)
+                else:
+                    # Intersecting each expansion costs at most the smaller side
+                    matches = set().union(*(matches & postings for postings in expansions))
+
+            newest = heapq.nlargest(limit, matches, key=self._published.__getitem__)
+            return [self._articles[doc] for doc in newest]
+
+    def _prefix_postings(self, prefix: str) -> List[Set[int]]:
+        """Posting sets of every token starting with prefix (or its stem)."""
+        tokens = set()
+        for start in {prefix, stem(prefix)}:
+            position = bisect_left(self._vocabulary, start)
+            while position < len(self._vocabulary) and self._vocabulary[position].startswith(start):
+                tokens.add(self._vocabulary[position])
+                position += 1
+        return [self._postings[token] for token in tokens]
+
+    def _remove(self, doc: int):
+        """Drop one document and its postings (lock held)."""
+        del self._articles[doc]
+        del self._published[doc]
+        for token in self._tokens.pop(doc):
+            postings = self._postings[token]
+            postings.discard(doc)
+            if not postings:
+                del self._postings[token]
+                del self._vocabulary[bisect_left(self._vocabulary, token)]
+
+
+# Index of every article fetched in this process
+news_index = NewsIndex()
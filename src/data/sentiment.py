@@ -6,22 +6,134 @@ NOT be interpreted as investment advice or trading signals. Sentiment scores are
 on algorithmic analysis and may not reflect actual market conditions. Always conduct
 your own analysis and consult qualified financial advisors before making investment decisions.
 """
-from typing import Dict, List
+from collections import deque
+from datetime import date, datetime
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+import heapq
 import logging
-from .stocks import StockDataFetcher
+import numpy as np
+import pandas as pd
+from .news import NewsFetcher
+from .stocks import StockDataFetcher, QuoteTable
+from ..utils.config import config
 
 logger = logging.getLogger(__name__)
 
+# Daily bars in the sentiment window (matches the 5-day history period)
+SENTIMENT_WINDOW = 5
+
+# Trading days roll over in exchange time
+MARKET_TZ = ZoneInfo("America/New_York")
+
+
+def classify_change(price_change: float) -> Tuple[str, float]:
+    """
+    Map a window price change (in percent) to a sentiment label and score.
+
+    Args:
+        price_change: Percent change over the sentiment window
+
+    Returns:
+        Tuple of (label, score from 0 to 100)
+    """
+    if price_change > 2:
+        return "Bullish", min(100, 50 + price_change * 5)
+    elif price_change > 0.5:
+        return "Slightly Bullish", 50 + price_change * 5
+    elif price_change < -2:
+        return "Bearish", max(0, 50 + price_change * 5)
+    elif price_change < -0.5:
+        return "Slightly Bearish", 50 + price_change * 5
+    return "Neutral", 50
+
+
+def label_for_score(score: float) -> str:
+    """Return the sentiment label of a 0-100 score, with the thresholds of classify_change."""
+    if score > 60:
+        return "Bullish"
+    elif score > 52.5:
+        return "Slightly Bullish"
+    elif score < 40:
+        return "Bearish"
+    elif score < 47.5:
+        return "Slightly Bearish"
+    return "Neutral"
+
+
+def blend_news_score(price_score: float, news_score: float, weight: float) -> float:
+    """
+    Blend a price-based score with headline sentiment.
+
+    Args:
+        price_score: Score from 0 to 100 (see classify_change)
+        news_score: Mean headline sentiment from -1 to 1
+        weight: Share of the result taken from the headlines, 0 to 1
+
+    Returns:
+        Blended score from 0 to 100
+    """
+    weight = min(max(weight, 0.0), 1.0)
+    return (1 - weight) * price_score + weight * (50 + 50 * news_score)
+
+
+def apply_news(sentiment: Dict, news: Optional[Dict], weight: float) -> Dict:
+    """
+    Blend headline sentiment into a ticker's price-based sentiment, in place.
+
+    Args:
+        sentiment: Ticker sentiment dictionary with 'sentiment' and 'score'
+        news: Headline summary with 'score' and 'count' (see
+            HeadlineScorer.summarize), or None when the ticker has no news
+        weight: Share of the score taken from the headlines, 0 to 1
+
+    Returns:
+        The same dictionary, with 'news_score' and 'news_count' set
+    """
+    sentiment['news_score'] = news['score'] if news else None
+    sentiment['news_count'] = news['count'] if news else 0
+    if news and weight > 0:
+        sentiment['score'] = blend_news_score(sentiment['score'], news['score'], weight)
+        sentiment['sentiment'] = label_for_score(sentiment['score'])
+    return sentiment
+
+
+def neutral_sentiment(ticker: str) -> Dict:
+    """Return the sentiment of a ticker without enough price data."""
+    return {
+        'ticker': ticker,
+        'sentiment': 'Neutral',
+        'score': 50,
+        'price_change_5d': 0,
+        'volume_ratio': 1,
+        'trend': 'stable',
+        'news_score': None,
+        'news_count': 0,
+    }
+
+
+def overall_sentiment(bullish_count: int, bearish_count: int) -> str:
+    """Return the overall market label from bullish and bearish ticker counts."""
+    if bullish_count > bearish_count * 1.5:
+        return "Bullish"
+    elif bearish_count > bullish_count * 1.5:
+        return "Bearish"
+    return "Neutral"
+
 
 class SentimentAnalyzer:
-    """Analyzes market sentiment based on price action and volume."""
+    """Analyzes market sentiment based on price action, volume and news headlines."""
 
     def __init__(self):
         self.stock_fetcher = StockDataFetcher()
+        self.news_fetcher = NewsFetcher()
 
     def analyze_ticker_sentiment(self, ticker: str) -> Dict:
         """
-        Analyze sentiment for a specific ticker based on price action.
+        Analyze sentiment for a specific ticker based on price action and news.
+
+        The 5-day price score is blended with the mean sentiment of the
+        ticker's cached headlines, weighted by AppConfig.sentiment_news_weight.
 
         Args:
             ticker: Stock ticker symbol
@@ -45,87 +157,458 @@ class SentimentAnalyzer:
             volume_ratio = recent_volume / avg_volume if avg_volume > 0 else 1
 
             # Determine sentiment
-            if price_change > 2:
-                sentiment = "Bullish"
-                score = min(100, 50 + price_change * 5)
-            elif price_change > 0.5:
-                sentiment = "Slightly Bullish"
-                score = 50 + price_change * 5
-            elif price_change < -2:
-                sentiment = "Bearish"
-                score = max(0, 50 + price_change * 5)
-            elif price_change < -0.5:
-                sentiment = "Slightly Bearish"
-                score = 50 + price_change * 5
-            else:
-                sentiment = "Neutral"
-                score = 50
-
-            return {
+            sentiment, score = classify_change(price_change)
+
+            return apply_news({
                 'ticker': ticker,
                 'sentiment': sentiment,
                 'score': score,
                 'price_change_5d': price_change,
                 'volume_ratio': volume_ratio,
                 'trend': 'increasing' if price_change > 0 else 'decreasing',
-            }
+            }, self._news_sentiment(ticker), config.sentiment_news_weight)
 
         except Exception as e:
             logger.error(f"Error analyzing sentiment for {ticker}: {e}")
             return self._get_neutral_sentiment(ticker)
 
-    def analyze_market_sentiment(self, tickers: List[str]) -> Dict:
+    def analyze_batch(self, tickers: List[str]) -> List[Dict]:
         """
-        Analyze overall market sentiment based on major indices.
+        Analyze sentiment for many tickers at once.
+
+        History for every ticker is fetched in one multi-symbol request (per
+        chunk of 100) and the scores are computed for all tickers together with
+        NumPy, giving the same results as analyze_ticker_sentiment (including
+        its blend of cached headline sentiment).
 
         Args:
-            tickers: List of ticker symbols to analyze
+            tickers: List of ticker symbols
 
         Returns:
-            Dictionary with market sentiment
+            List of sentiment dictionaries, in input order
         """
+        tickers = list(dict.fromkeys(tickers))
+        return self._sentiments_from_arrays(tickers, self._score_batch(tickers))
+
+    def _sentiments_from_arrays(self, tickers: List[str], arrays: Dict[str, np.ndarray]) -> List[Dict]:
+        """Convert batch scores into one sentiment dictionary per ticker, blended with cached news."""
         sentiments = []
-        bullish_count = 0
-        bearish_count = 0
-        total_change = 0
+        for i, ticker in enumerate(tickers):
+            if not arrays['valid'][i]:
+                sentiments.append(self._get_neutral_sentiment(ticker))
+                continue
+            price_change = float(arrays['price_change'][i])
+            sentiments.append(apply_news({
+                'ticker': ticker,
+                'sentiment': str(arrays['label'][i]),
+                'score': float(arrays['score'][i]),
+                'price_change_5d': price_change,
+                'volume_ratio': float(arrays['volume_ratio'][i]),
+                'trend': 'increasing' if price_change > 0 else 'decreasing',
+            }, self._news_sentiment(ticker), config.sentiment_news_weight))
+        return sentiments
 
-        for ticker in tickers:
-            sentiment = self.analyze_ticker_sentiment(ticker)
-            sentiments.append(sentiment)
+    def _score_batch(self, tickers: List[str]) -> Dict[str, np.ndarray]:
+        """Compute 5-day price change, volume ratio, score, label and today's change per ticker."""
+        n = len(tickers)
+        close = np.full((1, n), np.nan)
+        volume = np.full((1, n), np.nan)
+        open_ = np.full((1, n), np.nan)
 
-            if 'Bullish' in sentiment['sentiment']:
-                bullish_count += 1
-            elif 'Bearish' in sentiment['sentiment']:
-                bearish_count += 1
+        try:
+            bars = self.stock_fetcher.get_bars(tickers, period="5d", interval="1d")
+            if not bars.empty:
+                close = bars.xs('Close', axis=1, level=1).reindex(columns=tickers).to_numpy(dtype=float)
+                volume = bars.xs('Volume', axis=1, level=1).reindex(columns=tickers).to_numpy(dtype=float)
+                open_ = bars.xs('Open', axis=1, level=1).reindex(columns=tickers).to_numpy(dtype=float)
+        except Exception as e:
+            logger.error(f"Error fetching bars for sentiment of {n} tickers: {e}")
 
-            total_change += sentiment['price_change_5d']
+        # Bars are aligned on a shared index, so a ticker may have gaps
+        has_close = ~np.isnan(close)
+        days = has_close.sum(axis=0)
+        columns = np.arange(n)
+        first = close[has_close.argmax(axis=0), columns]
+        last_row = len(close) - 1 - has_close[::-1].argmax(axis=0)
+        last = close[last_row, columns]
+        # Previous close, or today's open for a ticker with a single bar (as in
+        # StockDataFetcher quotes), so breadth needs no second download
+        previous_row = len(close) - 1 - (np.cumsum(has_close[::-1], axis=0) >= 2).argmax(axis=0)
+        previous = np.where(days >= 2, close[previous_row, columns], open_[last_row, columns])
 
-        avg_change = total_change / len(tickers) if tickers else 0
+        valid = (days >= 2) & (first > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_change = np.where(valid, (last - first) / first * 100, 0.0)
 
-        # Determine overall market sentiment
-        if bullish_count > bearish_count * 1.5:
-            overall = "Bullish"
-        elif bearish_count > bullish_count * 1.5:
-            overall = "Bearish"
-        else:
-            overall = "Neutral"
+            volumes = np.where(has_close, np.nan_to_num(volume), 0.0)
+            avg_volume = volumes.sum(axis=0) / np.maximum(days, 1)
+            recent_volume = volumes[last_row, columns]
+            volume_ratio = np.where(avg_volume > 0, recent_volume / avg_volume, 1.0)
+            day_change = np.where(previous > 0, (last - previous) / previous * 100, 0.0)
+
+        label = np.select(
+            [price_change > 2, price_change > 0.5, price_change < -2, price_change < -0.5],
+            ["Bullish", "Slightly Bullish", "Bearish", "Slightly Bearish"],
+            default="Neutral",
+        )
+        score = np.where(np.abs(price_change) > 0.5, np.clip(50 + price_change * 5, 0, 100), 50.0)
 
         return {
-            'overall_sentiment': overall,
+            'valid': valid,
+            'price_change': price_change,
+            'volume_ratio': np.where(valid, volume_ratio, 1.0),
+            'score': score,
+            'label': label,
+            'has_quote': days >= 1,
+            'day_change': np.nan_to_num(day_change),
+        }
+
+    def analyze_market_sentiment(self, tickers: List[str]) -> Dict:
+        """
+        Analyze overall market sentiment based on major indices.
+
+        One batch of daily bars gives both the 5-day sentiment and today's
+        breadth (from each ticker's last two closes).
+
+        Args:
+            tickers: List of ticker symbols to analyze
+
+        Returns:
+            Dictionary with market sentiment
+        """
+        tickers = list(dict.fromkeys(tickers))
+        arrays = self._score_batch(tickers)
+        sentiments = self._sentiments_from_arrays(tickers, arrays)
+
+        # Counted from the blended labels, which news may have moved
+        bullish_count = sum(1 for sentiment in sentiments if 'Bullish' in sentiment['sentiment'])
+        bearish_count = sum(1 for sentiment in sentiments if 'Bearish' in sentiment['sentiment'])
+        avg_change = float(arrays['price_change'].mean()) if tickers else 0
+        breadth = self._breadth(arrays['day_change'][arrays['has_quote']])
+
+        return {
+            'overall_sentiment': overall_sentiment(bullish_count, bearish_count),
             'bullish_count': bullish_count,
             'bearish_count': bearish_count,
             'neutral_count': len(tickers) - bullish_count - bearish_count,
             'average_change': avg_change,
             'ticker_sentiments': sentiments,
+            'breadth': breadth,
         }
 
+    def create_rolling(self, tickers: List[str], window: int = SENTIMENT_WINDOW) -> "RollingSentiment":
+        """
+        Seed a RollingSentiment for tickers from one batch of daily bars and
+        their cached headline sentiment.
+
+        Args:
+            tickers: List of ticker symbols
+            window: Daily bars in the sentiment window
+
+        Returns:
+            RollingSentiment ready to be updated with live quotes
+        """
+        tickers = list(dict.fromkeys(tickers))
+        rolling = RollingSentiment(window, news_weight=config.sentiment_news_weight)
+        # News first, so each ticker is scored once when its bars load
+        self.update_news(rolling, tickers)
+        try:
+            bars = self.stock_fetcher.get_bars(tickers, period=f"{window}d", interval="1d")
+        except Exception as e:
+            logger.error(f"Error fetching bars for rolling sentiment: {e}")
+            bars = pd.DataFrame()
+        rolling.load_bars(tickers, bars)
+        return rolling
+
+    def update_news(self, rolling: "RollingSentiment", tickers: List[str]):
+        """
+        Blend the currently cached headline sentiment of tickers into a RollingSentiment.
+
+        Args:
+            rolling: Live sentiment to update
+            tickers: Tickers whose news to read (cached news only, no requests)
+        """
+        for ticker in tickers:
+            rolling.set_news(ticker, self._news_sentiment(ticker))
+
+    def analyze_breadth(self, table: QuoteTable) -> Dict:
+        """
+        Count advancing and declining symbols from today's quotes.
+
+        Args:
+            table: Current quotes
+
+        Returns:
+            Dictionary with advancing, declining and unchanged counts and the
+            average change today
+        """
+        return self._breadth(table.column('change_percent')[table.valid_rows()])
+
+    @staticmethod
+    def _breadth(change: np.ndarray) -> Dict:
+        """Breadth counts from today's percent changes."""
+        advancing = int((change > 0).sum())
+        declining = int((change < 0).sum())
+        return {
+            'advancing': advancing,
+            'declining': declining,
+            'unchanged': len(change) - advancing - declining,
+            'average_change': float(change.mean()) if len(change) else 0.0,
+        }
+
+    def _news_sentiment(self, ticker: str) -> Optional[Dict]:
+        """Headline sentiment of a ticker's cached news, or None when none is cached."""
+        if config.sentiment_news_weight <= 0:
+            return None
+        try:
+            return self.news_fetcher.cached_news_sentiment(ticker)
+        except Exception as e:
+            logger.error(f"Error scoring news sentiment for {ticker}: {e}")
+            return None
+
     def _get_neutral_sentiment(self, ticker: str) -> Dict:
         """Return neutral sentiment when data is unavailable."""
+        return neutral_sentiment(ticker)
+
+
+class _BarWindow:
+    """The last few daily closes and volumes of one ticker, with a running volume sum."""
+
+    __slots__ = ('closes', 'volumes', 'volume_sum', 'day')
+
+    def __init__(self, window: int):
+        self.closes: Deque[float] = deque(maxlen=window)
+        self.volumes: Deque[float] = deque(maxlen=window)
+        self.volume_sum = 0.0
+        self.day: Optional[date] = None
+
+    def append(self, close: float, volume: float, day: Optional[date]):
+        if len(self.volumes) == self.volumes.maxlen:
+            self.volume_sum -= self.volumes[0]
+        self.closes.append(close)
+        self.volumes.append(volume)
+        self.volume_sum += volume
+        self.day = day
+
+    def replace_last(self, close: float, volume: float):
+        self.volume_sum += volume - self.volumes[-1]
+        self.closes[-1] = close
+        self.volumes[-1] = volume
+
+
+class RollingSentiment:
+    """
+    Live per-ticker and market sentiment, updated in O(1) per bar or quote.
+
+    Each ticker keeps a window of daily closes and a running volume sum, so a
+    new bar (or a quote revising today's bar) re-scores the ticker without
+    touching its history. The market tallies (bullish/bearish counts, average
+    change and today's breadth) are adjusted by the difference between a
+    ticker's old and new values rather than recounted. Headline sentiment set
+    with set_news is blended into every re-score, as in analyze_ticker_sentiment.
+
+    Not thread-safe; update it from one thread (e.g. the UI thread).
+    """
+
+    def __init__(self, window: int = SENTIMENT_WINDOW, news_weight: float = 0.0):
+        self.window = window
+        self.news_weight = news_weight
+        self._windows: Dict[str, _BarWindow] = {}
+        self._sentiments: Dict[str, Dict] = {}
+        # Headline summary per ticker (see HeadlineScorer.summarize)
+        self._news: Dict[str, Dict] = {}
+        self._bullish = 0
+        self._bearish = 0
+        self._total_change = 0.0
+        # Today's percent change per ticker, for advancing/declining counts
+        self._day_changes: Dict[str, float] = {}
+        self._advancing = 0
+        self._declining = 0
+        self._total_day_change = 0.0
+
+    def __len__(self) -> int:
+        return len(self._sentiments)
+
+    def load_bars(self, tickers: Iterable[str], bars: pd.DataFrame):
+        """
+        Seed windows from a wide frame of daily bars.
+
+        Args:
+            tickers: Tickers to track (those without bars start neutral)
+            bars: Frame with (ticker, field) columns, as from StockDataFetcher.get_bars
+        """
+        fetched = set(bars.columns.get_level_values(0)) if not bars.empty else set()
+        for ticker in tickers:
+            if ticker not in fetched:
+                self._score(ticker)
+                continue
+
+            ticker_bars = bars[ticker].dropna(subset=['Close'])
+            for timestamp, close, volume in zip(
+                ticker_bars.index, ticker_bars['Close'], ticker_bars['Volume'].fillna(0)
+            ):
+                self.add_bar(ticker, float(close), float(volume), pd.Timestamp(timestamp).date())
+
+            if len(ticker_bars) >= 1:
+                # Previous close, or today's open for a single bar (as in _score_batch)
+                last = float(ticker_bars['Close'].iloc[-1])
+                if len(ticker_bars) >= 2:
+                    previous = float(ticker_bars['Close'].iloc[-2])
+                else:
+                    previous = float(ticker_bars['Open'].iloc[-1]) if 'Open' in ticker_bars else np.nan
+                self._set_day_change(ticker, (last - previous) / previous * 100 if previous > 0 else 0.0)
+
+    def add_bar(self, ticker: str, close: float, volume: float, day: Optional[date] = None) -> Dict:
+        """
+        Append a completed or newly opened daily bar, dropping the oldest one.
+
+        Returns:
+            The ticker's updated sentiment
+        """
+        window = self._windows.get(ticker)
+        if window is None:
+            window = self._windows[ticker] = _BarWindow(self.window)
+        window.append(close, volume, day)
+        return self._score(ticker)
+
+    def update_quote(self, quote: Dict, today: Optional[date] = None) -> Dict:
+        """
+        Apply a live quote to the ticker's current bar.
+
+        A quote opens a new bar when it belongs to a later trading day than the
+        last bar and its previous close is that bar's close (so stale weekend
+        quotes do not shift the window); otherwise it revises the last bar.
+
+        Args:
+            quote: Quote dictionary with 'symbol', 'price', 'volume' and
+                optionally 'previous_close' and 'change_percent'
+            today: Trading day of the quote (defaults to today in exchange time)
+
+        Returns:
+            The ticker's updated sentiment
+        """
+        ticker = quote['symbol']
+        price = float(quote['price'])
+        volume = float(quote.get('volume') or 0)
+        today = today or datetime.now(MARKET_TZ).date()
+
+        if 'change_percent' in quote:
+            self._set_day_change(ticker, float(quote['change_percent']))
+
+        window = self._windows.get(ticker)
+        if window is None or not window.closes:
+            return self.add_bar(ticker, price, volume, today)
+
+        previous_close = quote.get('previous_close')
+        rolled_over = window.day is not None and today > window.day and (
+            not previous_close or abs(previous_close - window.closes[-1]) <= 1e-6 * abs(previous_close)
+        )
+        if rolled_over:
+            return self.add_bar(ticker, price, volume, today)
+
+        window.replace_last(price, volume)
+        return self._score(ticker)
+
+    def set_news(self, ticker: str, news: Optional[Dict]) -> Optional[Dict]:
+        """
+        Set (or clear, with None) a ticker's headline sentiment.
+
+        Returns:
+            The ticker's re-scored sentiment, or None if it is not tracked yet
+        """
+        if news:
+            self._news[ticker] = news
+        else:
+            self._news.pop(ticker, None)
+        if ticker in self._sentiments:
+            return self._score(ticker)
+        return None
+
+    def update_quotes(self, quotes: Iterable[Dict]):
+        """Apply several live quotes."""
+        for quote in quotes:
+            self.update_quote(quote)
+
+    def ticker_sentiment(self, ticker: str) -> Optional[Dict]:
+        """Return the current sentiment of one ticker."""
+        return self._sentiments.get(ticker)
+
+    def market_sentiment(self, top: Optional[int] = None) -> Dict:
+        """
+        Return market sentiment in the format of analyze_market_sentiment.
+
+        Args:
+            top: Only include the ``top`` tickers with the largest absolute
+                change in 'ticker_sentiments' (all tickers when None)
+
+        Returns:
+            Dictionary with market sentiment
+        """
+        count = len(self._sentiments)
+        if top is None:
+            sentiments = list(self._sentiments.values())
+        else:
+            sentiments = heapq.nlargest(
+                top, self._sentiments.values(), key=lambda s: abs(s['price_change_5d'])
+            )
+
+        day_count = len(self._day_changes)
         return {
-            'ticker': ticker,
-            'sentiment': 'Neutral',
-            'score': 50,
-            'price_change_5d': 0,
-            'volume_ratio': 1,
-            'trend': 'stable',
+            'overall_sentiment': overall_sentiment(self._bullish, self._bearish),
+            'bullish_count': self._bullish,
+            'bearish_count': self._bearish,
+            'neutral_count': count - self._bullish - self._bearish,
+            'average_change': self._total_change / count if count else 0,
+            'ticker_sentiments': sentiments,
+            'breadth': {
+                'advancing': self._advancing,
+                'declining': self._declining,
+                'unchanged': day_count - self._advancing - self._declining,
+                'average_change': self._total_day_change / day_count if day_count else 0.0,
+            },
         }
+
+    def _score(self, ticker: str) -> Dict:
+        """Re-score one ticker from its window and adjust the market tallies."""
+        window = self._windows.get(ticker)
+        if window is None or len(window.closes) < 2 or window.closes[0] <= 0:
+            sentiment = neutral_sentiment(ticker)
+        else:
+            first, last = window.closes[0], window.closes[-1]
+            price_change = (last - first) / first * 100
+            avg_volume = window.volume_sum / len(window.volumes)
+            label, score = classify_change(price_change)
+            sentiment = {
+                'ticker': ticker,
+                'sentiment': label,
+                'score': score,
+                'price_change_5d': price_change,
+                'volume_ratio': window.volumes[-1] / avg_volume if avg_volume > 0 else 1,
+                'trend': 'increasing' if price_change > 0 else 'decreasing',
+            }
+            apply_news(sentiment, self._news.get(ticker), self.news_weight)
+
+        previous = self._sentiments.get(ticker)
+        if previous is not None:
+            self._tally(previous, -1)
+        self._tally(sentiment, 1)
+        self._sentiments[ticker] = sentiment
+        return sentiment
+
+    def _tally(self, sentiment: Dict, sign: int):
+        if 'Bullish' in sentiment['sentiment']:
+            self._bullish += sign
+        elif 'Bearish' in sentiment['sentiment']:
+            self._bearish += sign
+        self._total_change += sign * sentiment['price_change_5d']
+
+    def _set_day_change(self, ticker: str, change: float):
+        previous = self._day_changes.get(ticker)
+        if previous is not None:
+            self._advancing -= previous > 0
+            self._declining -= previous < 0
+            self._total_day_change -= previous
+        self._advancing += change > 0
+        self._declining += change < 0
+        self._total_day_change += change
+        self._day_changes[ticker] = change
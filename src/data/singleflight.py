@@ -0,0 +1,94 @@
+"""
+Single-flight coalescing of concurrent identical requests.
+
+When several widgets ask for the same data at the same moment, only the first
+caller performs the fetch; everyone else waits for and shares its result.
+Works for both threads and asyncio tasks.
+"""
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+import asyncio
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share the same key."""
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def _claim(self, key: Hashable):
+        """Return (future, is_leader) for a key, registering a new call if none is running."""
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._in_flight[key] = future
+            return future, True
+
+    def _run(self, key: Hashable, future: Future, fn: Callable[[], Any]):
+        """Run fn as the leader for key and publish its outcome to all waiters."""
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Call fn, or wait for an identical call already in flight.
+
+        Args:
+            key: Identity of the request, e.g. ``(method, symbol, *args)``
+            fn: Zero-argument callable performing the request
+
+        Returns:
+            The result of the single shared call
+        """
+        future, is_leader = self._claim(key)
+        if is_leader:
+            return self._run(key, future, fn)
+        return future.result()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Any], executor=None) -> Any:
+        """
+        Async variant of do(): the blocking fn runs in an executor.
+
+        Async waiters and thread waiters for the same key share one call.
+
+        Args:
+            key: Identity of the request
+            fn: Zero-argument blocking callable performing the request
+            executor: Executor to run fn in (default loop executor if None)
+
+        Returns:
+            The result of the single shared call
+        """
+        future, is_leader = self._claim(key)
+        if is_leader:
+            loop = asyncio.get_running_loop()
+            # Shield so that cancelling one waiter does not abandon the others
+            return await asyncio.shield(
+                loop.run_in_executor(executor, self._run, key, future, fn)
+            )
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def in_flight(self) -> int:
+        """Return the number of requests currently in flight."""
+        with self._lock:
+            return len(self._in_flight)
+
+
+# Shared single-flight group used by the data fetchers
+single_flight = SingleFlight()
@@ -6,21 +6,220 @@ The data should NOT be used as the sole basis for investment decisions. Always c
 your own research and consult with qualified financial advisors before investing.
 Data accuracy is not guaranteed and delays or errors may occur.
 """
-import yfinance as yf
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple
+from datetime import datetime
+from concurrent.futures import Future
+from typing import Iterable, Optional, Dict, List, Tuple
 import logging
+from .cache import TTLCache, market_cache
+from .singleflight import single_flight
+from .history import HistoryStore, history_store
+from .executor import DeadlineExceeded, FetchExecutor, YAHOO_HOST, fetch_executor
+from .fundamentals import FundamentalsCache, fundamentals_cache
+from .providers import MarketDataProvider, get_provider
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of symbols per bulk download request
+QUOTE_CHUNK_SIZE = 100
+
+# Views built from a single download of a ticker's info payload
+INFO_VIEWS = ('quote', 'company', 'financials')
+
+
+# Numeric quote fields kept as columns in a QuoteTable
+QUOTE_COLUMNS = ('price', 'change', 'change_percent', 'volume', 'market_cap')
+
+
+class QuoteTable:
+    """
+    Columnar quotes for many symbols.
+
+    Each numeric field is a NumPy array and a symbol maps to one row, so a
+    universe of thousands of symbols costs a few arrays rather than one dict per
+    quote, and ranking is a vectorized partial sort. Rows are updated in place as
+    quotes change.
+    """
+
+    def __init__(self, symbols: Iterable[str] = (), capacity: int = 0):
+        symbols = list(dict.fromkeys(symbols))
+        capacity = max(capacity, len(symbols), 16)
+        self.symbols: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.zeros(capacity, dtype=np.int64 if name == 'volume' else np.float64)
+            for name in QUOTE_COLUMNS
+        }
+        # Rows that have received at least one quote
+        self._filled = np.zeros(capacity, dtype=bool)
+        for symbol in symbols:
+            self.add(symbol)
+
+    @classmethod
+    def from_quotes(cls, quotes: Iterable[Dict]) -> "QuoteTable":
+        """Build a table from quote dictionaries (each with a 'symbol' key)."""
+        quotes = list(quotes)
+        table = cls(capacity=len(quotes))
+        table.update_many(quotes)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._rows
+
+    def row(self, symbol: str) -> Optional[int]:
+        """Return the row index of a symbol, or None if it is not in the table."""
+        return self._rows.get(symbol)
+
+    def add(self, symbol: str) -> int:
+        """Add a symbol (no-op if present) and return its row index."""
+        row = self._rows.get(symbol)
+        if row is not None:
+            return row
+
+        row = len(self.symbols)
+        if row == len(self._filled):
+            self._grow(2 * row)
+        self.symbols.append(symbol)
+        self._rows[symbol] = row
+        return row
+
+    def _grow(self, capacity: int):
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:len(column)] = column
+            self._columns[name] = grown
+        filled = np.zeros(capacity, dtype=bool)
+        filled[:len(self._filled)] = self._filled
+        self._filled = filled
+
+    def update(self, symbol: str, **values) -> int:
+        """
+        Update a symbol's row in place, adding the symbol if needed.
+
+        Args:
+            symbol: Ticker symbol
+            **values: New values for any of QUOTE_COLUMNS
+
+        Returns:
+            Row index of the symbol
+        """
+        row = self.add(symbol)
+        for name, value in values.items():
+            if name in self._columns and value is not None:
+                self._columns[name][row] = value
+        self._filled[row] = True
+        return row
+
+    def update_quote(self, quote: Dict) -> int:
+        """Update a row from a quote dictionary; market cap 0 keeps the known value."""
+        values = {name: quote.get(name) for name in QUOTE_COLUMNS}
+        if not values['market_cap']:
+            values['market_cap'] = None
+        return self.update(quote['symbol'], **values)
+
+    def update_many(self, quotes: Iterable[Dict]):
+        """Update rows from several quote dictionaries."""
+        for quote in quotes:
+            self.update_quote(quote)
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a read-only view of one column, one value per row."""
+        view = self._columns[name][:len(self.symbols)]
+        view.flags.writeable = False
+        return view
+
+    def valid_rows(self) -> np.ndarray:
+        """Return the indices of rows that hold a quote."""
+        return np.flatnonzero(self._filled[:len(self.symbols)])
+
+    def get(self, symbol: str) -> Optional[Dict]:
+        """Return a symbol's values as a dictionary, or None if it has no quote."""
+        row = self._rows.get(symbol)
+        if row is None or not self._filled[row]:
+            return None
+        values = {name: column[row].item() for name, column in self._columns.items()}
+        values['symbol'] = symbol
+        return values
+
+    def sort(self, by: str = 'change_percent', descending: bool = True) -> List[str]:
+        """Return the symbols with quotes, ordered by one column."""
+        rows = self.valid_rows()
+        order = np.argsort(self._columns[by][rows], kind='stable')
+        if descending:
+            order = order[::-1]
+        return [self.symbols[row] for row in rows[order]]
+
+    def top_k(
+        self,
+        k: int,
+        by: str = 'change_percent',
+        largest: bool = True,
+        absolute: bool = False
+    ) -> List[str]:
+        """
+        Return the k symbols with the largest (or smallest) values of a column.
+
+        Uses a partial sort (argpartition), so only the k winners are fully ordered.
+
+        Args:
+            k: Number of symbols to return
+            by: Column to rank on
+            largest: Rank highest values first; False ranks lowest first
+            absolute: Rank on absolute values (e.g. biggest moves either way)
+
+        Returns:
+            Symbols, best first
+        """
+        rows = self.valid_rows()
+        if k <= 0 or len(rows) == 0:
+            return []
+
+        values = self._columns[by][rows].astype(np.float64)
+        if absolute:
+            values = np.abs(values)
+        if largest:
+            values = -values
+
+        k = min(k, len(rows))
+        if k < len(rows):
+            candidates = np.argpartition(values, k - 1)[:k]
+        else:
+            candidates = np.arange(len(rows))
+        best = candidates[np.argsort(values[candidates], kind='stable')]
+        return [self.symbols[row] for row in rows[best]]
+
 
 class StockDataFetcher:
     """Fetches and caches stock market data."""
 
-    def __init__(self):
-        self._cache: Dict[str, Dict] = {}
-        self._cache_timeout = timedelta(minutes=5)
+    def __init__(
+        self,
+        cache: Optional[TTLCache] = None,
+        history: Optional[HistoryStore] = None,
+        executor: Optional[FetchExecutor] = None,
+        fundamentals: Optional[FundamentalsCache] = None,
+        provider: Optional[MarketDataProvider] = None
+    ):
+        # Shared across all fetchers unless private stores are passed in
+        self._cache = cache if cache is not None else market_cache
+        self._history = history if history is not None else history_store
+        self._executor = executor if executor is not None else fetch_executor
+        self._fundamentals = fundamentals if fundamentals is not None else fundamentals_cache
+        self._provider = provider
+        self._flight = single_flight
+
+    @property
+    def provider(self) -> MarketDataProvider:
+        """Data provider in use (the process-wide one unless passed in)."""
+        return self._provider if self._provider is not None else get_provider()
+
+    def _cached(self, key: Tuple, loader):
+        """Serve key from the cache, coalescing concurrent misses into one fetch."""
+        return self._cache.get_or_load(key, loader, flight=self._flight)
 
     def get_quote(self, ticker: str) -> Optional[Dict]:
         """
@@ -32,27 +231,301 @@ class StockDataFetcher:
         Returns:
             Dictionary with quote data or None if failed
         """
-        try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
-
-            return {
-                'symbol': ticker,
-                'price': info.get('currentPrice', info.get('regularMarketPrice', 0)),
-                'change': info.get('regularMarketChange', 0),
-                'change_percent': info.get('regularMarketChangePercent', 0),
-                'volume': info.get('volume', 0),
-                'market_cap': info.get('marketCap', 0),
-                'pe_ratio': info.get('trailingPE', 0),
-                'high': info.get('dayHigh', 0),
-                'low': info.get('dayLow', 0),
-                'open': info.get('open', 0),
-                'previous_close': info.get('previousClose', 0),
+        return self._info_view('quote', ticker)
+
+    def get_ticker_snapshot(self, ticker: str) -> Optional[Dict]:
+        """
+        Get quote, company info and financials for a ticker in one round-trip.
+
+        The heavy ``info`` payload is downloaded at most once and all three views
+        are built from it, instead of one download per view. When the ticker's
+        fundamentals are already cached on disk, only a light bulk quote is fetched.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Dictionary with 'quote', 'company' and 'financials' keys or None if failed
+        """
+        fundamentals = self._cached_fundamentals(ticker)
+        if fundamentals is None:
+            return self._load_info_views(ticker)
+
+        quote = self._cache.get(('quote', ticker))
+        if quote is None:
+            quote = self._quote_with_fundamentals(ticker, fundamentals['financials'])
+        if quote is None:
+            return self._load_info_views(ticker)
+
+        return {'quote': quote, **fundamentals}
+
+    def _info_view(self, kind: str, ticker: str) -> Optional[Dict]:
+        """Return one cached view of a ticker's info, loading all views on a miss."""
+        view = self._cache.get((kind, ticker))
+        if view is not None:
+            return view
+
+        if kind != 'quote':
+            fundamentals = self._cached_fundamentals(ticker)
+            if fundamentals is not None:
+                return fundamentals[kind]
+
+        views = self._load_info_views(ticker)
+        return views[kind] if views else None
+
+    def _cached_fundamentals(self, ticker: str) -> Optional[Dict]:
+        """Return company and financials views from memory or the disk cache."""
+        company = self._cache.get(('company', ticker))
+        financials = self._cache.get(('financials', ticker))
+        if company is not None and financials is not None:
+            return {'company': company, 'financials': financials}
+
+        fundamentals = self._fundamentals.get(ticker)
+        if fundamentals is not None:
+            self._cache.set(('company', ticker), fundamentals['company'])
+            self._cache.set(('financials', ticker), fundamentals['financials'])
+        return fundamentals
+
+    def _quote_with_fundamentals(self, ticker: str, financials: Dict) -> Optional[Dict]:
+        """Build a full quote from a bulk quote plus cached P/E and share count."""
+        quote = self.get_quotes([ticker]).get(ticker)
+        if quote is None:
+            return None
+
+        quote = dict(quote)
+        quote['pe_ratio'] = financials.get('pe_ratio', 0)
+        shares = financials.get('shares_outstanding') or 0
+        quote['market_cap'] = quote['price'] * shares
+        self._cache.set(('quote', ticker), quote)
+        return quote
+
+    def warm_fundamentals(self, tickers: List[str]) -> List[Future]:
+        """
+        Fetch fundamentals for every ticker not cached yet, in the background.
+
+        Requests run on the shared rate-limited executor; this returns immediately.
+
+        Args:
+            tickers: List of ticker symbols, e.g. the whole watchlist
+
+        Returns:
+            One future per ticker being fetched
+        """
+        missing = self._fundamentals.missing(list(dict.fromkeys(tickers)))
+        if missing:
+            logger.info(f"Warming fundamentals cache for {len(missing)} tickers")
+        return [self._executor.submit(self._load_info_views, ticker) for ticker in missing]
+
+    def invalidate_fundamentals(self, ticker: Optional[str] = None):
+        """Drop cached company info and financials for one ticker, or for all."""
+        self._fundamentals.invalidate(ticker)
+        self._cache.invalidate(symbol=ticker, kind='company')
+        self._cache.invalidate(symbol=ticker, kind='financials')
+
+    def _load_info_views(self, ticker: str) -> Optional[Dict[str, Dict]]:
+        """Fetch a ticker's info once and cache the quote, company and financials views."""
+        def load():
+            info = self._fetch_info(ticker)
+            if info is None:
+                return None
+
+            views = {
+                'quote': self._quote_from_info(ticker, info),
+                'company': self._company_from_info(ticker, info),
+                'financials': self._financials_from_info(info),
             }
+            for kind, view in views.items():
+                self._cache.set((kind, ticker), view)
+            self._fundamentals.set(ticker, views['company'], views['financials'])
+            return views
+
+        return self._flight.do(('info', ticker), load)
+
+    def _fetch_info(self, ticker: str) -> Optional[Dict]:
+        """Fetch the raw info payload from the provider, bypassing the cache."""
+        try:
+            return self._executor.call(YAHOO_HOST, self.provider.get_info, ticker)
         except Exception as e:
-            logger.error(f"Error fetching quote for {ticker}: {e}")
+            logger.error(f"Error fetching info for {ticker}: {e}")
             return None
 
+    @staticmethod
+    def _quote_from_info(ticker: str, info: Dict) -> Dict:
+        """Build a quote dictionary from a ticker's info payload."""
+        return {
+            'symbol': ticker,
+            'price': info.get('currentPrice', info.get('regularMarketPrice', 0)),
+            'change': info.get('regularMarketChange', 0),
+            'change_percent': info.get('regularMarketChangePercent', 0),
+            'volume': info.get('volume', 0),
+            'market_cap': info.get('marketCap', 0),
+            'pe_ratio': info.get('trailingPE', 0),
+            'high': info.get('dayHigh', 0),
+            'low': info.get('dayLow', 0),
+            'open': info.get('open', 0),
+            'previous_close': info.get('previousClose', 0),
+        }
+
+    def get_quotes(
+        self,
+        tickers: List[str],
+        chunk_size: int = QUOTE_CHUNK_SIZE,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Dict]:
+        """
+        Get current quotes for many tickers using bulk downloads.
+
+        Symbols not already cached are fetched in chunks of ``chunk_size`` with one
+        bulk download per chunk (see get_bars), instead of one ``info`` round-trip
+        per symbol. Bulk quotes are derived from daily bars, so market cap and P/E
+        are not included.
+
+        Args:
+            tickers: List of ticker symbols
+            chunk_size: Maximum number of symbols per request
+            deadline: time.monotonic() value after which chunks still waiting
+                for the rate limiter are not requested
+
+        Returns:
+            Dictionary mapping ticker to quote data, in input order; tickers that
+            could not be fetched are omitted
+
+        Raises:
+            DeadlineExceeded: If a chunk could not be requested before the deadline
+        """
+        tickers = list(dict.fromkeys(tickers))
+        quotes: Dict[str, Dict] = {}
+        missing = []
+
+        for ticker in tickers:
+            quote = self._cache.get(('quotes', ticker))
+            if quote is not None:
+                quotes[ticker] = quote
+            else:
+                missing.append(ticker)
+
+        chunks = [missing[start:start + chunk_size] for start in range(0, len(missing), chunk_size)]
+        results = self._executor.map(
+            lambda chunk: self._flight.do(('quotes',) + tuple(chunk), lambda: self._fetch_quotes(chunk, deadline)),
+            chunks
+        )
+        for fetched in results:
+            for ticker, quote in fetched.items():
+                self._cache.set(('quotes', ticker), quote)
+                quotes[ticker] = quote
+
+        return {ticker: quotes[ticker] for ticker in tickers if ticker in quotes}
+
+    def _fetch_quotes(self, tickers: List[str], deadline: Optional[float] = None) -> Dict[str, Dict]:
+        """Fetch quotes for a chunk of tickers in a single bulk download."""
+        data = self._fetch_bars(tickers, period="5d", interval="1d", deadline=deadline)
+        if data is None:
+            return {}
+
+        quotes = {}
+        for ticker in data.columns.get_level_values(0).unique():
+            quote = self._quote_from_bars(ticker, data[ticker])
+            if quote:
+                quotes[ticker] = quote
+
+        return quotes
+
+    def get_bars(
+        self,
+        tickers: List[str],
+        period: str = "5d",
+        interval: str = "1d",
+        chunk_size: int = QUOTE_CHUNK_SIZE
+    ) -> pd.DataFrame:
+        """
+        Get OHLCV bars for many tickers as one wide frame.
+
+        Tickers are downloaded in chunks of ``chunk_size`` with one bulk
+        download per chunk. yfinance still sends one request per symbol, so
+        each symbol is charged against the Yahoo rate limit.
+
+        Args:
+            tickers: List of ticker symbols
+            period: Time period (e.g., '5d', '1mo')
+            interval: Data interval (e.g., '1d', '1h')
+            chunk_size: Maximum number of symbols per request
+
+        Returns:
+            DataFrame indexed by time with (ticker, field) columns; tickers that
+            could not be fetched are omitted
+        """
+        tickers = list(dict.fromkeys(tickers))
+        chunks = [tickers[start:start + chunk_size] for start in range(0, len(tickers), chunk_size)]
+        frames = self._executor.map(
+            lambda chunk: self._cached(
+                ('bars', tuple(chunk), period, interval),
+                lambda: self._fetch_bars(chunk, period, interval)
+            ),
+            chunks
+        )
+        frames = [frame for frame in frames if frame is not None]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, axis=1) if len(frames) > 1 else frames[0]
+
+    def _fetch_bars(
+        self,
+        tickers: List[str],
+        period: str,
+        interval: str,
+        deadline: Optional[float] = None
+    ) -> Optional[pd.DataFrame]:
+        """Download bars for a chunk of tickers in one call, with (ticker, field) columns."""
+        try:
+            # yfinance sends one request per symbol, so each one is charged
+            data = self._executor.call(
+                YAHOO_HOST,
+                self.provider.get_bars,
+                tickers,
+                period=period,
+                interval=interval,
+                cost=len(tickers),
+                deadline=deadline,
+            )
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching bulk bars for {len(tickers)} tickers: {e}")
+            return None
+
+        if data is None or data.empty:
+            return None
+
+        if not isinstance(data.columns, pd.MultiIndex):
+            data = pd.concat({tickers[0]: data}, axis=1)
+        return data
+
+    @staticmethod
+    def _quote_from_bars(ticker: str, bars: pd.DataFrame) -> Optional[Dict]:
+        """Build a quote dictionary from recent daily OHLCV bars."""
+        bars = bars.dropna(subset=['Close'])
+        if bars.empty:
+            return None
+
+        last = bars.iloc[-1]
+        price = float(last['Close'])
+        previous_close = float(bars['Close'].iloc[-2]) if len(bars) > 1 else float(last['Open'])
+        change = price - previous_close
+
+        return {
+            'symbol': ticker,
+            'price': price,
+            'change': change,
+            'change_percent': (change / previous_close) * 100 if previous_close else 0,
+            'volume': int(last['Volume']) if pd.notna(last['Volume']) else 0,
+            'market_cap': 0,
+            'pe_ratio': 0,
+            'high': float(last['High']),
+            'low': float(last['Low']),
+            'open': float(last['Open']),
+            'previous_close': previous_close,
+        }
+
     def get_historical_data(
         self,
         ticker: str,
@@ -70,10 +543,28 @@ class StockDataFetcher:
         Returns:
             DataFrame with OHLCV data or None if failed
         """
+        return self._cached(
+            ('history', ticker, period, interval),
+            lambda: self._history.get(ticker, period, interval, self._download_history)
+        )
+
+    def _download_history(
+        self,
+        ticker: str,
+        interval: str,
+        period: Optional[str] = None,
+        start: Optional[datetime] = None
+    ) -> Optional[pd.DataFrame]:
+        """Download historical data from the provider for a period or from a start time."""
         try:
-            stock = yf.Ticker(ticker)
-            df = stock.history(period=period, interval=interval)
-            return df
+            return self._executor.call(
+                YAHOO_HOST,
+                self.provider.get_history,
+                ticker,
+                interval,
+                period=period,
+                start=start
+            )
         except Exception as e:
             logger.error(f"Error fetching historical data for {ticker}: {e}")
             return None
@@ -88,24 +579,34 @@ class StockDataFetcher:
         Returns:
             Dictionary with company info or None if failed
         """
-        try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
-
-            return {
-                'name': info.get('longName', ticker),
-                'sector': info.get('sector', 'N/A'),
-                'industry': info.get('industry', 'N/A'),
-                'description': info.get('longBusinessSummary', 'N/A'),
-                'website': info.get('website', 'N/A'),
-                'employees': info.get('fullTimeEmployees', 0),
-                'city': info.get('city', 'N/A'),
-                'state': info.get('state', 'N/A'),
-                'country': info.get('country', 'N/A'),
-            }
-        except Exception as e:
-            logger.error(f"Error fetching company info for {ticker}: {e}")
-            return None
+        return self._info_view('company', ticker)
+
+    @staticmethod
+    def _company_from_info(ticker: str, info: Dict) -> Dict:
+        """Build a company info dictionary from a ticker's info payload."""
+        return {
+            'name': info.get('longName', ticker),
+            'sector': info.get('sector', 'N/A'),
+            'industry': info.get('industry', 'N/A'),
+            'description': info.get('longBusinessSummary', 'N/A'),
+            'website': info.get('website', 'N/A'),
+            'employees': info.get('fullTimeEmployees', 0),
+            'city': info.get('city', 'N/A'),
+            'state': info.get('state', 'N/A'),
+            'country': info.get('country', 'N/A'),
+        }
+
+    def get_quote_table(self, tickers: List[str]) -> QuoteTable:
+        """
+        Get current quotes for many tickers as a columnar QuoteTable.
+
+        Args:
+            tickers: List of ticker symbols
+
+        Returns:
+            QuoteTable with a row per ticker that could be fetched
+        """
+        return QuoteTable.from_quotes(self.get_quotes(tickers).values())
 
     def get_market_movers(self, tickers: List[str]) -> List[Tuple[str, float, float]]:
         """
@@ -117,20 +618,13 @@ class StockDataFetcher:
         Returns:
             List of tuples (ticker, price, change_percent) sorted by absolute change
         """
-        movers = []
-
-        for ticker in tickers:
-            quote = self.get_quote(ticker)
-            if quote:
-                movers.append((
-                    ticker,
-                    quote['price'],
-                    quote['change_percent']
-                ))
-
-        # Sort by absolute percent change
-        movers.sort(key=lambda x: abs(x[2]), reverse=True)
-        return movers
+        table = self.get_quote_table(tickers)
+        price = table.column('price')
+        change_percent = table.column('change_percent')
+        return [
+            (ticker, float(price[table.row(ticker)]), float(change_percent[table.row(ticker)]))
+            for ticker in table.top_k(len(table), absolute=True)
+        ]
 
     def get_financials(self, ticker: str) -> Optional[Dict]:
         """
@@ -142,22 +636,25 @@ class StockDataFetcher:
         Returns:
             Dictionary with financial data or None if failed
         """
-        try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
-
-            return {
-                'revenue': info.get('totalRevenue', 0),
-                'gross_profit': info.get('grossProfits', 0),
-                'ebitda': info.get('ebitda', 0),
-                'net_income': info.get('netIncomeToCommon', 0),
-                'eps': info.get('trailingEps', 0),
-                'pe_ratio': info.get('trailingPE', 0),
-                'pb_ratio': info.get('priceToBook', 0),
-                'dividend_yield': info.get('dividendYield', 0),
-                'debt_to_equity': info.get('debtToEquity', 0),
-                'roe': info.get('returnOnEquity', 0),
-            }
-        except Exception as e:
-            logger.error(f"Error fetching financials for {ticker}: {e}")
-            return None
+        return self._info_view('financials', ticker)
+
+    @staticmethod
+    def _financials_from_info(info: Dict) -> Dict:
+        """Build a financials dictionary from a ticker's info payload."""
+        return {
+            'revenue': info.get('totalRevenue', 0),
+            'gross_profit': info.get('grossProfits', 0),
+            'ebitda': info.get('ebitda', 0),
+            'net_income': info.get('netIncomeToCommon', 0),
+            'eps': info.get('trailingEps', 0),
+            'pe_ratio': info.get('trailingPE', 0),
+            'pb_ratio': info.get('priceToBook', 0),
+            'dividend_yield': info.get('dividendYield', 0),
+            'debt_to_equity': info.get('debtToEquity', 0),
+            'roe': info.get('returnOnEquity', 0),
+            'shares_outstanding': info.get('sharesOutstanding', 0),
+        }
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Return hit/miss statistics for the shared data cache."""
+        return self._cache.stats()
@@ -0,0 +1,309 @@
+"""
+Streaming quote ingestion.
+
+Instead of polling, the StreamingQuoteProducer keeps one websocket open to a
+quote stream (Yahoo's pricing streamer by default) and publishes every tick to
+the quote bus as it arrives. It reconnects with exponential backoff and falls
+back to the polling producer while the stream is down.
+
+A local stub server speaking the same protocol lives in stub_stream.py.
+"""
+from typing import Dict, Optional, Set
+import asyncio
+import base64
+import json
+import threading
+import logging
+
+from ..utils.config import config, AppConfig
+from .quote_bus import QuoteBus, PollingQuoteProducer, quote_bus
+
+try:
+    from websockets.asyncio.client import connect as ws_connect
+except ImportError:  # streaming is optional
+    ws_connect = None
+
+try:
+    from google.protobuf.json_format import MessageToDict
+    from yfinance.pricing_pb2 import PricingData
+except ImportError:  # older yfinance releases; fall back to JSON payloads
+    PricingData = None
+
+logger = logging.getLogger(__name__)
+
+YAHOO_STREAM_URL = "wss://streamer.finance.yahoo.com/?version=2"
+
+# Yahoo drops subscriptions that are not renewed periodically
+RESUBSCRIBE_SECONDS = 15.0
+
+# Consecutive connection failures before polling takes over
+DEFAULT_FALLBACK_AFTER = 3
+
+INITIAL_RECONNECT_SECONDS = 1.0
+MAX_RECONNECT_SECONDS = 30.0
+
+# Stream field -> quote dictionary key (see StockDataFetcher._quote_from_info)
+PRICING_FIELDS = {
+    'price': 'price',
+    'change': 'change',
+    'change_percent': 'change_percent',
+    'day_volume': 'volume',
+    'day_high': 'high',
+    'day_low': 'low',
+    'open_price': 'open',
+    'previous_close': 'previous_close',
+    'market_cap': 'market_cap',
+}
+
+# Keys of every published quote (see StockDataFetcher._quote_from_info)
+QUOTE_KEYS = (
+    'price', 'change', 'change_percent', 'volume', 'market_cap', 'pe_ratio',
+    'high', 'low', 'open', 'previous_close',
+)
+
+
+def encode_pricing(fields: Dict) -> str:
+    """
+    Encode one tick the way the Yahoo streamer sends it.
+
+    Args:
+        fields: PricingData fields, e.g. {'id': 'AAPL', 'price': 190.1}
+
+    Returns:
+        JSON text frame
+    """
+    if PricingData is None:
+        return json.dumps({'type': 'json', 'message': fields})
+
+    pricing = PricingData(**fields)
+    payload = base64.b64encode(pricing.SerializeToString()).decode('ascii')
+    return json.dumps({'type': 'pricing', 'message': payload})
+
+
+def decode_pricing(frame: str) -> Optional[Dict]:
+    """Decode one streamer frame into a dictionary of PricingData fields."""
+    try:
+        message = json.loads(frame).get('message')
+        if isinstance(message, dict):
+            return message
+        if not message or PricingData is None:
+            return None
+        pricing = PricingData()
+        pricing.ParseFromString(base64.b64decode(message))
+        return MessageToDict(pricing, preserving_proto_field_name=True)
+    except Exception as e:
+        logger.error(f"Error decoding stream message: {e}")
+        return None
+
+
+def quote_from_pricing(pricing: Dict, previous: Optional[Dict] = None) -> Optional[Dict]:
+    """
+    Build a quote dictionary from a stream tick.
+
+    Ticks only carry the fields that changed (and protobuf leaves out
+    zero-valued ones), so they are merged over the previous quote for the
+    symbol, or over a quote with every key set to 0 for its first tick.
+
+    Args:
+        pricing: Decoded PricingData fields
+        previous: Last quote published for the symbol, if any
+
+    Returns:
+        Quote dictionary, or None if the tick has no symbol or price
+    """
+    symbol = pricing.get('id')
+    if not symbol or 'price' not in pricing:
+        return None
+
+    quote = dict.fromkeys(QUOTE_KEYS, 0)
+    if previous:
+        quote.update(previous)
+    for field, key in PRICING_FIELDS.items():
+        if field in pricing:
+            # int64 fields arrive as strings from MessageToDict
+            quote[key] = float(pricing[field])
+    quote['volume'] = int(quote['volume'])
+    quote['symbol'] = symbol
+    return quote
+
+
+class StreamingQuoteProducer:
+    """
+    Publishes quotes from a websocket stream, falling back to polling.
+
+    The stream runs on its own asyncio loop in a daemon thread. Symbols are
+    (re)subscribed whenever a widget subscribes to new ones on the bus, and
+    unsubscribed once no widget watches them. A symbol only ticks when it
+    trades, so while streaming, symbols without a quote yet are seeded with one
+    bulk request.
+    """
+
+    def __init__(
+        self,
+        bus: QuoteBus,
+        url: str = YAHOO_STREAM_URL,
+        fallback: Optional[PollingQuoteProducer] = None,
+        fallback_after: int = DEFAULT_FALLBACK_AFTER
+    ):
+        self.bus = bus
+        self.url = url
+        self.fallback = fallback or PollingQuoteProducer(bus)
+        self.fallback_after = fallback_after
+        self.connected = False
+        self.ticks = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._interest: Optional[asyncio.Event] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        bus.add_interest_listener(self._on_interest)
+
+    def start(self):
+        """Start streaming in a daemon thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if ws_connect is None:
+            logger.warning("websockets is not installed; polling quotes instead")
+            self.fallback.start()
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self._run()),
+            name="finterm-quote-stream",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Close the stream and stop the polling fallback."""
+        self._stop.set()
+        self._notify_interest()
+        self.fallback.stop()
+
+    def request_refresh(self):
+        """
+        Ask for fresh quotes.
+
+        The fallback polls when it is running; while streaming, the stream is
+        current and only symbols without any quote yet are fetched.
+        """
+        if self.connected:
+            self._seed(self.bus.symbols())
+        else:
+            self.fallback.request_refresh()
+
+    def _on_interest(self, symbols: Set[str]):
+        """Resubscribe, and seed new symbols while the stream is up (any thread)."""
+        self._notify_interest()
+        if self.connected:
+            self._seed(symbols)
+
+    def _seed(self, symbols: Set[str]):
+        """Publish one bulk quote for symbols the bus has no quote for, in a daemon thread."""
+        missing = sorted(symbol for symbol in symbols if self.bus.latest(symbol) is None)
+        if not missing:
+            return
+
+        def seed():
+            try:
+                quotes = self.fallback.fetcher.get_quotes(missing)
+            except Exception as e:
+                logger.error(f"Error seeding streamed quotes: {e}")
+                return
+            # A tick that arrived meanwhile is newer than the bulk quote
+            self.bus.publish_many([
+                quote for symbol, quote in quotes.items() if self.bus.latest(symbol) is None
+            ])
+
+        threading.Thread(target=seed, name="finterm-quote-seed", daemon=True).start()
+
+    def _notify_interest(self):
+        """Wake the stream loop to send a new subscription (any thread)."""
+        loop, interest = self._loop, self._interest
+        if loop is not None and interest is not None:
+            loop.call_soon_threadsafe(interest.set)
+
+    async def _run(self):
+        self._loop = asyncio.get_running_loop()
+        self._interest = asyncio.Event()
+        failures = 0
+        delay = INITIAL_RECONNECT_SECONDS
+
+        while not self._stop.is_set():
+            try:
+                async with ws_connect(self.url, open_timeout=10) as websocket:
+                    logger.info(f"Connected to quote stream {self.url}")
+                    self.connected = True
+                    failures = 0
+                    delay = INITIAL_RECONNECT_SECONDS
+                    self.fallback.stop()
+                    self._seed(self.bus.symbols())
+                    await self._stream(websocket)
+            except Exception as e:
+                logger.warning(f"Quote stream error: {e}")
+            finally:
+                self.connected = False
+
+            if self._stop.is_set():
+                break
+
+            failures += 1
+            if failures >= self.fallback_after:
+                # start() is a no-op while the fallback is already polling
+                self.fallback.start()
+
+            logger.info(f"Reconnecting to quote stream in {delay:.0f}s")
+            await self._sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_SECONDS)
+
+    async def _stream(self, websocket):
+        """Subscribe, then publish ticks until the connection drops or stop()."""
+        receiver = asyncio.create_task(self._receive(websocket))
+        subscribed: Set[str] = set()
+        try:
+            while not self._stop.is_set() and not receiver.done():
+                symbols = self.bus.symbols()
+                removed = subscribed - symbols
+                if removed:
+                    await websocket.send(json.dumps({'unsubscribe': sorted(removed)}))
+                if symbols:
+                    await websocket.send(json.dumps({'subscribe': sorted(symbols)}))
+                subscribed = symbols
+                self._interest.clear()
+                await self._sleep(RESUBSCRIBE_SECONDS, receiver)
+        finally:
+            receiver.cancel()
+        if receiver.done() and not receiver.cancelled() and receiver.exception():
+            raise receiver.exception()
+
+    async def _receive(self, websocket):
+        async for frame in websocket:
+            pricing = decode_pricing(frame)
+            if pricing is None:
+                continue
+            quote = quote_from_pricing(pricing, self.bus.latest(pricing.get('id', '')))
+            if quote is not None:
+                self.ticks += 1
+                self.bus.publish(quote)
+
+    async def _sleep(self, seconds: float, receiver: Optional[asyncio.Task] = None):
+        """Sleep, waking early on stop(), new subscriptions or a dropped connection."""
+        waiters = [asyncio.ensure_future(self._interest.wait())]
+        if receiver is not None:
+            waiters.append(receiver)
+        try:
+            await asyncio.wait(waiters, timeout=seconds, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiters[0].cancel()
+
+
+def create_quote_producer(bus: QuoteBus, app_config: AppConfig):
+    """Create the streaming producer if a stream URL is configured, else the poller."""
+    if app_config.quote_stream_url:
+        url = YAHOO_STREAM_URL if app_config.quote_stream_url == "yahoo" else app_config.quote_stream_url
+        return StreamingQuoteProducer(bus, url)
+    return PollingQuoteProducer(bus)
+
+
+# Producer feeding the shared quote bus
+quote_producer = create_quote_producer(quote_bus, config)
+
@@ -0,0 +1,159 @@
+"""
+Local quote stream server for offline testing and benchmarking.
+
+Emits synthetic ticks in the Yahoo streamer format, so StreamingQuoteProducer
+can run without network access:
+
+    python -m src.data.stub_stream --port 8765
+    QUOTE_STREAM_URL=ws://127.0.0.1:8765 python -m src.app
+"""
+from typing import Dict, Optional, Set
+import asyncio
+import json
+import random
+import threading
+import time
+
+from .streaming import encode_pricing
+
+try:
+    from websockets.asyncio.server import serve as ws_serve
+except ImportError:  # streaming is optional
+    ws_serve = None
+
+
+class StubQuoteStreamServer:
+    """
+    Local websocket server emitting synthetic ticks in the Yahoo streamer format.
+
+    Each subscribed symbol follows a seeded random walk, so runs are repeatable.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        tick_interval: float = 0.1,
+        seed: int = 0
+    ):
+        self.host = host
+        self.port = port
+        self.tick_interval = tick_interval
+        self.ticks_sent = 0
+        self._random = random.Random(seed)
+        self._prices: Dict[str, Dict] = {}
+        self._connections: Set = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    def start(self) -> str:
+        """Start serving in a daemon thread and return the server URL."""
+        if ws_serve is None:
+            raise RuntimeError("The stub stream server requires the websockets package")
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self._serve()),
+            name="finterm-stub-stream",
+            daemon=True,
+        )
+        self._thread.start()
+        self._ready.wait()
+        return self.url
+
+    def stop(self):
+        """Shut the server down."""
+        if self._loop is not None and self._server is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def drop_connections(self):
+        """Close every client connection, e.g. to exercise reconnects."""
+        if self._loop is not None:
+            for websocket in list(self._connections):
+                asyncio.run_coroutine_threadsafe(websocket.close(), self._loop)
+
+    async def _serve(self):
+        self._loop = asyncio.get_running_loop()
+        async with ws_serve(self._handle, self.host, self.port) as server:
+            self._server = server
+            self.port = next(iter(server.sockets)).getsockname()[1]
+            self._ready.set()
+            await server.wait_closed()
+
+    async def _handle(self, websocket):
+        self._connections.add(websocket)
+        symbols: Set[str] = set()
+        ticker = asyncio.create_task(self._tick(websocket, symbols))
+        try:
+            async for frame in websocket:
+                request = json.loads(frame)
+                symbols.update(request.get('subscribe', []))
+                symbols.difference_update(request.get('unsubscribe', []))
+        except Exception:
+            pass
+        finally:
+            ticker.cancel()
+            self._connections.discard(websocket)
+
+    async def _tick(self, websocket, symbols: Set[str]):
+        while True:
+            await asyncio.sleep(self.tick_interval)
+            for symbol in list(symbols):
+                await websocket.send(encode_pricing(self._next_tick(symbol)))
+                self.ticks_sent += 1
+
+    def _next_tick(self, symbol: str) -> Dict:
+        state = self._prices.get(symbol)
+        if state is None:
+            previous_close = self._random.uniform(20, 500)
+            state = {
+                'previous_close': previous_close,
+                'open_price': previous_close,
+                'price': previous_close,
+                'day_high': previous_close,
+                'day_low': previous_close,
+                'day_volume': 0,
+            }
+            self._prices[symbol] = state
+
+        state['price'] *= 1 + self._random.gauss(0, 0.001)
+        state['day_high'] = max(state['day_high'], state['price'])
+        state['day_low'] = min(state['day_low'], state['price'])
+        state['day_volume'] += self._random.randint(100, 10_000)
+        change = state['price'] - state['previous_close']
+        return {
+            'id': symbol,
+            'time': int(time.time() * 1000),
+            'change': change,
+            'change_percent': change / state['previous_close'] * 100,
+            **state,
+        }
+
+
+def main():
+    """Run the stub stream server until interrupted."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve synthetic quote ticks over a websocket")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--tick-interval", type=float, default=0.1)
+    args = parser.parse_args()
+
+    server = StubQuoteStreamServer(args.host, args.port, args.tick_interval)
+    print(f"Serving synthetic quotes on {server.start()}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
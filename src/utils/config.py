@@ -31,6 +31,57 @@ class AppConfig(BaseModel):
     refresh_interval: int = 60
     theme: str = "dark"
 
+    # Network fetch limits (shared by all data fetchers)
+    fetch_workers: int = 8
+    rate_limit_per_second: float = 4.0  # per host
+    rate_limit_burst: int = 8
+    fetch_max_retries: int = 3
+    fetch_backoff_seconds: float = 0.5
+
+    # Company profiles and fundamentals are cached on disk for this long
+    fundamentals_ttl_hours: int = 24
+
+    # Market data provider: "yfinance" (live), "record" (live, saved to disk)
+    # or "replay" (served from recordings, no network)
+    data_provider: str = "yfinance"
+    recordings_dir: Optional[str] = None  # defaults to ~/.finterm/recordings
+    replay_latency_ms: float = 0.0
+    replay_jitter_ms: float = 0.0
+
+    # Stream quotes over a websocket instead of polling: "yahoo" or a ws:// URL
+    # (e.g. the stub server from ``python -m src.data.stub_stream``)
+    quote_stream_url: Optional[str] = None
+
+    # Market movers scan a whole index instead of the watchlist when set: a
+    # bundled universe ("nasdaq100", "dow30") or a constituents CSV path
+    scan_universe: Optional[str] = None
+    scan_time_budget_seconds: float = 30.0
+    # Scans get their own pool and rate limit, so they never hold up interactive fetches
+    scan_workers: int = 4
+    scan_rate_per_second: float = 4.0  # per host
+
+    # RSS feeds are requested at most this often (a longer feed <ttl> wins);
+    # validators and entries are cached on disk, so unchanged feeds cost a 304
+    news_min_poll_seconds: float = 120.0
+
+    # Market news merges these feeds with one headline feed per watchlist ticker
+    # ("{symbol}" is replaced) and any sector feeds, fetched concurrently
+    news_feeds: List[str] = ["https://finance.yahoo.com/rss/topstories"]
+    news_ticker_feed_url: str = "https://feeds.finance.yahoo.com/rss/2.0/headline?s={symbol}&region=US&lang=en-US"
+    news_sector_feeds: List[str] = []
+    news_feed_workers: int = 64
+    news_feed_rate_per_second: float = 10.0  # per host
+    news_time_budget_seconds: float = 10.0
+    # Headlines remembered as already shown (bounded, kept across restarts)
+    news_seen_capacity: int = 20000
+    # Share of a ticker's sentiment score taken from its headlines (0 = price only)
+    sentiment_news_weight: float = 0.3
+
+    # Chart indicators, cycled with "o" (price overlays) and "p" (sub-panels);
+    # specs are "name" or "name:param,param" (see src/data/indicators.py)
+    chart_overlays: List[str] = ["sma:20", "ema:50", "bb:20,2", "vwap"]
+    chart_panels: List[str] = ["rsi:14", "macd:12,26,9", "atr:14"]
+
     @classmethod
     def load(cls, config_path: Optional[Path] = None) -> "AppConfig":
         """Load configuration from file or environment."""
@@ -45,7 +96,11 @@ class AppConfig(BaseModel):
             default_tickers=os.getenv(
                 "DEFAULT_TICKERS",
                 "SPY,QQQ,AAPL,MSFT,GOOGL,TSLA"
-            ).split(",")
+            ).split(","),
+            data_provider=os.getenv("DATA_PROVIDER", "yfinance"),
+            recordings_dir=os.getenv("RECORDINGS_DIR"),
+            quote_stream_url=os.getenv("QUOTE_STREAM_URL"),
+            scan_universe=os.getenv("SCAN_UNIVERSE"),
         )
 
     def save(self, config_path: Path):
@@ -2,8 +2,24 @@
 Base widget class for FinTerm widgets.
 """
 from textual.widget import Widget
+from textual.message import Message
 from textual.reactive import reactive
-from typing import Optional
+from typing import Dict, Iterable, Optional
+from datetime import datetime
+from ..data.quote_bus import QuoteBus, Subscription, quote_bus
+
+# How often the "updated N min ago" indicator is repainted (seconds)
+AGE_REPAINT_INTERVAL = 30
+
+
+class QuotesUpdated(Message):
+    """Quote updates pushed from the quote bus for a widget's subscribed symbols."""
+
+    bubble = False
+
+    def __init__(self, quotes: Dict[str, Dict]):
+        super().__init__()
+        self.quotes = quotes
 
 
 class BaseWidget(Widget):
@@ -12,6 +28,12 @@ class BaseWidget(Widget):
 
     Provides common functionality for data fetching, refresh, and display.
     Subclasses must implement fetch_data() and render_content().
+
+    Refreshes are stale-while-revalidate: once a widget has data it keeps showing
+    it while a refresh runs in the background, with a small status in its title.
+    fetch_data() should await all of its requests before assigning any results,
+    so the new content replaces the old in one step, and should raise if the
+    refresh produced nothing so that the previous data stays on screen.
     """
 
     refresh_interval: reactive[int] = reactive(60)
@@ -29,6 +51,8 @@ class BaseWidget(Widget):
         self.widget_title = title
         self.refresh_interval = refresh_interval
         self.border_title = title
+        self.last_updated: Optional[datetime] = None
+        self.quote_subscription: Optional[Subscription] = None
 
     async def fetch_data(self):
         """
@@ -44,13 +68,63 @@ class BaseWidget(Widget):
         """
         raise NotImplementedError("Subclasses must implement render_content()")
 
+    def has_data(self) -> bool:
+        """Return True once the widget has content to show, even if stale."""
+        return self.last_updated is not None
+
+    def status_text(self) -> str:
+        """Short refresh status shown next to the title: updating, failed or data age."""
+        if self.is_loading:
+            return "↻ updating"
+        if self.has_error:
+            return "⚠ refresh failed"
+        if self.last_updated is None:
+            return ""
+
+        age = (datetime.now() - self.last_updated).total_seconds()
+        if age < 60:
+            return "just now"
+        elif age < 3600:
+            return f"{int(age // 60)}m ago"
+        else:
+            return f"{int(age // 3600)}h ago"
+
+    def panel_title(self, title: Optional[str] = None) -> str:
+        """Return the panel title with the refresh status appended."""
+        title = title or self.widget_title
+        status = self.status_text()
+        return f"{title} · {status}" if status else title
+
+    def subscribe_quotes(self, symbols: Iterable[str], bus: QuoteBus = quote_bus):
+        """
+        Receive pushed quotes for symbols as QuotesUpdated messages.
+
+        Calling again replaces the subscribed symbols. Handle the updates in
+        ``on_quotes_updated``.
+        """
+        if self.quote_subscription is None:
+            # post_message is thread-safe, so the bus can deliver from its own thread
+            self.quote_subscription = bus.subscribe(
+                symbols,
+                lambda quotes: self.post_message(QuotesUpdated(quotes))
+            )
+        else:
+            self.quote_subscription.update_symbols(symbols)
+
+    def on_unmount(self):
+        """Called when widget is removed."""
+        if self.quote_subscription is not None:
+            self.quote_subscription.close()
+            self.quote_subscription = None
+
     async def refresh_data(self):
-        """Refresh the widget data."""
+        """Refresh the widget data in the background, keeping stale content visible."""
         self.is_loading = True
         self.has_error = False
 
         try:
             await self.fetch_data()
+            self.last_updated = datetime.now()
         except Exception as e:
             self.has_error = True
             self.error_message = str(e)
@@ -63,3 +137,5 @@ class BaseWidget(Widget):
         # Initial data fetch on mount
         # Auto-refresh disabled for v0.1.0 - use 'r' key to manually refresh
         self.run_worker(self.refresh_data(), exclusive=True)
+        # Keep the age indicator current without refetching
+        self.set_interval(AGE_REPAINT_INTERVAL, self.refresh)
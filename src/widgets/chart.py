@@ -8,12 +8,23 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.columns import Columns
 import logging
-from typing import Optional, List, Tuple
-from ..data.stocks import StockDataFetcher
+import math
+from typing import Dict, Optional, List, Tuple
+import pandas as pd
+from ..data.async_fetchers import AsyncStockDataFetcher, run_blocking
+from ..data.indicators import Indicator, indicator_cache, parse_indicator
+from ..utils.config import config
 from .base import BaseWidget
 
 logger = logging.getLogger('finterm.chart')
 
+# Marker and colour for an indicator's first, second and further outputs
+LINE_MARKERS = [('•', 'yellow'), ('·', 'magenta'), ('∘', 'blue')]
+LINE_STYLES = dict(LINE_MARKERS)
+
+# Rows of the indicator sub-panel below the price chart
+PANEL_HEIGHT = 6
+
 
 class ChartWidget(BaseWidget):
     """
@@ -34,6 +45,8 @@ class ChartWidget(BaseWidget):
         period: str = "1mo",
         interval: str = "1d",
         chart_type: str = "candlestick",
+        overlays: Optional[List[str]] = None,
+        panels: Optional[List[str]] = None,
         **kwargs
     ):
         super().__init__(title=f"{ticker} Chart", **kwargs)
@@ -41,27 +54,62 @@ class ChartWidget(BaseWidget):
         self.period = period
         self.interval = interval
         self.chart_type = chart_type
-        self.stock_fetcher = StockDataFetcher()
+        self.stock_fetcher = AsyncStockDataFetcher()
         self.chart_data = None
+        # Indicators that can be shown over the price chart and in the sub-panel
+        self.overlays = self._parse_indicators(config.chart_overlays if overlays is None else overlays)
+        self.panels = self._parse_indicators(config.chart_panels if panels is None else panels)
+        # Position in the cycle of overlays/panels; -1 shows none
+        self.overlay_index = -1
+        self.panel_index = -1
+        # Indicator outputs keyed by Indicator.key, aligned with chart_data
+        self.indicator_data: Dict[Tuple, pd.DataFrame] = {}
+        # Settings the displayed data was fetched with (may lag behind during a refresh)
+        self.chart_settings = (ticker, period, interval)
 
     async def fetch_data(self):
         """Fetch historical price data."""
-        self.chart_data = self.stock_fetcher.get_historical_data(
-            self.ticker,
-            period=self.period,
-            interval=self.interval
+        ticker, period, interval = self.ticker, self.period, self.interval
+        data = await self.stock_fetcher.get_historical_data(
+            ticker,
+            period=period,
+            interval=interval
+        )
+        if data is None or len(data) == 0:
+            raise ValueError(f"No price data for {ticker}")
+
+        # Every configured indicator is computed up front (incrementally, from
+        # the cache), so cycling overlays and panels only re-renders
+        indicators = await run_blocking(
+            indicator_cache.compute, ticker, period, interval, data, self.overlays + self.panels
         )
 
+        self.chart_data = data
+        self.indicator_data = indicators
+        self.chart_settings = (ticker, period, interval)
+        self.widget_title = f"{ticker} Chart"
+
+    @staticmethod
+    def _parse_indicators(specs: List[str]) -> List[Indicator]:
+        """Parse indicator specs, skipping (and logging) invalid ones."""
+        indicators = []
+        for spec in specs:
+            try:
+                indicators.append(parse_indicator(spec))
+            except ValueError as e:
+                logger.error(f"Ignoring chart indicator '{spec}': {e}")
+        return indicators
+
     def render(self) -> RenderableType:
         """Render the chart."""
-        if self.is_loading:
+        if self.is_loading and not self.has_data():
             return Panel(
                 Text("Loading chart data...", style="yellow"),
                 title=self.widget_title,
                 border_style="blue"
             )
 
-        if self.has_error:
+        if self.has_error and not self.has_data():
             return Panel(
                 Text(f"Error: {self.error_message}", style="red"),
                 title=self.widget_title,
@@ -75,10 +123,11 @@ class ChartWidget(BaseWidget):
                 border_style="yellow"
             )
 
+        _, period, interval = self.chart_settings
         return Panel(
             self.render_content(),
-            title=f"{self.widget_title} ({self.period}, {self.interval})",
-            border_style="green"
+            title=self.panel_title(f"{self.widget_title} ({period}, {interval})"),
+            border_style="yellow" if self.has_error else "green"
         )
 
     def render_content(self) -> RenderableType:
@@ -109,6 +158,101 @@ class ChartWidget(BaseWidget):
             for val in values
         ]
 
+    @staticmethod
+    def _selected(indicators: List[Indicator], index: int) -> Optional[Indicator]:
+        """Return the indicator at a cycle position, or None for -1."""
+        return indicators[index] if 0 <= index < len(indicators) else None
+
+    def _indicator_lines(self, indicator: Optional[Indicator], count: int) -> List[Tuple[str, List[float]]]:
+        """Return (output name, last ``count`` values) for each output of an indicator."""
+        if indicator is None or indicator.key not in self.indicator_data:
+            return []
+        frame = self.indicator_data[indicator.key].iloc[-count:]
+        return [(name, frame[name].tolist()) for name in indicator.outputs]
+
+    def _plot_lines(
+        self,
+        grid: List[List[str]],
+        lines: List[Tuple[str, List[float]]],
+        min_val: float,
+        max_val: float,
+        spacing: int,
+        offset: int
+    ):
+        """Mark indicator values on a chart grid without overwriting what is drawn."""
+        height = len(grid)
+        for line_idx, (_, values) in enumerate(lines):
+            marker = LINE_MARKERS[min(line_idx, len(LINE_MARKERS) - 1)][0]
+            for i, value in enumerate(values):
+                if not math.isfinite(value):
+                    continue
+                y = self._normalize_to_range([value], min_val, max_val, height)[0]
+                x = i * spacing + offset
+                if 0 <= y < height and grid[y][x] == ' ':
+                    grid[y][x] = marker
+
+    def _render_legend(self) -> Text:
+        """Describe the shown overlay and sub-panel, with their cycle keys."""
+        legend = Text()
+        for label, key, indicators, index in (
+            ("Overlay", "o", self.overlays, self.overlay_index),
+            ("Panel", "p", self.panels, self.panel_index),
+        ):
+            if not indicators:
+                continue
+            indicator = self._selected(indicators, index)
+            legend.append(f"{label} [{key}]: ", style="dim")
+            if indicator is None:
+                legend.append("none", style="dim")
+            else:
+                legend.append(indicator.describe(), style="bold")
+                if len(indicator.outputs) > 1:
+                    for line_idx, name in enumerate(indicator.outputs):
+                        marker, style = LINE_MARKERS[min(line_idx, len(LINE_MARKERS) - 1)]
+                        legend.append(f" {marker}{name}", style=style)
+            legend.append("  ")
+        if legend:
+            legend = Text("\n").append_text(legend)
+        return legend
+
+    def _render_panel(self, count: int, spacing: int, offset: int) -> Text:
+        """Render the selected sub-panel indicator under the price chart."""
+        indicator = self._selected(self.panels, self.panel_index)
+        lines = self._indicator_lines(indicator, count)
+        if not lines:
+            return Text()
+
+        finite = [value for _, values in lines for value in values if math.isfinite(value)]
+        if not finite:
+            return Text(f"\n{indicator.describe()}: not enough data", style="dim")
+        max_val = max(finite)
+        min_val = min(finite)
+
+        grid = [[' ' for _ in range(count * spacing)] for _ in range(PANEL_HEIGHT)]
+        self._plot_lines(grid, lines, min_val, max_val, spacing, offset)
+
+        panel_text = Text("\n")
+        panel_text.append(f"{indicator.describe():>7s} ", style="bold")
+        for line_idx, (name, values) in enumerate(lines):
+            latest = values[-1]
+            style = LINE_MARKERS[min(line_idx, len(LINE_MARKERS) - 1)][1]
+            if math.isfinite(latest):
+                panel_text.append(f"{name} {latest:.2f}  ", style=style)
+        panel_text.append("\n")
+
+        for row_idx, row in enumerate(grid):
+            if row_idx == 0:
+                panel_text.append(f"{max_val:7.2f} ", style="dim cyan")
+            elif row_idx == PANEL_HEIGHT - 1:
+                panel_text.append(f"{min_val:7.2f} ", style="dim cyan")
+            else:
+                panel_text.append("        ", style="dim")
+            for char in row:
+                panel_text.append(char, style=LINE_STYLES.get(char))
+            panel_text.append("\n")
+
+        return panel_text
+
     def _render_candlestick_ascii(self) -> RenderableType:
         """Render candlestick chart using ASCII/Unicode characters."""
         df = self.chart_data
@@ -131,7 +275,13 @@ class ChartWidget(BaseWidget):
         all_prices = highs + lows
         max_price = max(all_prices)
         min_price = min(all_prices)
-        price_range = max_price - min_price
+
+        # The overlay shares the price scale
+        overlay = self._indicator_lines(self._selected(self.overlays, self.overlay_index), len(opens))
+        overlay_values = [value for _, values in overlay for value in values if math.isfinite(value)]
+        scale_max = max([max_price] + overlay_values)
+        scale_min = min([min_price] + overlay_values)
+        price_range = scale_max - scale_min
 
         # Chart dimensions
         chart_height = 20
@@ -141,10 +291,10 @@ class ChartWidget(BaseWidget):
         grid = [[' ' for _ in range(chart_width)] for _ in range(chart_height)]
 
         # Normalize prices to chart height
-        norm_opens = self._normalize_to_range(opens, min_price, max_price, chart_height)
-        norm_closes = self._normalize_to_range(closes, min_price, max_price, chart_height)
-        norm_highs = self._normalize_to_range(highs, min_price, max_price, chart_height)
-        norm_lows = self._normalize_to_range(lows, min_price, max_price, chart_height)
+        norm_opens = self._normalize_to_range(opens, scale_min, scale_max, chart_height)
+        norm_closes = self._normalize_to_range(closes, scale_min, scale_max, chart_height)
+        norm_highs = self._normalize_to_range(highs, scale_min, scale_max, chart_height)
+        norm_lows = self._normalize_to_range(lows, scale_min, scale_max, chart_height)
 
         # Draw candlesticks
         for i in range(len(opens)):
@@ -167,13 +317,16 @@ class ChartWidget(BaseWidget):
                 if 0 <= y < chart_height:
                     grid[y][x] = body_char
 
+        # Draw the overlay in the spacing column after each candle
+        self._plot_lines(grid, overlay, scale_min, scale_max, spacing=2, offset=1)
+
         # Build the chart text with colors
         chart_text = Text()
 
         # Add price scale and chart
         for row_idx, row in enumerate(grid):
             # Calculate price for this row
-            price = max_price - (row_idx / (chart_height - 1)) * price_range
+            price = scale_max - (row_idx / (chart_height - 1)) * price_range
 
             # Add price label every few rows
             if row_idx % 4 == 0:
@@ -189,6 +342,8 @@ class ChartWidget(BaseWidget):
                     chart_text.append(char, style="green")
                 elif char == '│':
                     chart_text.append(char, style="white dim")
+                elif char in LINE_STYLES:
+                    chart_text.append(char, style=LINE_STYLES[char])
                 else:
                     chart_text.append(char)
             chart_text.append("\n")
@@ -208,7 +363,8 @@ class ChartWidget(BaseWidget):
         summary.append(f"${price_change:+.2f} ({pct_change:+.2f}%)  ", style=change_style)
         summary.append(f"High: ${max_price:.2f}  Low: ${min_price:.2f}", style="dim")
 
-        return Text.assemble(chart_text, summary)
+        panel = self._render_panel(len(opens), spacing=2, offset=0)
+        return Text.assemble(chart_text, summary, self._render_legend(), panel)
 
     def _render_line_chart_ascii(self) -> RenderableType:
         """Render line chart using ASCII characters."""
@@ -222,9 +378,11 @@ class ChartWidget(BaseWidget):
         if len(closes) > max_points:
             closes = closes[-max_points:]
 
-        # Calculate range
-        max_price = max(closes)
-        min_price = min(closes)
+        # Calculate range (the overlay shares the price scale)
+        overlay = self._indicator_lines(self._selected(self.overlays, self.overlay_index), len(closes))
+        overlay_values = [value for _, values in overlay for value in values if math.isfinite(value)]
+        max_price = max(closes + overlay_values)
+        min_price = min(closes + overlay_values)
         price_range = max_price - min_price
 
         # Chart dimensions
@@ -254,6 +412,8 @@ class ChartWidget(BaseWidget):
                         if 0 <= y < chart_height:
                             grid[y][i] = '│'
 
+        self._plot_lines(grid, overlay, min_price, max_price, spacing=1, offset=0)
+
         # Build the chart text
         chart_text = Text()
 
@@ -270,6 +430,8 @@ class ChartWidget(BaseWidget):
                     chart_text.append(char, style="cyan bold")
                 elif char == '│':
                     chart_text.append(char, style="cyan")
+                elif char in LINE_STYLES:
+                    chart_text.append(char, style=LINE_STYLES[char])
                 else:
                     chart_text.append(char)
             chart_text.append("\n")
@@ -286,7 +448,8 @@ class ChartWidget(BaseWidget):
         change_style = "bold green" if price_change >= 0 else "bold red"
         summary.append(f"Change: ${price_change:+.2f} ({pct_change:+.2f}%)", style=change_style)
 
-        return Text.assemble(chart_text, summary)
+        panel = self._render_panel(len(closes), spacing=1, offset=0)
+        return Text.assemble(chart_text, summary, self._render_legend(), panel)
 
     def set_ticker(self, ticker: str):
         """Change the ticker being displayed."""
@@ -297,9 +460,21 @@ class ChartWidget(BaseWidget):
     def set_period(self, period: str):
         """Change the time period."""
         self.period = period
-        self.refresh_data()
+        self.run_worker(self.refresh_data(), exclusive=True)
 
-    def set_interval(self, interval: str):
-        """Change the interval."""
+    def set_bar_interval(self, interval: str):
+        """Change the bar interval (named so it does not shadow Widget.set_interval)."""
         self.interval = interval
-        self.refresh_data()
+        self.run_worker(self.refresh_data(), exclusive=True)
+
+    def cycle_overlay(self):
+        """Show the next price overlay (results are cached, nothing is refetched)."""
+        if self.overlays:
+            self.overlay_index = (self.overlay_index + 2) % (len(self.overlays) + 1) - 1
+            self.refresh()
+
+    def cycle_panel(self):
+        """Show the next indicator sub-panel (results are cached, nothing is refetched)."""
+        if self.panels:
+            self.panel_index = (self.panel_index + 2) % (len(self.panels) + 1) - 1
+            self.refresh()
@@ -6,15 +6,34 @@ from rich.console import RenderableType
 from rich.text import Text
 from rich.table import Table
 from rich.panel import Panel
-from typing import List, Tuple
-from ..data.stocks import StockDataFetcher
+from rich.console import Group
+from textual.message import Message
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from ..data.async_fetchers import AsyncStockDataFetcher, run_blocking
+from ..data.movers import MoversEngine
+from ..data.scanner import MarketScanner, load_universe
 from ..utils.config import config
-from .base import BaseWidget
+from .base import BaseWidget, QuotesUpdated
+
+
+class ScanProgress(Message):
+    """Partial market scan results, posted as quote chunks arrive."""
+
+    bubble = False
+
+    def __init__(self, result: Dict):
+        super().__init__()
+        self.result = result
 
 
 class MarketMoversWidget(BaseWidget):
     """
     Widget displaying top market movers (gainers and losers).
+
+    Ranks the watchlist by default. With a universe (a bundled index name or a
+    constituents CSV, see AppConfig.scan_universe) it scans the whole index and
+    also shows the most active symbols.
     """
 
     DEFAULT_CSS = """
@@ -27,29 +46,79 @@ class MarketMoversWidget(BaseWidget):
     def __init__(
         self,
         tickers: List[str] = None,
-        limit: int = 10,
+        limit: int = 5,
+        universe: Optional[str] = None,
         **kwargs
     ):
         super().__init__(title="Market Movers", **kwargs)
         self.tickers = tickers or config.default_tickers
-        self.limit = limit
-        self.stock_fetcher = StockDataFetcher()
-        self.movers_data = []
+        self.limit = limit  # rows per list (gainers and losers)
+        self.universe = universe or config.scan_universe
+        self.stock_fetcher = AsyncStockDataFetcher()
+        self.movers = MoversEngine(limit)
+        self.scanner = MarketScanner()
+        self.scan_result: Optional[Dict] = None
+        self._universe_symbols: Optional[List[str]] = None
 
     async def fetch_data(self):
         """Fetch market movers data."""
-        self.movers_data = self.stock_fetcher.get_market_movers(self.tickers)
+        if self.universe:
+            await self._scan()
+            return
+
+        table = await self.stock_fetcher.get_quote_table(self.tickers)
+        if not len(table):
+            raise ValueError("No quotes available for market movers")
+        self.movers.update_table(table)
+
+    async def _scan(self):
+        """Scan the whole universe, showing partial results as chunks arrive."""
+        if self._universe_symbols is None:
+            self._universe_symbols = await run_blocking(load_universe, self.universe)
+
+        result = await run_blocking(
+            self.scanner.scan,
+            self._universe_symbols,
+            top=self.limit,
+            time_budget=config.scan_time_budget_seconds,
+            on_progress=lambda partial: self.post_message(ScanProgress(partial)),
+        )
+        if not result['scanned']:
+            raise ValueError(f"No quotes available for {self.universe}")
+        self.scan_result = result
+
+    def on_scan_progress(self, message: ScanProgress):
+        """Show partial scan results while the rest of the universe loads."""
+        self.scan_result = message.result
+        self.refresh()
+
+    def has_data(self) -> bool:
+        """Partial scan results count as data, even before the first full scan."""
+        return super().has_data() or self.scan_result is not None
+
+    def on_mount(self):
+        """Subscribe to pushed quotes for the ranked tickers."""
+        # Universe scans re-run on refresh; pushing thousands of symbols
+        # through the quote poller would cost more than it saves
+        if not self.universe:
+            self.subscribe_quotes(self.tickers)
+
+    def on_quotes_updated(self, message: QuotesUpdated):
+        """Re-rank only the symbols whose quotes changed."""
+        self.movers.update_quotes(message.quotes.values())
+        self.last_updated = datetime.now()
+        self.refresh()
 
     def render(self) -> RenderableType:
         """Render the market movers widget."""
-        if self.is_loading:
+        if self.is_loading and not self.has_data():
             return Panel(
                 Text("Loading market movers...", style="yellow"),
                 title=self.widget_title,
                 border_style="blue"
             )
 
-        if self.has_error:
+        if self.has_error and not self.has_data():
             return Panel(
                 Text(f"Error: {self.error_message}", style="red"),
                 title=self.widget_title,
@@ -58,47 +127,101 @@ class MarketMoversWidget(BaseWidget):
 
         return Panel(
             self.render_content(),
-            title=self.widget_title,
-            border_style="green"
+            title=self.panel_title(),
+            border_style="yellow" if self.has_error else "green"
         )
 
     def render_content(self) -> RenderableType:
-        """Render market movers table."""
-        if not self.movers_data:
+        """Render top gainers and top losers tables."""
+        if self.universe:
+            return self.render_scan()
+
+        gainers = self.movers.gainers()
+        losers = self.movers.losers()
+        if not gainers and not losers:
             return Text("No data available", style="yellow")
 
+        return self._side_by_side(
+            self._movers_table("▲ Top Gainers", gainers, "green"),
+            self._movers_table("▼ Top Losers", losers, "red"),
+        )
+
+    def render_scan(self) -> RenderableType:
+        """Render gainers, losers and most active symbols of a universe scan."""
+        result = self.scan_result
+        if not result:
+            return Text("No data available", style="yellow")
+
+        progress = Text(
+            f"{self.universe}: {result['scanned']:,}/{result['total']:,} symbols "
+            f"in {result['elapsed']:.1f}s",
+            style="dim"
+        )
+        if not result['complete']:
+            progress.append("  (partial)", style="yellow")
+
+        return Group(
+            progress,
+            self._side_by_side(
+                self._movers_table("▲ Top Gainers", result['gainers'], "green"),
+                self._movers_table("▼ Top Losers", result['losers'], "red"),
+            ),
+            self._movers_table("◆ Most Active", result['most_active'], "cyan", show_volume=True),
+        )
+
+    def _side_by_side(self, left: Table, right: Table) -> Table:
+        """Lay two tables out next to each other."""
+        grid = Table.grid(expand=True, padding=(0, 1))
+        grid.add_column(ratio=1)
+        grid.add_column(ratio=1)
+        grid.add_row(left, right)
+        return grid
+
+    def _movers_table(
+        self,
+        title: str,
+        movers: List[Tuple],
+        style: str,
+        show_volume: bool = False
+    ) -> Table:
+        """Render one ranked list of (ticker, price, change_percent[, volume])."""
         table = Table(
+            title=title,
+            title_style=f"bold {style}",
             show_header=True,
             header_style="bold cyan",
             border_style="blue",
             expand=True
         )
 
-        table.add_column("Symbol", style="cyan", width=8)
-        table.add_column("Price", justify="right", width=12)
-        table.add_column("Change %", justify="right", width=12)
-        table.add_column("Trend", width=10)
-
-        for ticker, price, change_pct in self.movers_data[:self.limit]:
-            # Determine color based on change
-            if change_pct > 0:
-                change_style = "green"
-                trend = "↑ UP"
-                trend_style = "green"
-            elif change_pct < 0:
-                change_style = "red"
-                trend = "↓ DOWN"
-                trend_style = "red"
-            else:
-                change_style = "yellow"
-                trend = "→ FLAT"
-                trend_style = "yellow"
-
-            table.add_row(
+        table.add_column("Symbol", style="cyan")
+        table.add_column("Price", justify="right")
+        table.add_column("Change %", justify="right")
+        if show_volume:
+            table.add_column("Volume", justify="right")
+
+        for ticker, price, change_pct, *rest in movers:
+            row = [
                 ticker,
                 f"${price:.2f}",
-                Text(f"{change_pct:+.2f}%", style=change_style),
-                Text(trend, style=trend_style)
-            )
+                Text(f"{change_pct:+.2f}%", style="green" if change_pct >= 0 else "red")
+            ]
+            if show_volume:
+                row.append(self._format_volume(rest[0]))
+            table.add_row(*row)
+
+        if not movers:
+            table.add_row(Text("none", style="dim"), *[""] * (len(table.columns) - 1))
 
         return table
+
+    def _format_volume(self, num: float) -> str:
+        """Format share volumes with K, M, B suffixes."""
+        if num >= 1_000_000_000:
+            return f"{num / 1_000_000_000:.2f}B"
+        elif num >= 1_000_000:
+            return f"{num / 1_000_000:.2f}M"
+        elif num >= 1_000:
+            return f"{num / 1_000:.2f}K"
+        else:
+            return f"{num:.0f}"
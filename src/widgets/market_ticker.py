@@ -5,8 +5,9 @@ from textual.widgets import Static
 from rich.console import RenderableType
 from rich.text import Text
 from typing import List, Dict
-from ..data.stocks import StockDataFetcher
-from .base import BaseWidget
+from datetime import datetime
+from ..data.async_fetchers import AsyncStockDataFetcher
+from .base import BaseWidget, QuotesUpdated
 
 
 class MarketTickerWidget(BaseWidget):
@@ -24,7 +25,7 @@ class MarketTickerWidget(BaseWidget):
 
     def __init__(self, **kwargs):
         super().__init__(title="Market Overview", **kwargs)
-        self.stock_fetcher = StockDataFetcher()
+        self.stock_fetcher = AsyncStockDataFetcher()
         # Major market indices
         self.indices = [
             ("^GSPC", "S&P 500"),
@@ -39,22 +40,49 @@ class MarketTickerWidget(BaseWidget):
 
     async def fetch_data(self):
         """Fetch quotes for all major indices."""
-        self.quotes_data = {}
+        quotes = await self.stock_fetcher.get_quotes([ticker for ticker, _ in self.indices])
+        quotes_data = {}
+        for ticker, name in self.indices:
+            quote = quotes.get(ticker)
+            if quote:
+                quotes_data[name] = {
+                    'price': quote['price'],
+                    'change': quote['change'],
+                    'change_percent': quote['change_percent']
+                }
+
+        if not quotes_data:
+            raise ValueError("No market data available")
+        self.quotes_data = quotes_data
+
+    def on_mount(self):
+        """Subscribe to pushed quotes for the indices."""
+        self.subscribe_quotes([ticker for ticker, _ in self.indices])
+
+    def on_quotes_updated(self, message: QuotesUpdated):
+        """Apply pushed index quotes, keeping the configured display order."""
+        quotes_data = {}
         for ticker, name in self.indices:
-            quote = self.stock_fetcher.get_quote(ticker)
+            quote = message.quotes.get(ticker)
             if quote:
-                self.quotes_data[name] = {
+                quotes_data[name] = {
                     'price': quote['price'],
                     'change': quote['change'],
                     'change_percent': quote['change_percent']
                 }
+            elif name in self.quotes_data:
+                quotes_data[name] = self.quotes_data[name]
+
+        self.quotes_data = quotes_data
+        self.last_updated = datetime.now()
+        self.refresh()
 
     def render(self) -> RenderableType:
         """Render the market ticker."""
-        if self.is_loading and not self.quotes_data:
+        if self.is_loading and not self.has_data():
             return Text("Loading market data...", style="yellow")
 
-        if self.has_error:
+        if self.has_error and not self.has_data():
             return Text(f"Error: {self.error_message}", style="red")
 
         return self.render_content()
@@ -96,4 +124,8 @@ class MarketTickerWidget(BaseWidget):
             if i < len(self.quotes_data) - 1:
                 ticker_text.append("  │  ", style="dim blue")
 
+        status = self.status_text()
+        if status:
+            ticker_text.append(f"  ({status})", style="yellow" if self.has_error else "dim")
+
         return ticker_text
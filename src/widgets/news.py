@@ -6,11 +6,14 @@ from rich.console import RenderableType
 from rich.text import Text
 from rich.table import Table
 from rich.panel import Panel
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 from datetime import datetime
-from ..data.news import NewsFetcher
+from ..data.async_fetchers import AsyncNewsFetcher
 from .base import BaseWidget
 
+# Search results counted (and kept) per query
+SEARCH_LIMIT = 50
+
 
 class NewsWidget(BaseWidget):
     """
@@ -34,84 +37,147 @@ class NewsWidget(BaseWidget):
         super().__init__(title=title, **kwargs)
         self.ticker = ticker
         self.limit = limit
-        self.news_fetcher = NewsFetcher()
+        self.news_fetcher = AsyncNewsFetcher()
         self.news_data = []
+        # IDs of articles shown for the first time by the last refresh
+        self.new_ids: Set[str] = set()
+        # Rendered article bodies by article ID; only new articles are rendered
+        self._article_text: Dict[str, Text] = {}
+        # Active search filter and its matches (newest first)
+        self.search_query = ""
+        self.search_results: List[Dict] = []
 
     async def fetch_data(self):
         """Fetch news data."""
-        if self.ticker:
-            self.news_data = self.news_fetcher.get_ticker_news(self.ticker, self.limit)
+        ticker = self.ticker
+        if ticker:
+            news_data = await self.news_fetcher.get_ticker_news(ticker, self.limit)
         else:
-            self.news_data = self.news_fetcher.get_market_news(self.limit)
+            news_data = await self.news_fetcher.get_market_news(self.limit)
+        new_ids = await self.news_fetcher.mark_seen(news_data)
+
+        self.news_data = news_data
+        self.new_ids = new_ids
+        self.widget_title = f"{ticker} News" if ticker else "Market News"
+        if self.search_query:
+            self.search_results = self.news_fetcher.search(self.search_query, SEARCH_LIMIT)
 
     def render(self) -> RenderableType:
         """Render the news widget."""
-        if self.is_loading:
+        if self.is_loading and not self.has_data():
             return Panel(
                 Text("Loading news...", style="yellow"),
                 title=self.widget_title,
                 border_style="blue"
             )
 
-        if self.has_error:
+        if self.has_error and not self.has_data():
             return Panel(
                 Text(f"Error: {self.error_message}", style="red"),
                 title=self.widget_title,
                 border_style="red"
             )
 
+        title = f"{self.widget_title} · search: {self.search_query}" if self.search_query else None
         return Panel(
             self.render_content(),
-            title=self.widget_title,
-            border_style="green"
+            title=self.panel_title(title),
+            border_style="yellow" if self.has_error else "green"
         )
 
     def render_content(self) -> RenderableType:
-        """Render news articles."""
+        """Render news articles, or the search results while a query is active."""
+        if self.search_query:
+            return self._render_search()
+
         if not self.news_data:
             return Text("No news available", style="yellow")
 
+        return self._render_articles(self.news_data)
+
+    def _render_search(self) -> Text:
+        """Render the matches for the active query."""
+        if not self.search_results:
+            return Text(f"No articles match '{self.search_query}'", style="yellow")
+
+        count = len(self.search_results)
+        text = Text(
+            f"{count}{'+' if count >= SEARCH_LIMIT else ''} matching articles\n\n",
+            style="dim",
+        )
+        text.append_text(self._render_articles(self.search_results[:self.limit]))
+        return text
+
+    def _render_articles(self, articles: List[Dict]) -> Text:
+        """Render a numbered list of articles, reusing cached article bodies."""
         text = Text()
+        rendered = {}
 
-        for i, article in enumerate(self.news_data, 1):
-            # Add article number and title
+        for i, article in enumerate(articles, 1):
+            # Add article number, marking headlines not shown before
             text.append(f"{i}. ", style="bold cyan")
-            text.append(f"{article['title']}\n", style="bold white")
-
-            # Add source and time
-            source = article.get('source', 'Unknown')
-            published = article.get('published_at', '')
-
-            # Parse and format time
-            if published:
-                try:
-                    pub_time = datetime.fromisoformat(published.replace('Z', '+00:00'))
-                    time_str = pub_time.strftime('%Y-%m-%d %H:%M')
-                except:
-                    time_str = published
-
-                text.append(f"   {source}", style="dim cyan")
-                text.append(" • ", style="dim")
-                text.append(f"{time_str}\n", style="dim yellow")
+            article_id = article.get('id')
+            if article_id in self.new_ids:
+                text.append("NEW ", style="bold black on yellow")
+
+            if article_id:
+                body = self._article_text.get(article_id)
+                if body is None:
+                    body = self._render_article(article)
+                rendered[article_id] = body
             else:
-                text.append(f"   {source}\n", style="dim cyan")
-
-            # Add description if available
-            description = article.get('description', '')
-            if description and description != 'No description':
-                # Truncate long descriptions
-                if len(description) > 150:
-                    description = description[:147] + "..."
-                text.append(f"   {description}\n", style="white")
+                body = self._render_article(article)
+            text.append_text(body)
 
             # Add spacing between articles
-            if i < len(self.news_data):
+            if i < len(articles):
                 text.append("\n")
 
+        # Keep only the articles on screen, so the cache cannot grow
+        self._article_text = rendered
+        return text
+
+    def _render_article(self, article: Dict) -> Text:
+        """Render one article's title, source line and description."""
+        text = Text()
+        text.append(f"{article['title']}\n", style="bold white")
+
+        # Add source and time
+        source = article.get('source', 'Unknown')
+        published = article.get('published_at', '')
+
+        # Parse and format time
+        if published:
+            try:
+                pub_time = datetime.fromisoformat(published.replace('Z', '+00:00'))
+                time_str = pub_time.strftime('%Y-%m-%d %H:%M')
+            except:
+                time_str = published
+
+            text.append(f"   {source}", style="dim cyan")
+            text.append(" • ", style="dim")
+            text.append(f"{time_str}\n", style="dim yellow")
+        else:
+            text.append(f"   {source}\n", style="dim cyan")
+
+        # Add description if available
+        description = article.get('description', '')
+        if description and description != 'No description':
+            # Truncate long descriptions
+            if len(description) > 150:
+                description = description[:147] + "..."
+            text.append(f"   {description}\n", style="white")
+
         return text
 
+    def set_query(self, query: str):
+        """Filter the panel to articles matching a search query ("" shows the latest news)."""
+        self.search_query = query if query.strip() else ""
+        self.search_results = self.news_fetcher.search(self.search_query, SEARCH_LIMIT) if self.search_query else []
+        self.refresh()
+
     def set_ticker(self, ticker: Optional[str]):
         """Change the ticker for news."""
         self.ticker = ticker
         self.border_title = f"{ticker} News" if ticker else "Market News"
-        self.refresh_data()
+        self.run_worker(self.refresh_data(), exclusive=True)
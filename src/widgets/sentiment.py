@@ -7,10 +7,15 @@ from rich.text import Text
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, BarColumn, TextColumn
-from typing import List
-from ..data.sentiment import SentimentAnalyzer
+from typing import List, Optional
+from datetime import datetime
+from ..data.sentiment import SentimentAnalyzer, RollingSentiment
+from ..data.async_fetchers import run_blocking
 from ..utils.config import config
-from .base import BaseWidget
+from .base import BaseWidget, QuotesUpdated
+
+# Tickers listed under "top movers sentiment"
+TOP_SENTIMENTS = 5
 
 
 class SentimentWidget(BaseWidget):
@@ -34,21 +39,50 @@ class SentimentWidget(BaseWidget):
         self.tickers = tickers or config.default_tickers
         self.sentiment_analyzer = SentimentAnalyzer()
         self.sentiment_data = None
+        self.rolling: Optional[RollingSentiment] = None
 
     async def fetch_data(self):
-        """Fetch sentiment data."""
-        self.sentiment_data = self.sentiment_analyzer.analyze_market_sentiment(self.tickers)
+        """Fetch daily bars and seed the live sentiment from them."""
+        rolling = await run_blocking(
+            self.sentiment_analyzer.create_rolling,
+            self.tickers
+        )
+        self.rolling = rolling
+        # Pick up ticker news prefetched while the bars were loading
+        self.sentiment_analyzer.update_news(rolling, self.tickers)
+        self.sentiment_data = rolling.market_sentiment(top=TOP_SENTIMENTS)
+
+    def on_mount(self):
+        """Subscribe to pushed quotes so sentiment updates between refreshes."""
+        self.subscribe_quotes(self.tickers)
+
+    def on_quotes_updated(self, message: QuotesUpdated):
+        """Re-score only the tickers whose quotes changed."""
+        if self.rolling is None:
+            return
+        self.rolling.update_quotes(message.quotes.values())
+        self.sentiment_data = self.rolling.market_sentiment(top=TOP_SENTIMENTS)
+        self.last_updated = datetime.now()
+        self.refresh()
+
+    def update_news(self):
+        """Re-blend headline sentiment after ticker news was fetched (no requests)."""
+        if self.rolling is None:
+            return
+        self.sentiment_analyzer.update_news(self.rolling, self.tickers)
+        self.sentiment_data = self.rolling.market_sentiment(top=TOP_SENTIMENTS)
+        self.refresh()
 
     def render(self) -> RenderableType:
         """Render the sentiment widget."""
-        if self.is_loading:
+        if self.is_loading and not self.has_data():
             return Panel(
                 Text("Analyzing market sentiment...", style="yellow"),
                 title=self.widget_title,
                 border_style="blue"
             )
 
-        if self.has_error:
+        if self.has_error and not self.has_data():
             return Panel(
                 Text(f"Error: {self.error_message}", style="red"),
                 title=self.widget_title,
@@ -57,8 +91,8 @@ class SentimentWidget(BaseWidget):
 
         return Panel(
             self.render_content(),
-            title=self.widget_title,
-            border_style="green"
+            title=self.panel_title(),
+            border_style="yellow" if self.has_error else "green"
         )
 
     def render_content(self) -> RenderableType:
@@ -88,7 +122,15 @@ class SentimentWidget(BaseWidget):
         text.append(f"Average Change: ", style="white")
 
         change_style = "green" if avg_change >= 0 else "red"
-        text.append(f"{avg_change:+.2f}%\n\n", style=change_style)
+        text.append(f"{avg_change:+.2f}%\n", style=change_style)
+
+        breadth = self.sentiment_data.get('breadth')
+        if breadth:
+            text.append("Today: ", style="white")
+            text.append(f"▲ {breadth['advancing']} ", style="green")
+            text.append(f"▼ {breadth['declining']} ", style="red")
+            text.append(f"→ {breadth['unchanged']}\n", style="yellow")
+        text.append("\n")
 
         # Sentiment breakdown
         text.append("═" * 40 + "\n", style="dim blue")
@@ -125,7 +167,7 @@ class SentimentWidget(BaseWidget):
                 self.sentiment_data['ticker_sentiments'],
                 key=lambda x: abs(x['price_change_5d']),
                 reverse=True
-            )[:5]
+            )[:TOP_SENTIMENTS]
 
             for s in sentiments:
                 ticker = s['ticker']
@@ -145,6 +187,10 @@ class SentimentWidget(BaseWidget):
 
                 text.append(f"{ticker:6s} ", style="cyan")
                 text.append(f"{icon} {sentiment:15s} ", style=style)
-                text.append(f"{change:+6.2f}%\n", style=style)
+                text.append(f"{change:+6.2f}%", style=style)
+                if s.get('news_count'):
+                    # Mean headline tone, -1 to 1
+                    text.append(f" N{s['news_score']:+.1f}", style="dim")
+                text.append("\n")
 
         return text
@@ -8,8 +8,14 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.columns import Columns
 from typing import Optional, Dict
-from ..data.stocks import StockDataFetcher
-from .base import BaseWidget
+from datetime import datetime
+from ..data.async_fetchers import AsyncStockDataFetcher
+from .base import BaseWidget, QuotesUpdated
+
+# Quote fields taken from pushed updates; market cap and P/E come from the snapshot
+PUSHED_QUOTE_FIELDS = (
+    'price', 'change', 'change_percent', 'volume', 'high', 'low', 'open', 'previous_close'
+)
 
 
 class TickerInfoWidget(BaseWidget):
@@ -31,27 +37,55 @@ class TickerInfoWidget(BaseWidget):
     ):
         super().__init__(title=f"{ticker} Info", **kwargs)
         self.ticker = ticker
-        self.stock_fetcher = StockDataFetcher()
+        self.stock_fetcher = AsyncStockDataFetcher()
         self.quote_data = None
         self.company_data = None
         self.financials_data = None
 
     async def fetch_data(self):
         """Fetch ticker information."""
-        self.quote_data = self.stock_fetcher.get_quote(self.ticker)
-        self.company_data = self.stock_fetcher.get_company_info(self.ticker)
-        self.financials_data = self.stock_fetcher.get_financials(self.ticker)
+        ticker = self.ticker
+        snapshot = await self.stock_fetcher.get_ticker_snapshot(ticker)
+        if not snapshot or not snapshot.get('quote'):
+            raise ValueError(f"No quote data for {ticker}")
+
+        self.quote_data = snapshot.get('quote')
+        self.company_data = snapshot.get('company')
+        self.financials_data = snapshot.get('financials')
+        self.widget_title = f"{ticker} Info"
+
+    def on_mount(self):
+        """Subscribe to pushed quotes for the current ticker."""
+        self.subscribe_quotes([self.ticker])
+
+    def on_quotes_updated(self, message: QuotesUpdated):
+        """Merge a pushed quote into the displayed one."""
+        if not self.quote_data:
+            return
+        quote = message.quotes.get(self.quote_data.get('symbol'))
+        if not quote:
+            return
+
+        quote_data = dict(self.quote_data)
+        quote_data.update({field: quote[field] for field in PUSHED_QUOTE_FIELDS if field in quote})
+        shares = (self.financials_data or {}).get('shares_outstanding')
+        if shares:
+            quote_data['market_cap'] = quote_data['price'] * shares
+
+        self.quote_data = quote_data
+        self.last_updated = datetime.now()
+        self.refresh()
 
     def render(self) -> RenderableType:
         """Render the ticker info widget."""
-        if self.is_loading:
+        if self.is_loading and not self.has_data():
             return Panel(
                 Text("Loading ticker info...", style="yellow"),
                 title=self.widget_title,
                 border_style="blue"
             )
 
-        if self.has_error:
+        if self.has_error and not self.has_data():
             return Panel(
                 Text(f"Error: {self.error_message}", style="red"),
                 title=self.widget_title,
@@ -60,8 +94,8 @@ class TickerInfoWidget(BaseWidget):
 
         return Panel(
             self.render_content(),
-            title=self.widget_title,
-            border_style="green"
+            title=self.panel_title(),
+            border_style="yellow" if self.has_error else "green"
         )
 
     def render_content(self) -> RenderableType:
@@ -150,4 +184,5 @@ class TickerInfoWidget(BaseWidget):
         """Change the ticker being displayed."""
         self.ticker = ticker
         self.border_title = f"{ticker} Info"
+        self.subscribe_quotes([ticker])
         self.run_worker(self.refresh_data(), exclusive=True)
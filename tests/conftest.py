@@ -0,0 +1,94 @@
+"""
+Shared fixtures for the FinTerm test suite.
+
+Tests never touch the network or ``~/.finterm``: stores are created under
+pytest's tmp_path and feeds are served by a local HTTP server.
+"""
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Tuple
+import sys
+import threading
+
+import pytest
+
+# Let a plain ``pytest`` run from a checkout import the ``src`` package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def rss(items: List[Tuple[str, str, int]]) -> str:
+    """Render an RSS document from (title, link, published epoch seconds) items."""
+    body = "".join(
+        f"<item><title>{title}</title><link>{link}</link><guid>{link}</guid>"
+        f"<pubDate>{formatdate(published, usegmt=True)}</pubDate></item>"
+        for title, link, published in items
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Test</title>{body}</channel></rss>'
+
+
+class FeedServer(ThreadingHTTPServer):
+    """
+    Serves RSS documents by path, with an ETag per document.
+
+    A request whose If-None-Match matches the document's ETag gets a 304.
+    Every request is recorded as (path, If-None-Match header).
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _FeedHandler)
+        # Path -> (ETag, body)
+        self.feeds: Dict[str, Tuple[str, str]] = {}
+        self.requests: List[Tuple[str, str]] = []
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+    def publish(self, path: str, etag: str, items: List[Tuple[str, str, int]]) -> str:
+        """Serve items at path with an ETag, returning the feed URL."""
+        self.feeds[path] = (f'"{etag}"', rss(items))
+        return self.url(path)
+
+    def requests_for(self, path: str) -> List[str]:
+        """If-None-Match headers sent for one path, in order."""
+        return [etag for requested, etag in self.requests if requested == path]
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        etag = self.headers.get('If-None-Match', '')
+        self.server.requests.append((self.path, etag))
+        feed = self.server.feeds.get(self.path)
+        if feed is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        if etag == feed[0]:
+            self.send_response(304)
+            self.send_header('ETag', feed[0])
+            self.end_headers()
+            return
+
+        body = feed[1].encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', feed[0])
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def feed_server():
+    """A running FeedServer on a free localhost port."""
+    server = FeedServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,99 @@
+"""Tests for the TTL/LRU market data cache and its use by StockDataFetcher."""
+from datetime import timedelta
+import time
+
+import pandas as pd
+
+from src.data.cache import TTLCache
+from src.data.executor import FetchExecutor
+from src.data.stocks import StockDataFetcher
+
+
+def test_entries_expire_per_kind():
+    cache = TTLCache(ttls={'quote': timedelta(seconds=0.05), 'company': timedelta(hours=1)})
+    cache.set(('quote', "AAPL"), 1)
+    cache.set(('company', "AAPL"), 2)
+    cache.set(('quote', "MSFT"), 3, ttl=60)
+
+    time.sleep(0.1)
+
+    assert cache.get(('quote', "AAPL")) is None
+    assert cache.get(('company', "AAPL")) == 2
+    # An explicit TTL overrides the kind's
+    assert cache.get(('quote', "MSFT")) == 3
+    assert cache.ttl_for('company') == 3600
+    assert cache.ttl_for('unknown') == 300
+
+
+def test_hits_misses_and_lru_evictions():
+    cache = TTLCache(max_entries=2)
+    cache.set(('quote', "A"), 1)
+    cache.set(('quote', "B"), 2)
+
+    assert cache.get(('quote', "A")) == 1
+    # B is now the least recently used entry
+    cache.set(('quote', "C"), 3)
+
+    assert cache.get(('quote', "B"), "gone") == "gone"
+    assert cache.get(('quote', "A")) == 1 and cache.get(('quote', "C")) == 3
+    assert cache.stats() == {'hits': 3, 'misses': 1, 'evictions': 1, 'size': 2}
+
+
+def test_get_or_load_does_not_cache_failures():
+    cache = TTLCache()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return None if len(calls) == 1 else "value"
+
+    assert cache.get_or_load(('quote', "A"), loader) is None
+    assert cache.get_or_load(('quote', "A"), loader) == "value"
+    assert cache.get_or_load(('quote', "A"), loader) == "value"
+    assert len(calls) == 2
+
+
+def test_invalidate_by_symbol_and_kind():
+    cache = TTLCache()
+    for kind in ('quote', 'company'):
+        for symbol in ("A", "B"):
+            cache.set((kind, symbol), 1)
+
+    cache.invalidate(symbol="A", kind='quote')
+    assert cache.get(('quote', "A")) is None and cache.get(('company', "A")) == 1
+    cache.invalidate(symbol="B")
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+class BarsProvider:
+    """Serves two daily bars per symbol, counting the symbols requested."""
+
+    def __init__(self):
+        self.requested = []
+
+    def get_bars(self, symbols, period, interval):
+        self.requested.extend(symbols)
+        index = pd.date_range("2026-10-15", periods=2, freq="D")
+        bar = pd.DataFrame(
+            {'Open': [10.0, 10.0], 'High': [11.0, 11.0], 'Low': [9.0, 9.0], 'Close': [10.0, 11.0], 'Volume': [1e5, 2e5]},
+            index=index,
+        )
+        return pd.concat({symbol: bar for symbol in symbols}, axis=1)
+
+
+def test_fetchers_sharing_a_cache_fetch_once():
+    cache = TTLCache()
+    provider = BarsProvider()
+    executor = FetchExecutor(max_workers=2, rate_per_second=1000, burst=100, max_retries=0, backoff_seconds=0)
+    first = StockDataFetcher(cache=cache, executor=executor, provider=provider)
+    second = StockDataFetcher(cache=cache, executor=executor, provider=provider)
+
+    quotes = first.get_quotes(["AAPL", "MSFT"])
+    again = second.get_quotes(["MSFT", "AAPL", "NVDA"])
+
+    assert provider.requested == ["AAPL", "MSFT", "NVDA"]
+    assert again["AAPL"] == quotes["AAPL"]
+    assert quotes["AAPL"]['price'] == 11.0 and quotes["AAPL"]['change_percent'] == 10.0
+    assert first.cache_stats()['hits'] == 2
@@ -0,0 +1,128 @@
+"""Tests for the token bucket and the rate-limited fetch executor."""
+import time
+
+import pytest
+
+from src.data.executor import DeadlineExceeded, FetchExecutor, TokenBucket, host_of, is_retryable
+
+
+class HTTPError(Exception):
+    """An error carrying a status code, like requests' HTTPError."""
+
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+class Flaky:
+    """Raises the given errors in turn, then returns "ok"."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+def elapsed(fn, *args, **kwargs):
+    started = time.monotonic()
+    result = fn(*args, **kwargs)
+    return result, time.monotonic() - started
+
+
+def test_bucket_allows_a_burst_then_spaces_calls():
+    bucket = TokenBucket(rate=20, burst=3)
+
+    _, burst = elapsed(lambda: [bucket.acquire() for _ in range(3)])
+    _, spaced = elapsed(lambda: [bucket.acquire() for _ in range(2)])
+
+    assert burst < 0.03
+    assert 0.08 < spaced < 0.2
+
+
+def test_oversized_request_leaves_the_bucket_in_debt():
+    bucket = TokenBucket(rate=20, burst=2)
+
+    # Larger than the burst: taken from a full bucket, leaving 8 tokens owed
+    _, first = elapsed(bucket.acquire, 10)
+    _, second = elapsed(bucket.acquire)
+
+    assert first < 0.03
+    assert second == pytest.approx(9 / 20, abs=0.05)
+
+
+def test_deadline_gives_up_without_taking_tokens():
+    bucket = TokenBucket(rate=20, burst=1)
+    bucket.acquire(5)
+
+    taken, waited = elapsed(bucket.acquire, 1, deadline=time.monotonic() + 0.05)
+
+    assert not taken and waited < 0.03
+    # Nothing was taken, so the debt is repaid on schedule
+    _, later = elapsed(bucket.acquire)
+    assert later == pytest.approx(5 / 20, abs=0.05)
+
+
+def test_is_retryable():
+    assert is_retryable(HTTPError(429))
+    assert is_retryable(HTTPError(503))
+    assert not is_retryable(HTTPError(404))
+    assert is_retryable(RuntimeError("Too Many Requests. Rate limited."))
+    assert not is_retryable(ValueError("No data found"))
+
+
+def test_host_of():
+    assert host_of("https://feeds.test/rss?s=AAPL") == "feeds.test"
+    assert host_of("finance.yahoo.com") == "finance.yahoo.com"
+
+
+@pytest.fixture
+def executor():
+    return FetchExecutor(max_workers=2, rate_per_second=1000, burst=100, max_retries=2, backoff_seconds=0)
+
+
+def test_retries_rate_limit_and_server_errors(executor):
+    fetch = Flaky(HTTPError(429), HTTPError(502))
+
+    assert executor.call("api.test", fetch) == "ok"
+    assert fetch.calls == 3
+
+
+def test_gives_up_after_max_retries(executor):
+    fetch = Flaky(*[HTTPError(429)] * 3)
+
+    with pytest.raises(HTTPError):
+        executor.call("api.test", fetch)
+    assert fetch.calls == 3
+
+
+def test_does_not_retry_other_errors(executor):
+    fetch = Flaky(HTTPError(404))
+
+    with pytest.raises(HTTPError):
+        executor.call("api.test", fetch)
+    assert fetch.calls == 1
+
+
+def test_each_attempt_is_charged_against_the_host():
+    executor = FetchExecutor(max_workers=1, rate_per_second=10, burst=4, max_retries=1, backoff_seconds=0)
+    executor.call("slow.test", Flaky(HTTPError(429)), cost=2)
+
+    # Both attempts took two tokens: the other host still has its burst
+    _, other = elapsed(executor.call, "other.test", lambda: None, cost=4)
+    with pytest.raises(DeadlineExceeded):
+        executor.call("slow.test", lambda: None, cost=4, deadline=time.monotonic() + 0.1)
+    assert other < 0.03
+
+
+def test_map_keeps_order_and_nested_fan_out_does_not_deadlock():
+    executor = FetchExecutor(max_workers=1, rate_per_second=1000, burst=100)
+
+    def outer(n):
+        return sum(executor.map(lambda i: i * n, range(3)))
+
+    assert executor.map(outer, [1, 2, 3]) == [3, 6, 9]
@@ -0,0 +1,109 @@
+"""Tests for conditional feed fetching and the on-disk FeedCache."""
+import pytest
+
+from src.data.executor import FetchExecutor
+from src.data.feeds import FeedCache
+from src.data.providers import YFinanceProvider
+
+ITEMS = [
+    ("Stocks rally", "http://news.test/rally", 1760000000),
+    ("Oil slips", "http://news.test/oil", 1759990000),
+]
+
+
+@pytest.fixture
+def executor():
+    return FetchExecutor(max_workers=2, rate_per_second=1000, burst=100, max_retries=0, backoff_seconds=0)
+
+
+@pytest.fixture
+def provider():
+    return YFinanceProvider()
+
+
+def test_unchanged_feed_is_revalidated_with_etag(feed_server, executor, provider, tmp_path):
+    url = feed_server.publish("/top", "v1", ITEMS)
+    cache = FeedCache(root=tmp_path, min_interval=0, executor=executor)
+
+    first = cache.get(url, provider)
+    second = cache.get(url, provider)
+
+    assert [entry['title'] for entry in first] == ["Stocks rally", "Oil slips"]
+    assert second == first
+    # The second request was conditional and answered with a 304
+    assert feed_server.requests_for("/top") == ['', '"v1"']
+
+
+def test_validators_survive_a_restart(feed_server, executor, provider, tmp_path):
+    url = feed_server.publish("/top", "v1", ITEMS)
+    FeedCache(root=tmp_path, min_interval=0, executor=executor).get(url, provider)
+
+    restarted = FeedCache(root=tmp_path, min_interval=0, executor=executor)
+    entries = restarted.get(url, provider)
+
+    assert [entry['link'] for entry in entries] == ["http://news.test/rally", "http://news.test/oil"]
+    assert feed_server.requests_for("/top") == ['', '"v1"']
+
+
+def test_changed_feed_is_parsed_again(feed_server, executor, provider, tmp_path):
+    url = feed_server.publish("/top", "v1", ITEMS)
+    cache = FeedCache(root=tmp_path, min_interval=0, executor=executor)
+    cache.get(url, provider)
+
+    feed_server.publish("/top", "v2", [("Chips surge", "http://news.test/chips", 1760010000)] + ITEMS)
+    entries = cache.get(url, provider)
+
+    assert [entry['title'] for entry in entries] == ["Chips surge", "Stocks rally", "Oil slips"]
+    assert entries[0]['published_ts'] == 1760010000
+    assert feed_server.requests_for("/top") == ['', '"v1"']
+    assert cache.get(url, provider) == entries
+    assert feed_server.requests_for("/top")[-1] == '"v2"'
+
+
+def test_min_interval_suppresses_requests(feed_server, executor, provider, tmp_path):
+    url = feed_server.publish("/top", "v1", ITEMS)
+    cache = FeedCache(root=tmp_path, min_interval=60, executor=executor)
+
+    for _ in range(3):
+        cache.get(url, provider)
+
+    assert len(feed_server.requests_for("/top")) == 1
+    # A per-call interval overrides the cache's
+    cache.get(url, provider, min_interval=0)
+    assert len(feed_server.requests_for("/top")) == 2
+
+
+def test_cached_entries_are_served_when_the_server_is_down(feed_server, executor, provider, tmp_path):
+    url = feed_server.publish("/top", "v1", ITEMS)
+    cache = FeedCache(root=tmp_path, min_interval=0, executor=executor)
+    entries = cache.get(url, provider)
+
+    feed_server.shutdown()
+    feed_server.server_close()
+
+    assert cache.get(url, provider) == entries
+
+
+def test_failed_first_fetch_is_retried(feed_server, executor, provider, tmp_path):
+    url = feed_server.url("/late")
+    cache = FeedCache(root=tmp_path, min_interval=60, executor=executor)
+
+    assert cache.get(url, provider) == []
+    assert not list(tmp_path.glob("*.json"))
+
+    # Nothing was cached, so the next call requests the feed despite the interval
+    feed_server.publish("/late", "v1", ITEMS)
+    assert len(cache.get(url, provider)) == 2
+    assert feed_server.requests_for("/late") == ['', '']
+
+
+def test_invalidate_forgets_validators(feed_server, executor, provider, tmp_path):
+    url = feed_server.publish("/top", "v1", ITEMS)
+    cache = FeedCache(root=tmp_path, min_interval=0, executor=executor)
+    cache.get(url, provider)
+
+    cache.invalidate(url)
+
+    assert not list(tmp_path.glob("*.json"))
+    cache.get(url, provider)
+    assert feed_server.requests_for("/top") == ['', '']
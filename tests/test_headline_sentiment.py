@@ -0,0 +1,80 @@
+"""Tests for headline scoring, negation scope and the score cache."""
+import math
+import random
+
+import pytest
+
+from src.data.headline_sentiment import HeadlineScorer
+
+
+def squash(total):
+    return total / math.sqrt(total * total + 4.0)
+
+
+@pytest.mark.parametrize("headline, total", [
+    ("Apple profit beats estimates", 2),
+    ("Shares plunge after fraud probe", -5),
+    ("Company is not profitable", -1),
+    ("No sign of recovery yet", -1),
+    ("Retailer doesn’t expect growth", -1),
+    # Beyond the three-word window the negation no longer applies
+    ("Not that anyone expected a rally", 2),
+    # Punctuation ends the negation's scope
+    ("Chipmaker doesn't miss: profit soars", 4),
+    ("Never mind, tariffs hit stocks", -1),
+    ("Oil prices steady", 0),
+])
+def test_negation_scope(headline, total):
+    assert HeadlineScorer().score_text(headline) == pytest.approx(squash(total))
+
+
+def test_negation_does_not_carry_into_the_next_headline():
+    scores = HeadlineScorer().score_texts(["Guidance offers no", "Profit jumps"])
+
+    assert scores.tolist() == pytest.approx([0.0, squash(2)])
+
+
+def test_batches_score_like_single_headlines():
+    rng = random.Random(2)
+    words = "not no stocks rally profit miss fell, strong gains. never weak growth the of".split()
+    headlines = [" ".join(rng.choices(words, k=rng.randint(0, 9))) for _ in range(300)]
+    scorer = HeadlineScorer()
+
+    batch = scorer.score_texts(headlines)
+
+    assert batch.tolist() == pytest.approx([HeadlineScorer().score_text(text) for text in headlines])
+    assert all(-1 < score < 1 for score in batch)
+
+
+def test_scores_are_cached_by_article_id():
+    scorer = HeadlineScorer(capacity=2)
+    articles = [
+        {'id': "a", 'title': "Stocks rally"},
+        {'id': "b", 'title': "Stocks crash"},
+        {'title': "Profit rises"},
+    ]
+
+    scores = scorer.score_many(articles)
+    assert scores == pytest.approx([squash(2), squash(-2), squash(2)])
+    assert len(scorer) == 2
+
+    # A cached article is not rescored, even if its title changed
+    assert scorer.score_many([{'id': "a", 'title': "Stocks crash"}]) == pytest.approx([squash(2)])
+    # The oldest score is evicted once over capacity
+    scorer.score_many([{'id': "c", 'title': "Flat day"}])
+    assert scorer.score_many([{'id': "a", 'title': "Stocks crash"}]) == pytest.approx([squash(-2)])
+
+
+def test_summarize():
+    scorer = HeadlineScorer()
+
+    summary = scorer.summarize([
+        {'id': "a", 'title': "Stocks rally"},
+        {'id': "b", 'title': "Stocks slip"},
+        {'id': "c", 'title': "Markets open"},
+    ])
+
+    assert summary == {
+        'score': pytest.approx((squash(2) + squash(-1)) / 3), 'count': 3, 'positive': 1, 'negative': 1,
+    }
+    assert scorer.summarize([]) is None
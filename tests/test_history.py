@@ -0,0 +1,163 @@
+"""Tests for the on-disk OHLCV history store."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data import history
+from src.data.history import HistoryStore, period_start
+
+
+def ohlcv(index, start=100.0):
+    close = start + np.arange(len(index), dtype=float)
+    return pd.DataFrame({
+        'Open': close - 0.5, 'High': close + 1, 'Low': close - 1, 'Close': close,
+        'Volume': np.full(len(index), 1000.0),
+    }, index=index)
+
+
+class FakeHistory:
+    """Answers history downloads from a fixed series of bars, recording each request."""
+
+    def __init__(self, bars):
+        self.bars = bars
+        self.requests = []
+
+    def __call__(self, ticker, interval, period=None, start=None):
+        self.requests.append(('period', period) if period is not None else ('start', start))
+        if period is not None:
+            start = period_start(period, pd.Timestamp.now(tz='UTC'))
+        return self.bars if start is None else self.bars[self.bars.index >= start]
+
+    def add_bar(self, close):
+        """Append the next day's bar and revise the last one's close."""
+        index = self.bars.index.append(pd.DatetimeIndex([self.bars.index[-1] + pd.Timedelta(days=1)]))
+        bars = self.bars.reindex(index)
+        bars.iloc[-2, bars.columns.get_loc('Close')] += 0.25
+        bars.iloc[-1] = [close, close + 1, close - 1, close, 500.0]
+        self.bars = bars
+
+
+@pytest.fixture
+def daily():
+    # Two years of daily bars up to two days ago
+    end = pd.Timestamp.now(tz='America/New_York').normalize() - pd.Timedelta(days=2)
+    return FakeHistory(ohlcv(pd.date_range(end=end, periods=730, freq='D')))
+
+
+def test_backfill_downloads_a_year_for_short_daily_periods(tmp_path, daily):
+    store = HistoryStore(root=tmp_path)
+
+    bars = store.get("AAPL", "1mo", "1d", daily)
+
+    assert daily.requests == [('period', '1y')]
+    start = period_start('1mo', pd.Timestamp.now(tz='UTC'))
+    assert bars.index[0] >= start and bars.index[-1] == daily.bars.index[-1]
+    assert list(bars.columns) == ['Open', 'High', 'Low', 'Close', 'Volume']
+    # The rest of the year is stored for later
+    assert store.get("AAPL", "6mo", "1d", daily).index[0] < start
+    assert len(daily.requests) == 1
+
+
+def test_stale_series_appends_only_the_tail(tmp_path, daily, monkeypatch):
+    store = HistoryStore(root=tmp_path)
+    store.get("AAPL", "1y", "1d", daily)
+    last = daily.bars.index[-1]
+
+    daily.add_bar(999.0)
+    monkeypatch.setattr(history, 'TAIL_REFRESH_SECONDS', 0)
+    bars = store.get("AAPL", "1y", "1d", daily)
+
+    # The tail is requested from the last stored bar, which may have been revised
+    assert daily.requests[-1] == ('start', last.normalize())
+    assert bars['Close'].iloc[-1] == 999.0
+    assert bars.loc[last, 'Close'] == daily.bars.loc[last, 'Close']
+    assert not bars.index.duplicated().any()
+
+
+def test_failed_tail_fetch_serves_stored_bars(tmp_path, daily, monkeypatch):
+    store = HistoryStore(root=tmp_path)
+    stored = store.get("AAPL", "1y", "1d", daily)
+
+    monkeypatch.setattr(history, 'TAIL_REFRESH_SECONDS', 0)
+
+    def failing(ticker, interval, period=None, start=None):
+        raise ConnectionError("offline")
+
+    pd.testing.assert_frame_equal(store.get("AAPL", "1y", "1d", failing), stored)
+
+
+def test_store_survives_restart(tmp_path, daily):
+    stored = HistoryStore(root=tmp_path).get("AAPL", "1y", "1d", daily)
+
+    restarted = HistoryStore(root=tmp_path)
+    bars = restarted.get("AAPL", "1y", "1d", daily)
+
+    assert len(daily.requests) == 1
+    # Same bars, whatever datetime unit the index was stored with
+    assert bars.index.equals(stored.index)
+    np.testing.assert_array_equal(bars.to_numpy(), stored.to_numpy())
+    assert str(bars.index.tz) == "America/New_York"
+    assert restarted.last_timestamp("AAPL", "1d") == daily.bars.index[-1]
+
+    restarted.clear("AAPL")
+    assert restarted.last_timestamp("AAPL", "1d") is None
+    assert not list(tmp_path.glob("*.npz"))
+
+
+def test_shorter_periods_are_sliced_from_the_store(tmp_path, daily):
+    store = HistoryStore(root=tmp_path)
+    year = store.get("AAPL", "1y", "1d", daily)
+
+    month = store.get("AAPL", "1mo", "1d", daily)
+    week = store.get("AAPL", "5d", "1d", daily)
+
+    assert len(daily.requests) == 1
+    pd.testing.assert_frame_equal(month, year[year.index >= month.index[0]])
+    assert len(week) == 5 and week.index[-1] == year.index[-1]
+
+
+@pytest.fixture
+def five_minute():
+    # Six sessions of 5-minute bars, 9:30 to 16:00 New York time
+    today = pd.Timestamp.now(tz='America/New_York').normalize()
+    days = pd.bdate_range(end=today - pd.Timedelta(days=1), periods=6)
+    sessions = [pd.date_range(day + pd.Timedelta(hours=9, minutes=30), periods=78, freq='5min') for day in days]
+    index = sessions[0].append(sessions[1:])
+    return FakeHistory(ohlcv(index))
+
+
+def test_coarser_intervals_are_resampled_from_finer_bars(tmp_path, five_minute):
+    store = HistoryStore(root=tmp_path)
+    fine = store.get("AAPL", "5d", "5m", five_minute)
+
+    hourly = store.get("AAPL", "5d", "1h", five_minute)
+    daily = store.get("AAPL", "5d", "1d", five_minute)
+
+    assert five_minute.requests == [('period', '5d')]
+    # Hourly bins start at the open, like the provider's own hourly bars
+    first_day = hourly[hourly.index.normalize() == hourly.index[0].normalize()]
+    assert [t.strftime('%H:%M') for t in first_day.index] == [
+        "09:30", "10:30", "11:30", "12:30", "13:30", "14:30", "15:30"
+    ]
+    first_hour = fine.iloc[:12]
+    assert hourly.iloc[0].to_dict() == {
+        'Open': first_hour['Open'].iloc[0], 'High': first_hour['High'].max(),
+        'Low': first_hour['Low'].min(), 'Close': first_hour['Close'].iloc[-1],
+        'Volume': first_hour['Volume'].sum(),
+    }
+    assert len(daily) == 5
+    assert daily['Volume'].sum() == fine['Volume'].sum()
+    assert daily['Close'].iloc[-1] == fine['Close'].iloc[-1]
+
+
+def test_weekly_bars_are_resampled_from_daily(tmp_path, daily):
+    store = HistoryStore(root=tmp_path)
+    days = store.get("AAPL", "1y", "1d", daily)
+
+    weeks = store.get("AAPL", "1y", "1wk", daily)
+
+    assert len(daily.requests) == 1
+    assert (weeks.index.dayofweek == 0).all()
+    assert weeks['Volume'].sum() == days['Volume'].sum()
+    assert weeks['High'].max() == days['High'].max()
+    assert weeks['Close'].iloc[-1] == days['Close'].iloc[-1]
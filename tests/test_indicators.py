@@ -0,0 +1,99 @@
+"""Tests that cached, incremental indicators agree with a full computation."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.indicators import INDICATORS, RSI, IndicatorCache, parse_indicator
+
+SPECS = ["sma:5", "ema:8", "rsi:6", "macd:4,9,3", "bb:5,2", "vwap", "atr:5"]
+
+
+def make_bars(periods, interval="1h", seed=3):
+    """Random-walk OHLCV bars; hourly bars span several sessions."""
+    rng = np.random.default_rng(seed)
+    freq = "h" if interval == "1h" else "D"
+    index = pd.date_range("2026-09-01 09:00", periods=periods, freq=freq, tz="America/New_York")
+    close = 100 + np.cumsum(rng.normal(0, 1, periods))
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.3, periods),
+        'High': close + rng.uniform(0.1, 1, periods),
+        'Low': close - rng.uniform(0.1, 1, periods),
+        'Close': close,
+        'Volume': rng.integers(1_000, 10_000, periods).astype(float),
+    }, index=index)
+
+
+def full(bars, interval="1h"):
+    return IndicatorCache().compute("T", "1mo", interval, bars, [parse_indicator(spec) for spec in SPECS])
+
+
+def assert_same(actual, expected):
+    assert actual.keys() == expected.keys()
+    for key, frame in expected.items():
+        pd.testing.assert_frame_equal(actual[key], frame, check_exact=False, rtol=1e-9, obj=str(key))
+
+
+def test_every_indicator_is_covered():
+    assert {parse_indicator(spec).name for spec in SPECS} == set(INDICATORS)
+
+
+@pytest.mark.parametrize("interval", ["1h", "1d"])
+def test_incremental_refreshes_match_full_computation(interval):
+    bars = make_bars(120, interval)
+    cache = IndicatorCache()
+    indicators = [parse_indicator(spec) for spec in SPECS]
+
+    cache.compute("T", "1mo", interval, bars.iloc[:60], indicators)
+    # Appended bars
+    assert_same(cache.compute("T", "1mo", interval, bars.iloc[:90], indicators), full(bars.iloc[:90], interval))
+
+    # A revised last bar plus new ones, fetched as a tail overlapping the cache
+    revised = bars.copy()
+    revised.iloc[89, revised.columns.get_loc('Close')] += 2.5
+    tail = revised.iloc[80:]
+    assert_same(cache.compute("T", "1mo", interval, tail, indicators), {
+        key: frame.iloc[80:] for key, frame in full(revised, interval).items()
+    })
+    # Re-reading the same bars computes nothing new and returns the same values
+    assert_same(cache.compute("T", "1mo", interval, revised, indicators), full(revised, interval))
+
+
+def test_results_do_not_depend_on_the_period_viewed_first():
+    bars = make_bars(120)
+    recent = bars.iloc[60:]
+    cache = IndicatorCache()
+    indicators = [parse_indicator("ema:8"), parse_indicator("vwap")]
+
+    cache.compute("T", "3mo", "1h", bars, indicators)
+    shorter = cache.compute("T", "1mo", "1h", recent, indicators)
+
+    expected = IndicatorCache().compute("T", "1mo", "1h", recent, indicators)
+    assert_same(shorter, expected)
+
+
+def test_history_reaching_further_back_reseeds():
+    bars = make_bars(120, "1d")
+    cache = IndicatorCache()
+    ema = [parse_indicator("ema:8")]
+
+    cache.compute("T", "1mo", "1d", bars.iloc[60:], ema)
+    assert_same(cache.compute("T", "1mo", "1d", bars, ema), IndicatorCache().compute("T", "1mo", "1d", bars, ema))
+
+
+def test_rsi_of_a_flat_series_is_neutral():
+    bars = make_bars(30, "1d")
+    bars['Close'] = 50.0
+
+    rsi = IndicatorCache().compute("T", "1mo", "1d", bars, [RSI(14)])[RSI(14).key]['rsi']
+
+    assert rsi.iloc[:14].isna().all()
+    assert (rsi.iloc[14:] == 50).all()
+
+
+def test_rsi_without_losses_is_100():
+    bars = make_bars(30, "1d")
+    bars['Close'] = np.arange(30.0) + 10
+
+    rsi = IndicatorCache().compute("T", "1mo", "1d", bars, [RSI(14)])[RSI(14).key]['rsi']
+
+    assert (rsi.iloc[14:] == 100).all()
@@ -0,0 +1,87 @@
+"""Tests that the incremental top-K engine agrees with sorting the universe."""
+import random
+
+from src.data import movers
+from src.data.movers import MoversEngine, TopK
+from src.data.stocks import QuoteTable
+
+
+def expected_top(values, k):
+    return sorted(((value, key) for key, value in values.items()), reverse=True)[:k]
+
+
+def test_top_k_matches_a_full_sort_under_random_updates(monkeypatch):
+    # Compact often so rebuilt heaps are exercised too
+    monkeypatch.setattr(movers, 'COMPACT_FACTOR', 1)
+    rng = random.Random(11)
+    k = 5
+    top = TopK(k)
+    values = {}
+
+    for step in range(5000):
+        key = f"S{rng.randrange(60)}"
+        if rng.random() < 0.1:
+            top.remove(key)
+            values.pop(key, None)
+        else:
+            # Coarse values, so ties are common
+            value = rng.randint(-20, 20) / 2
+            top.update(key, value)
+            values[key] = value
+
+        ranked = top.top()
+        expected = expected_top(values, k)
+        assert len(top) == len(values)
+        assert [value for _, value in ranked] == [value for value, _ in expected], step
+        # Keys tied with the k-th value may be either side of the cut
+        if expected:
+            cut = expected[-1][0]
+            assert {key for key, value in ranked if value > cut} == {key for value, key in expected if value > cut}
+
+
+def test_top_k_with_fewer_keys_than_k():
+    top = TopK(3)
+    top.update("A", 1.0)
+    top.update("B", 2.0)
+
+    assert top.top() == [("B", 2.0), ("A", 1.0)]
+    top.remove("B")
+    top.remove("missing")
+    assert top.top() == [("A", 1.0)]
+
+
+def test_gainers_and_losers_exclude_the_other_side():
+    engine = MoversEngine(k=2)
+    engine.update_quotes([
+        {'symbol': "UP", 'price': 10.0, 'change_percent': 5.0},
+        {'symbol': "UP2", 'price': 20.0, 'change_percent': 1.0},
+        {'symbol': "FLAT", 'price': 30.0, 'change_percent': 0.0},
+        {'symbol': "DOWN", 'price': 40.0, 'change_percent': -3.0},
+    ])
+
+    assert engine.gainers() == [("UP", 10.0, 5.0), ("UP2", 20.0, 1.0)]
+    assert engine.losers() == [("DOWN", 40.0, -3.0)]
+
+    # A reversal moves a symbol from one list to the other
+    engine.update("UP", 9.0, -8.0)
+    assert engine.gainers() == [("UP2", 20.0, 1.0)]
+    assert engine.losers() == [("UP", 9.0, -8.0), ("DOWN", 40.0, -3.0)]
+
+    engine.remove("UP")
+    assert engine.losers() == [("DOWN", 40.0, -3.0)] and len(engine) == 3
+
+
+def test_update_table_matches_quote_updates():
+    quotes = [
+        {'symbol': f"S{i}", 'price': 10.0 + i, 'change': 0.0, 'change_percent': (i * 7 % 11) - 5.0,
+         'volume': 0, 'market_cap': 0}
+        for i in range(30)
+    ]
+    from_table, from_quotes = MoversEngine(k=4), MoversEngine(k=4)
+
+    from_table.update_table(QuoteTable.from_quotes(quotes))
+    from_quotes.update_quotes(quotes)
+
+    assert from_table.gainers() == from_quotes.gainers()
+    assert from_table.losers() == from_quotes.losers()
+    assert len(from_table.gainers()) == 4
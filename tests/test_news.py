@@ -0,0 +1,224 @@
+"""Tests for news aggregation, deduplication, the seen-headline index and the ticker news cache."""
+from concurrent.futures import wait
+from datetime import timedelta
+import threading
+import time
+
+import pytest
+
+from src.data.cache import TTLCache
+from src.data.executor import FetchExecutor
+from src.data.feeds import FeedCache
+from src.data.news import NewsAggregator, NewsFetcher, SeenIndex, article_key
+from src.data.providers import YFinanceProvider
+
+
+@pytest.fixture
+def executor():
+    return FetchExecutor(max_workers=4, rate_per_second=1000, burst=100, max_retries=0, backoff_seconds=0)
+
+
+@pytest.fixture
+def aggregator(executor, tmp_path):
+    feeds = FeedCache(root=tmp_path, min_interval=0, executor=executor)
+    return NewsAggregator(YFinanceProvider(), feeds, executor)
+
+
+def entry(title, link, published_ts):
+    return {'title': title, 'link': link, 'summary': '', 'published': '', 'published_ts': published_ts}
+
+
+def test_article_key_ignores_tracking_and_case():
+    assert article_key("https://News.test/a/?utm=1#top") == article_key("https://news.test/a")
+    assert article_key("https://news.test/a") != article_key("https://news.test/b")
+    assert article_key(title="Stocks  Rally ") == article_key(title="stocks rally")
+    assert article_key("https://news.test/a").startswith("u:")
+    assert article_key(title="Stocks rally").startswith("t:")
+
+
+def test_merge_dedupes_newest_first():
+    feeds = [
+        ("https://feeds.test/a", [
+            entry("Oil slips", "https://news.test/oil?src=a", 100),
+            entry("Chips surge", "https://news.test/chips", 300),
+        ]),
+        ("https://feeds.test/b", [
+            # Same story with other tracking parameters, and a syndicated copy
+            entry("Oil slips", "https://news.test/oil?src=b", 100),
+            entry("Chips Surge", "https://mirror.test/chips", 250),
+            entry("Fed holds", "", 200),
+        ]),
+    ]
+
+    articles = NewsAggregator().merge(feeds, limit=10)
+
+    assert [article['title'] for article in articles] == ["Chips surge", "Fed holds", "Oil slips"]
+    assert articles[0]['source'] == "feeds.test"
+    assert articles[1]['id'] == article_key(title="Fed holds")
+    assert len(NewsAggregator().merge(feeds, limit=2)) == 2
+
+
+def test_merge_reuses_unchanged_articles():
+    aggregator = NewsAggregator()
+    feeds = [("https://feeds.test/a", [entry("Oil slips", "https://news.test/oil", 100)])]
+
+    first = aggregator.merge(feeds, limit=10)
+    second = aggregator.merge(feeds, limit=10)
+
+    assert second[0] is first[0]
+
+
+def test_aggregate_merges_feeds_from_server(feed_server, aggregator):
+    urls = [
+        feed_server.publish("/top", "t1", [
+            ("Stocks rally", "http://news.test/rally?f=top", 1760000300),
+            ("Oil slips", "http://news.test/oil", 1760000100),
+        ]),
+        feed_server.publish("/aapl", "a1", [
+            ("Apple beats", "http://news.test/apple", 1760000200),
+            ("Stocks rally", "http://news.test/rally?f=aapl", 1760000300),
+        ]),
+        feed_server.url("/missing"),
+    ]
+
+    articles = aggregator.aggregate(urls, limit=10, time_budget=5)
+    again = aggregator.aggregate(urls, limit=10, time_budget=5)
+
+    assert [article['title'] for article in articles] == ["Stocks rally", "Apple beats", "Oil slips"]
+    assert again == articles
+    # The second refresh was conditional for both feeds
+    assert feed_server.requests_for("/top") == ['', '"t1"']
+    assert feed_server.requests_for("/aapl") == ['', '"a1"']
+
+
+class SlowProvider:
+    """Answers feed requests at once, except for URLs containing "slow" which wait to be released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def fetch_feed(self, url, etag=None, modified=None):
+        if "slow" in url:
+            self.release.wait(5)
+        title = url.rsplit('/', 1)[-1]
+        return {
+            'status': 200, 'etag': None, 'modified': None, 'ttl': None,
+            'entries': [{'title': title, 'link': f"https://news.test/{title}", 'id': title}],
+        }
+
+
+def test_aggregate_returns_what_arrived_within_budget(executor, tmp_path):
+    provider = SlowProvider()
+    aggregator = NewsAggregator(provider, FeedCache(root=tmp_path, min_interval=0, executor=executor), executor)
+    try:
+        articles = aggregator.aggregate(
+            ["https://feeds.test/fast", "https://feeds.test/slow"], limit=10, time_budget=0.3
+        )
+    finally:
+        provider.release.set()
+
+    assert [article['title'] for article in articles] == ["fast"]
+
+
+def test_seen_index_stays_full_under_resightings(tmp_path):
+    index = SeenIndex(capacity=3, path=tmp_path / "seen.json")
+
+    assert index.add_many(["a", "b", "c"]) == {"a", "b", "c"}
+    # Seeing a key again neither shrinks the index nor reports it as new
+    assert index.add_many(["a", "a", "b"]) == set()
+    assert len(index) == 3
+    # The least recently seen key is evicted first
+    assert index.add_many(["d"]) == {"d"}
+    assert "c" not in index
+    assert all(key in index for key in ("a", "b", "d"))
+
+
+def test_seen_index_persists(tmp_path):
+    path = tmp_path / "seen.json"
+    SeenIndex(capacity=3, path=path).add_many(["a", "b", "c", "d"])
+
+    restored = SeenIndex(capacity=3, path=path)
+
+    assert len(restored) == 3
+    assert "a" not in restored
+    assert restored.add_many(["b", "e"]) == {"e"}
+
+
+def test_seen_index_appends_only_new_keys(tmp_path):
+    path = tmp_path / "seen.jsonl"
+    index = SeenIndex(capacity=3, path=path)
+    index.add_many(["a", "b"])
+
+    index.add_many(["a", "b", "c"])
+    assert path.read_text().splitlines() == ['"a"', '"b"', '"c"']
+    # A batch with nothing new does not touch the file
+    mtime = path.stat().st_mtime_ns
+    index.add_many(["c", "a"])
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_seen_index_log_is_compacted(tmp_path):
+    path = tmp_path / "seen.jsonl"
+    index = SeenIndex(capacity=3, path=path)
+    for i in range(20):
+        index.add_many([f"k{i}"])
+        # The log never grows past twice the capacity
+        assert len(path.read_text().splitlines()) <= 6
+
+    restored = SeenIndex(capacity=3, path=path)
+    assert restored.add_many(["k17", "k18", "k19", "k0"]) == {"k0"}
+
+
+def test_seen_index_skips_a_torn_last_line(tmp_path):
+    path = tmp_path / "seen.jsonl"
+    path.write_text('"a"\n"b"\n"c')
+
+    index = SeenIndex(capacity=3, path=path)
+
+    assert "a" in index and "b" in index and "c" not in index
+
+
+class CountingProvider:
+    """Serves one headline per feed and counts the requests."""
+
+    def __init__(self):
+        self.requests = 0
+
+    def fetch_feed(self, url, etag=None, modified=None):
+        self.requests += 1
+        return {
+            'status': 200, 'etag': None, 'modified': None, 'ttl': None,
+            'entries': [{'title': f"Update {self.requests}", 'link': f"https://news.test/{self.requests}"}],
+        }
+
+
+@pytest.fixture
+def news_fetcher(executor, tmp_path):
+    provider = CountingProvider()
+    feeds = FeedCache(root=tmp_path, min_interval=0, executor=executor)
+    return NewsFetcher(provider=provider, feeds=feeds, cache=TTLCache(ttls={'news': timedelta(seconds=0.6)}))
+
+
+def test_refresh_reloads_cached_ticker_news(news_fetcher):
+    first = news_fetcher.get_ticker_news("AAPL")
+
+    assert news_fetcher.get_ticker_news("AAPL") == first
+    assert news_fetcher.get_ticker_news("AAPL", refresh=True) != first
+    assert news_fetcher.provider.requests == 2
+
+
+def test_rewarming_keeps_ticker_news_cached_past_its_ttl(news_fetcher):
+    cache = news_fetcher._cache
+    ttl = cache.ttl_for('news')
+    wait(news_fetcher.warm_ticker_news(["AAPL", "MSFT"]))
+    assert news_fetcher.warm_ticker_news(["AAPL", "MSFT"]) == []
+
+    # As DashboardScreen does: every third of the TTL, reload what is past half of it
+    deadline = time.monotonic() + 3 * ttl
+    while time.monotonic() < deadline:
+        time.sleep(ttl / 3)
+        assert cache.get(('news', "AAPL")) is not None
+        assert cache.get(('news', "MSFT")) is not None
+        wait(news_fetcher.warm_ticker_news(["AAPL", "MSFT"], refresh_within=ttl / 2))
+
+    assert news_fetcher.provider.requests > 2
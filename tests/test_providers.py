@@ -0,0 +1,117 @@
+"""Tests for recording and replaying provider responses."""
+from datetime import datetime
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.providers import RecordingProvider, ReplayProvider
+
+
+def daily_bars(symbols):
+    index = pd.date_range("2026-10-12", periods=3, freq="D", tz="America/New_York", name="Date")
+    frame = pd.concat({
+        symbol: pd.DataFrame(
+            {'Open': [10.0, np.nan, 11.0], 'Close': [10.5, np.nan, 11.5], 'Volume': [100, 200, 300]},
+            index=index,
+        )
+        for symbol in symbols
+    }, axis=1)
+    frame.columns.names = ["Ticker", "Price"]
+    return frame
+
+
+class LiveProvider:
+    """Stands in for the network, counting calls and the validators sent."""
+
+    name = "live"
+
+    def __init__(self):
+        self.feed_requests = []
+
+    def get_info(self, symbol):
+        return {'symbol': symbol, 'currentPrice': 190.5, 'exDividendDate': datetime(2026, 8, 11)}
+
+    def get_history(self, symbol, interval, period=None, start=None):
+        return daily_bars([symbol])[symbol]
+
+    def get_bars(self, symbols, period, interval):
+        return daily_bars(symbols)
+
+    def get_news(self, symbol):
+        return [{'title': f"{symbol} beats", 'providerPublishTime': 1760000000}]
+
+    def get_feed(self, url):
+        return []
+
+    def fetch_feed(self, url, etag=None, modified=None):
+        self.feed_requests.append(etag)
+        if etag == '"v1"':
+            return {'status': 304, 'etag': '"v1"', 'modified': None, 'ttl': None, 'entries': []}
+        return {
+            'status': 200, 'etag': '"v1"', 'modified': None, 'ttl': '5',
+            'entries': [{'title': "Stocks rally", 'published_parsed': time.gmtime(1760000000)}],
+        }
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    return RecordingProvider(LiveProvider(), tmp_path)
+
+
+def test_replay_returns_recorded_frames(recorder, tmp_path):
+    bars = recorder.get_bars(["AAPL", "MSFT"], "5d", "1d")
+    history = recorder.get_history("AAPL", "1d", period="5d")
+
+    replay = ReplayProvider(tmp_path)
+
+    pd.testing.assert_frame_equal(replay.get_bars(["AAPL", "MSFT"], "5d", "1d"), bars, check_freq=False)
+    pd.testing.assert_frame_equal(replay.get_history("AAPL", "1d", period="5d"), history, check_freq=False)
+
+
+def test_replay_returns_recorded_payloads(recorder, tmp_path):
+    recorder.get_info("AAPL")
+    recorder.get_news("AAPL")
+
+    replay = ReplayProvider(tmp_path)
+
+    info = replay.get_info("AAPL")
+    assert info['currentPrice'] == 190.5
+    # Types JSON lacks are kept as text
+    assert info['exDividendDate'] == "2026-08-11 00:00:00"
+    assert replay.get_news("AAPL") == [{'title': "AAPL beats", 'providerPublishTime': 1760000000}]
+
+
+def test_recordings_are_json_not_pickle(recorder, tmp_path):
+    recorder.get_bars(["AAPL"], "5d", "1d")
+
+    paths = list(tmp_path.glob("*/*"))
+    assert paths and all(path.suffix == ".json" for path in paths)
+
+
+def test_replay_falls_back_to_latest_recording_of_subject(recorder, tmp_path):
+    recorder.get_history("AAPL", "1d", start="2026-10-01")
+
+    # A tail fetch from another start time has no exact recording
+    replayed = ReplayProvider(tmp_path).get_history("AAPL", "1d", start="2026-10-12")
+
+    assert len(replayed) == 3
+    with pytest.raises(LookupError):
+        ReplayProvider(tmp_path).get_history("MSFT", "1d", start="2026-10-12")
+
+
+def test_feed_recording_stays_conditional(recorder, tmp_path):
+    live = recorder.delegate
+
+    # Validators from an earlier live run are dropped until a full copy is saved
+    first = recorder.fetch_feed("https://feeds.test/top", etag='"v1"')
+    second = recorder.fetch_feed("https://feeds.test/top", etag='"v1"')
+
+    assert live.feed_requests == [None, '"v1"']
+    assert first['status'] == 200 and second['status'] == 304
+
+    replayed = ReplayProvider(tmp_path).fetch_feed("https://feeds.test/top", etag='"v1"')
+    assert replayed['status'] == 200
+    assert replayed['entries'][0]['title'] == "Stocks rally"
+    assert tuple(replayed['entries'][0]['published_parsed'])[:6] == (2025, 10, 9, 8, 53, 20)
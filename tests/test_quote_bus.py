@@ -0,0 +1,142 @@
+"""Tests for the quote bus and the polling producer."""
+import threading
+
+from src.data.quote_bus import PollingQuoteProducer, QuoteBus
+
+
+def quote(symbol, price):
+    return {'symbol': symbol, 'price': price, 'change': 0.0, 'change_percent': 0.0}
+
+
+class Recorder:
+    """Records every batch delivered to it."""
+
+    def __init__(self):
+        self.batches = []
+        self.delivered = threading.Event()
+
+    def __call__(self, batch):
+        self.batches.append(batch)
+        self.delivered.set()
+
+    def prices(self):
+        return [{symbol: q['price'] for symbol, q in batch.items()} for batch in self.batches]
+
+
+def test_bursts_are_coalesced_per_subscriber():
+    # A long window: batches go out when the test flushes
+    bus = QuoteBus(coalesce_seconds=60)
+    apple, both = Recorder(), Recorder()
+    bus.subscribe(["AAPL"], apple)
+    bus.subscribe(["AAPL", "MSFT"], both)
+
+    bus.publish(quote("AAPL", 1.0))
+    bus.publish_many([quote("AAPL", 2.0), quote("MSFT", 3.0), quote("NVDA", 4.0)])
+    bus.flush()
+
+    assert apple.prices() == [{"AAPL": 2.0}]
+    assert both.prices() == [{"AAPL": 2.0, "MSFT": 3.0}]
+    assert bus.latest("NVDA")['price'] == 4.0
+
+
+def test_timer_delivers_on_the_bus_thread():
+    bus = QuoteBus(coalesce_seconds=0.01)
+    received = Recorder()
+    bus.subscribe(["AAPL"], received)
+
+    bus.publish(quote("AAPL", 1.0))
+
+    assert received.delivered.wait(5)
+    assert received.prices() == [{"AAPL": 1.0}]
+
+
+def test_new_and_changed_subscriptions_get_the_latest_quotes():
+    bus = QuoteBus(coalesce_seconds=60)
+    bus.publish_many([quote("AAPL", 1.0), quote("MSFT", 2.0)])
+    bus.flush()
+
+    received = Recorder()
+    subscription = bus.subscribe(["AAPL"], received)
+    bus.flush()
+    subscription.update_symbols(["MSFT", "TSLA"])
+    bus.flush()
+
+    assert received.prices() == [{"AAPL": 1.0}, {"MSFT": 2.0}]
+
+
+def test_interest_follows_subscriptions():
+    bus = QuoteBus(coalesce_seconds=60)
+    changes = []
+    bus.add_interest_listener(changes.append)
+    received = Recorder()
+
+    first = bus.subscribe(["AAPL", "MSFT"], received)
+    second = bus.subscribe(["MSFT", "TSLA"], Recorder())
+    assert bus.symbols() == {"AAPL", "MSFT", "TSLA"}
+
+    first.close()
+    assert bus.symbols() == {"MSFT", "TSLA"}
+    second.update_symbols(["NVDA"])
+    assert bus.symbols() == {"NVDA"}
+    assert changes == [{"AAPL", "MSFT"}, {"MSFT", "TSLA"}, set(), {"NVDA"}]
+
+    # A closed subscription receives nothing more
+    bus.publish(quote("AAPL", 1.0))
+    bus.flush()
+    assert received.batches == []
+
+
+def test_failing_subscriber_does_not_block_others():
+    bus = QuoteBus(coalesce_seconds=60)
+    received = Recorder()
+
+    def broken(batch):
+        raise RuntimeError("widget unmounted")
+
+    bus.subscribe(["AAPL"], broken)
+    bus.subscribe(["AAPL"], received)
+    bus.publish(quote("AAPL", 1.0))
+    bus.flush()
+
+    assert received.prices() == [{"AAPL": 1.0}]
+
+
+class FakeFetcher:
+    """Quotes every requested symbol at a fixed price, recording each request."""
+
+    def __init__(self):
+        self.requests = []
+
+    def get_quotes(self, tickers):
+        self.requests.append(list(tickers))
+        return {ticker: quote(ticker, 10.0) for ticker in tickers}
+
+
+def test_poller_fetches_the_watched_symbols_in_one_request():
+    bus = QuoteBus(coalesce_seconds=60)
+    fetcher = FakeFetcher()
+    producer = PollingQuoteProducer(bus, fetcher, interval=3600)
+    received = Recorder()
+
+    producer.poll_once()
+    bus.subscribe(["MSFT", "AAPL"], received)
+    bus.subscribe(["AAPL"], Recorder())
+    producer.poll_once()
+    bus.flush()
+
+    assert fetcher.requests == [["AAPL", "MSFT"]]
+    assert received.prices() == [{"AAPL": 10.0, "MSFT": 10.0}]
+
+
+def test_subscribing_wakes_the_poller():
+    bus = QuoteBus(coalesce_seconds=0.01)
+    producer = PollingQuoteProducer(bus, FakeFetcher(), interval=3600)
+    producer.start()
+    try:
+        received = Recorder()
+        bus.subscribe(["AAPL"], received)
+
+        # Polled right away, not after the hour-long interval
+        assert received.delivered.wait(5)
+    finally:
+        producer.stop()
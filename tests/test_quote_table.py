@@ -0,0 +1,75 @@
+"""Tests for the columnar QuoteTable."""
+import numpy as np
+import pytest
+
+from src.data.stocks import QuoteTable
+
+
+def quote(symbol, change_percent, volume=1000, market_cap=0):
+    return {
+        'symbol': symbol, 'price': 100.0 + change_percent, 'change': change_percent,
+        'change_percent': change_percent, 'volume': volume, 'market_cap': market_cap,
+    }
+
+
+def test_rows_grow_past_the_initial_capacity():
+    table = QuoteTable(["AAA", "BBB"])
+    symbols = [f"S{i:03d}" for i in range(100)]
+
+    table.update_many(quote(symbol, i / 10, volume=i) for i, symbol in enumerate(symbols))
+
+    assert len(table) == 102 and table.row("S000") == 2
+    assert table.get("S099") == {
+        'symbol': "S099", 'price': 109.9, 'change': 9.9, 'change_percent': 9.9, 'volume': 99, 'market_cap': 0.0,
+    }
+    assert table.column('volume').dtype == np.int64
+    np.testing.assert_array_equal(table.column('volume')[2:], np.arange(100))
+
+
+def test_symbols_without_quotes_are_left_out():
+    table = QuoteTable(["AAA", "BBB", "CCC"])
+    table.update_quote(quote("BBB", 1.0))
+
+    assert "AAA" in table and table.get("AAA") is None
+    assert "ZZZ" not in table and table.get("ZZZ") is None
+    assert table.valid_rows().tolist() == [1]
+    assert table.sort() == ["BBB"]
+
+
+def test_updates_happen_in_place():
+    table = QuoteTable.from_quotes([quote("AAA", 1.0, market_cap=5e9)])
+    row = table.row("AAA")
+
+    # A quote without a market cap keeps the known one
+    assert table.update_quote(quote("AAA", -2.0)) == row
+    assert table.get("AAA")['change_percent'] == -2.0
+    assert table.get("AAA")['market_cap'] == 5e9
+    table.update("AAA", volume=7, unknown=1)
+    assert table.get("AAA")['volume'] == 7
+
+
+def test_columns_are_read_only_views():
+    table = QuoteTable.from_quotes([quote("AAA", 1.0), quote("BBB", 2.0)])
+    view = table.column('change_percent')
+
+    with pytest.raises(ValueError):
+        view[0] = 99.0
+    # The table itself stays writable
+    table.update_quote(quote("AAA", 3.0))
+    assert table.column('change_percent').tolist() == [3.0, 2.0]
+    assert len(view) == 2
+
+
+def test_ranking():
+    table = QuoteTable.from_quotes(
+        quote(symbol, change, volume) for symbol, change, volume in [
+            ("UP", 4.0, 10), ("DOWN", -6.0, 30), ("FLAT", 0.0, 20), ("TIE", 4.0, 5),
+        ]
+    )
+
+    assert table.sort() == ["TIE", "UP", "FLAT", "DOWN"]
+    assert table.top_k(2) == ["UP", "TIE"]
+    assert table.top_k(2, largest=False) == ["DOWN", "FLAT"]
+    assert table.top_k(1, absolute=True) == ["DOWN"]
+    assert table.top_k(10, by='volume') == ["DOWN", "FLAT", "UP", "TIE"]
+    assert table.top_k(0) == [] and QuoteTable().top_k(3) == []
@@ -0,0 +1,146 @@
+"""Tests for universe loading and the market scanner."""
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from src.data.cache import TTLCache
+from src.data.executor import YAHOO_HOST, FetchExecutor
+from src.data.scanner import MarketScanner, available_universes, load_universe, rank_quotes
+from src.data.stocks import QuoteTable, StockDataFetcher
+
+
+def quote(symbol, change_percent, volume):
+    return {
+        'symbol': symbol,
+        'price': 100.0 + change_percent,
+        'change': change_percent,
+        'change_percent': change_percent,
+        'volume': volume,
+        'market_cap': 0,
+    }
+
+
+class FakeFetcher:
+    """Serves quotes from a dictionary; chunks holding a symbol in ``slow`` block until released."""
+
+    def __init__(self, quotes, slow=()):
+        self.quotes = quotes
+        self.slow = set(slow)
+        self.release = threading.Event()
+        self.chunks = []
+
+    def get_quotes(self, tickers, deadline=None):
+        self.chunks.append(list(tickers))
+        if self.slow.intersection(tickers):
+            self.release.wait(5)
+        return {ticker: self.quotes[ticker] for ticker in tickers if ticker in self.quotes}
+
+
+@pytest.fixture
+def executor():
+    return FetchExecutor(max_workers=4, rate_per_second=1000, burst=100, max_retries=0, backoff_seconds=0)
+
+
+def test_load_universe_normalizes_symbols(tmp_path):
+    path = tmp_path / "index.csv"
+    path.write_text("Company,Ticker\nApple,aapl\nBerkshire,BRK.B\nApple again,AAPL\nBlank, \nMicrosoft,MSFT\n")
+
+    assert load_universe(str(path)) == ["AAPL", "BRK-B", "MSFT"]
+
+
+def test_bundled_universes_load():
+    assert {"dow30", "nasdaq100"} <= set(available_universes())
+    assert len(load_universe("DOW30")) == 30
+
+
+def test_unknown_universe_raises():
+    with pytest.raises(FileNotFoundError, match="bundled"):
+        load_universe("no-such-index")
+
+
+def test_rank_quotes():
+    table = QuoteTable()
+    table.update_many([
+        quote("UP", 4.0, 100), quote("UP2", 1.0, 900), quote("DOWN", -3.0, 500), quote("FLAT", 0.0, 50),
+    ])
+
+    ranked = rank_quotes(table, top=3)
+
+    assert [m[0] for m in ranked['gainers']] == ["UP", "UP2"]
+    assert [m[0] for m in ranked['losers']] == ["DOWN"]
+    assert [m[0] for m in ranked['most_active']] == ["UP2", "DOWN", "UP"]
+    assert ranked['gainers'][0] == ("UP", 104.0, 4.0, 100)
+
+
+def test_scan_ranks_every_chunk(executor):
+    symbols = [f"S{i:02d}" for i in range(25)]
+    fetcher = FakeFetcher({s: quote(s, i - 12.0, i * 10) for i, s in enumerate(symbols)})
+
+    result = MarketScanner(fetcher, executor).scan(symbols + ["GONE"], top=2, chunk_size=10)
+
+    assert sorted(map(len, fetcher.chunks)) == [6, 10, 10]
+    assert result['complete'] and result['scanned'] == 25 and result['total'] == 26
+    assert [m[0] for m in result['gainers']] == ["S24", "S23"]
+    assert [m[0] for m in result['losers']] == ["S00", "S01"]
+    assert [m[0] for m in result['most_active']] == ["S24", "S23"]
+
+
+def test_scan_returns_partial_result_after_budget(executor):
+    symbols = ["A", "B", "SLOW", "C"]
+    fetcher = FakeFetcher({s: quote(s, 1.0, 10) for s in symbols}, slow={"SLOW"})
+    progress = []
+    try:
+        result = MarketScanner(fetcher, executor).scan(
+            symbols, chunk_size=2, time_budget=0.3, on_progress=progress.append
+        )
+    finally:
+        fetcher.release.set()
+
+    assert not result['complete']
+    assert result['scanned'] == 2
+    assert {m[0] for m in result['gainers']} == {"A", "B"}
+    assert result['elapsed'] < 2
+    # The fast chunk was reported while the slow one was outstanding
+    assert [partial['scanned'] for partial in progress] == [2]
+    assert not progress[0]['complete']
+
+
+class BarsProvider:
+    """Returns two daily bars per symbol at once, counting the symbols requested."""
+
+    def __init__(self):
+        self.requested = 0
+
+    def get_bars(self, symbols, period, interval):
+        self.requested += len(symbols)
+        index = pd.date_range("2026-10-15", periods=2, freq="D")
+        bar = pd.DataFrame(
+            {'Open': [10.0, 10.0], 'High': [11.0, 11.0], 'Low': [9.0, 9.0], 'Close': [10.0, 10.5], 'Volume': [1e5, 2e5]},
+            index=index,
+        )
+        return pd.concat({symbol: bar for symbol in symbols}, axis=1)
+
+
+def test_overrun_scan_leaves_rate_limiter_usable():
+    # 20 tokens per second with 20-symbol chunks: one chunk per second
+    executor = FetchExecutor(max_workers=4, rate_per_second=20, burst=20, max_retries=0, backoff_seconds=0)
+    provider = BarsProvider()
+    fetcher = StockDataFetcher(cache=TTLCache(), executor=executor, provider=provider)
+    symbols = [f"S{i:03d}" for i in range(200)]
+
+    result = MarketScanner(fetcher, executor).scan(symbols, chunk_size=20, time_budget=0.5)
+
+    assert not result['complete']
+    assert 0 < result['scanned'] < len(symbols)
+    requested = provider.requested
+
+    # Workers that were waiting for tokens gave up at the deadline instead of
+    # requesting (and charging) their chunks late...
+    time.sleep(1.5)
+    assert provider.requested == requested
+    # ...so the bucket has refilled for the next request
+    started = time.monotonic()
+    executor.call(YAHOO_HOST, lambda: None)
+    assert time.monotonic() - started < 0.2
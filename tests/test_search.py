@@ -0,0 +1,76 @@
+"""Tests for news tokenization and the inverted index."""
+import random
+
+from src.data.search import STOPWORDS, NewsIndex, stem, tokenize
+
+WORDS = (
+    "fed federal rates rate rally rallies rallied stocks stock oil apple apples "
+    "chips earnings beat beats hike hiked hikes inflation jobs"
+).split()
+
+
+def article(doc, title, published_ts, description=""):
+    return {'id': f"a{doc}", 'title': title, 'description': description, 'published_ts': published_ts}
+
+
+def test_stem_folds_inflections():
+    assert {stem(word) for word in ("rallies", "rallied", "rallying", "rally")} == {"rally"}
+    assert {stem(word) for word in ("hike", "hikes", "hiked")} == {"hik"}
+    assert stem("stopped") == "stop" and stem("taxes") == "tax"
+    assert stem("AAPL".lower()) == "aapl" and stem("s&p") == "s&p"
+    assert tokenize("The Fed is hiking rates at S&P's expense") == ["fed", "hik", "rat", "s&p's", "expens"]
+
+
+def test_search_matches_every_term_newest_first():
+    index = NewsIndex()
+    index.add_many([
+        article(1, "Fed hikes rates", 100),
+        article(2, "Stocks rally as Fed holds rates", 300),
+        article(3, "Oil rallies", 200, description="Crude prices hiked by supply cuts"),
+    ])
+
+    assert [a['id'] for a in index.search("fed rates ")] == ["a2", "a1"]
+    # Inflections and descriptions match, the last term as a prefix
+    assert [a['id'] for a in index.search("hike")] == ["a3", "a1"]
+    assert [a['id'] for a in index.search("ral")] == ["a2", "a3"]
+    assert [a['id'] for a in index.search("fed ra", limit=1)] == ["a2"]
+    assert index.search("the ") == [] and index.search("gold") == []
+
+
+def test_search_agrees_with_a_scan():
+    rng = random.Random(5)
+    index = NewsIndex()
+    articles = [
+        article(doc, " ".join(rng.sample(WORDS, rng.randint(2, 6))), published_ts=doc)
+        for doc in range(400)
+    ]
+    # Added in batches, some twice
+    added = [index.add_many(articles[start:start + 60]) for start in range(0, 400, 50)]
+    assert added == [60] + [50] * 6 + [40]
+    tokens = {a['id']: set(tokenize(a['title'])) for a in articles}
+
+    for _ in range(200):
+        words = rng.sample(WORDS, rng.randint(1, 3))
+        prefix = rng.choice(WORDS)[:rng.randint(2, 4)]
+        query = " ".join(words + [prefix])
+        terms = tokenize(" ".join(words))
+
+        expected = [
+            a['id'] for a in reversed(articles)
+            if set(terms) <= tokens[a['id']]
+            # A stopword ("be") is dropped rather than matched as a prefix
+            and (prefix in STOPWORDS or any(token.startswith((prefix, stem(prefix))) for token in tokens[a['id']]))
+        ]
+        assert [a['id'] for a in index.search(query, limit=1000)] == expected, query
+
+
+def test_oldest_articles_are_evicted_past_capacity():
+    index = NewsIndex(capacity=2)
+    index.add_many([article(1, "Apple beats", 1), article(2, "Apple slips", 2)])
+    index.add_many([article(3, "Oil rallies", 3)])
+
+    assert len(index) == 2
+    assert [a['id'] for a in index.search("apple ")] == ["a2"]
+    # Tokens only the evicted article used are gone from the vocabulary
+    assert index.search("bea") == []
+    assert index.add_many([article(1, "Apple beats", 1)]) == 1
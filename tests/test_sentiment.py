@@ -0,0 +1,161 @@
+"""Tests that RollingSentiment agrees with a full recomputation."""
+from datetime import date, timedelta
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.sentiment import RollingSentiment, SentimentAnalyzer
+from src.utils.config import config
+
+TICKERS = ["AAA", "BBB", "GAP", "ONE", "FLAT", "NONE"]
+
+NEWS = {
+    "AAA": {'score': -0.8, 'count': 4, 'positive': 0, 'negative': 4},
+    "FLAT": {'score': 0.9, 'count': 2, 'positive': 2, 'negative': 0},
+}
+
+
+def daily_bars() -> pd.DataFrame:
+    """Five daily bars for every ticker but NONE, with a gap in GAP and a single bar for ONE."""
+    index = pd.date_range("2026-10-05", periods=5, freq="B", tz="America/New_York")
+    closes = {
+        "AAA": [100.0, 101.0, 103.0, 104.0, 106.0],
+        "BBB": [50.0, 49.0, 48.5, 47.0, 46.0],
+        "GAP": [20.0, np.nan, 20.5, np.nan, 20.2],
+        "ONE": [np.nan, np.nan, np.nan, np.nan, 10.5],
+        "FLAT": [30.0, 30.0, 30.1, 30.0, 30.05],
+    }
+    columns = {}
+    for ticker, close in closes.items():
+        close = np.array(close)
+        columns[(ticker, 'Open')] = np.where(np.isnan(close), np.nan, close - 0.25)
+        columns[(ticker, 'Close')] = close
+        columns[(ticker, 'Volume')] = np.where(np.isnan(close), np.nan, np.arange(1, 6) * 1e5)
+    return pd.DataFrame(columns, index=index)
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    analyzer = SentimentAnalyzer()
+    monkeypatch.setattr(config, 'sentiment_news_weight', 0.3)
+    monkeypatch.setattr(analyzer.stock_fetcher, 'get_bars', lambda tickers, period, interval: daily_bars())
+    monkeypatch.setattr(analyzer, '_news_sentiment', NEWS.get)
+    return analyzer
+
+
+def assert_same_sentiment(actual, expected):
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, float):
+            assert actual[key] == pytest.approx(value), key
+        else:
+            assert actual[key] == value, key
+
+
+def test_rolling_seed_matches_batch(analyzer):
+    batch = analyzer.analyze_market_sentiment(TICKERS)
+    rolling = analyzer.create_rolling(TICKERS).market_sentiment()
+
+    by_ticker = {sentiment['ticker']: sentiment for sentiment in rolling['ticker_sentiments']}
+    assert list(by_ticker) == TICKERS
+    for sentiment in batch['ticker_sentiments']:
+        assert_same_sentiment(by_ticker[sentiment['ticker']], sentiment)
+
+    for key in ('overall_sentiment', 'bullish_count', 'bearish_count', 'neutral_count'):
+        assert rolling[key] == batch[key], key
+    assert rolling['average_change'] == pytest.approx(batch['average_change'])
+    assert_same_sentiment(rolling['breadth'], batch['breadth'])
+
+
+def test_news_moves_the_label(analyzer):
+    sentiments = {s['ticker']: s for s in analyzer.analyze_batch(TICKERS)}
+
+    # A 6% gain is Bullish on price alone; four negative headlines pull it back
+    assert sentiments["AAA"]['news_count'] == 4
+    assert sentiments["AAA"]['score'] == pytest.approx(0.7 * 80 + 0.3 * 10)
+    assert sentiments["AAA"]['sentiment'] == "Slightly Bullish"
+    # Tickers without enough bars stay neutral whatever their news
+    assert sentiments["NONE"]['sentiment'] == "Neutral"
+    assert sentiments["BBB"]['news_score'] is None
+
+
+def test_incremental_updates_match_recomputation():
+    rng = random.Random(7)
+    window = 5
+    tickers = [f"T{i}" for i in range(12)]
+    rolling = RollingSentiment(window, news_weight=0.3)
+
+    # Reference state, kept the simple way: every bar, the news and today's change
+    bars = {ticker: [] for ticker in tickers}
+    news = {}
+    day_changes = {}
+    today = date(2026, 10, 1)
+
+    for _ in range(3000):
+        ticker = rng.choice(tickers)
+        history = bars[ticker]
+        action = rng.random()
+        if action < 0.3 or not history:
+            today += timedelta(days=rng.random() < 0.3)
+            close, volume = rng.uniform(5, 200), float(rng.randint(0, 10**6))
+            history.append([close, volume, today])
+            rolling.add_bar(ticker, close, volume, today)
+        elif action < 0.85:
+            change = rng.choice([0.0, rng.uniform(-5, 5)])
+            quote = {
+                'symbol': ticker,
+                'price': rng.uniform(5, 200),
+                'volume': rng.randint(0, 10**6),
+                'change_percent': change,
+            }
+            day_changes[ticker] = change
+            if rng.random() < 0.3:
+                # The next session, opened from the last close
+                today += timedelta(days=1)
+                quote['previous_close'] = history[-1][0]
+                history.append([quote['price'], float(quote['volume']), today])
+                rolling.update_quote(quote, today=today)
+            else:
+                # A revision of the ticker's last bar
+                history[-1][:2] = [quote['price'], float(quote['volume'])]
+                rolling.update_quote(quote, today=history[-1][2])
+        else:
+            summary = None if rng.random() < 0.3 else {'score': rng.uniform(-1, 1), 'count': rng.randint(1, 9)}
+            news[ticker] = summary
+            rolling.set_news(ticker, summary)
+
+    fresh = RollingSentiment(window, news_weight=0.3)
+    for ticker in tickers:
+        fresh.set_news(ticker, news.get(ticker))
+        for close, volume, day in bars[ticker][-window:]:
+            fresh.add_bar(ticker, close, volume, day)
+
+    for ticker in tickers:
+        assert_same_sentiment(rolling.ticker_sentiment(ticker), fresh.ticker_sentiment(ticker))
+
+    market = rolling.market_sentiment()
+    expected = fresh.market_sentiment()
+    for key in ('overall_sentiment', 'bullish_count', 'bearish_count', 'neutral_count'):
+        assert market[key] == expected[key], key
+    assert market['average_change'] == pytest.approx(expected['average_change'])
+
+    changes = np.array(list(day_changes.values()))
+    assert market['breadth'] == pytest.approx({
+        'advancing': int((changes > 0).sum()),
+        'declining': int((changes < 0).sum()),
+        'unchanged': int((changes == 0).sum()),
+        'average_change': float(changes.mean()),
+    })
+
+
+def test_top_tickers_are_the_largest_movers():
+    rolling = RollingSentiment(3)
+    for ticker, closes in {"UP": [10, 11, 12], "DOWN": [10, 9, 8], "FLAT": [10, 10, 10]}.items():
+        for close in closes:
+            rolling.add_bar(ticker, close, 1000)
+
+    top = rolling.market_sentiment(top=2)['ticker_sentiments']
+
+    assert {sentiment['ticker'] for sentiment in top} == {"UP", "DOWN"}
@@ -0,0 +1,99 @@
+"""Tests for single-flight coalescing across threads and asyncio tasks."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+import pytest
+
+from src.data.singleflight import SingleFlight
+
+
+class Gate:
+    """A fetch that blocks until released and counts how often it ran."""
+
+    def __init__(self, result="value", error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def run_concurrently(flight, key, fn, callers=5):
+    """Start one leader, then callers - 1 followers once the leader is in flight."""
+    with ThreadPoolExecutor(callers) as pool:
+        leader = pool.submit(flight.do, key, fn)
+        fn.started.wait(5)
+        followers = [pool.submit(flight.do, key, fn) for _ in range(callers - 1)]
+        # Let the followers reach the in-flight call before it completes
+        time.sleep(0.1)
+        fn.release.set()
+        return [leader] + followers
+
+
+def test_concurrent_calls_share_one_fetch():
+    flight = SingleFlight()
+    fetch = Gate()
+
+    futures = run_concurrently(flight, ('quote', "AAPL"), fetch)
+
+    assert [future.result() for future in futures] == ["value"] * 5
+    assert fetch.calls == 1
+    assert flight.in_flight() == 0
+
+
+def test_errors_reach_every_waiter_and_are_not_kept():
+    flight = SingleFlight()
+    fetch = Gate(error=RuntimeError("rate limited"))
+
+    futures = run_concurrently(flight, ('quote', "AAPL"), fetch)
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="rate limited"):
+            future.result()
+    assert fetch.calls == 1
+    # The failure is not remembered: the next call fetches again
+    assert flight.do(('quote', "AAPL"), lambda: "retry") == "retry"
+
+
+def test_different_keys_do_not_wait_for_each_other():
+    flight = SingleFlight()
+    slow = Gate()
+    with ThreadPoolExecutor(1) as pool:
+        pending = pool.submit(flight.do, ('quote', "SLOW"), slow)
+        slow.started.wait(5)
+
+        assert flight.do(('quote', "FAST"), lambda: "fast") == "fast"
+        assert flight.in_flight() == 1
+        slow.release.set()
+        assert pending.result() == "value"
+
+
+def test_async_and_thread_callers_share_one_fetch():
+    flight = SingleFlight()
+    fetch = Gate()
+
+    async def main():
+        with ThreadPoolExecutor(2) as pool:
+            leader = asyncio.ensure_future(flight.do_async(('history', "AAPL"), fetch, pool))
+            await asyncio.get_running_loop().run_in_executor(None, fetch.started.wait, 5)
+            waiters = [asyncio.ensure_future(flight.do_async(('history', "AAPL"), fetch)) for _ in range(3)]
+            thread = pool.submit(flight.do, ('history', "AAPL"), fetch)
+            await asyncio.sleep(0.05)
+            # Cancelling one waiter leaves the shared call running for the rest
+            waiters[0].cancel()
+            fetch.release.set()
+            results = await asyncio.gather(leader, *waiters[1:])
+            return results + [thread.result(5)]
+
+    assert asyncio.run(main()) == ["value"] * 4
+    assert fetch.calls == 1
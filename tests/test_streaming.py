@@ -0,0 +1,113 @@
+"""Tests for streamed quotes against a local websocket server."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.data.movers import MoversEngine
+from src.data.quote_bus import PollingQuoteProducer, QuoteBus
+from src.data.streaming import QUOTE_KEYS, StreamingQuoteProducer, encode_pricing, quote_from_pricing
+
+pytest.importorskip("websockets")
+
+from src.data.stub_stream import StubQuoteStreamServer  # noqa: E402
+
+
+class PriceOnlyServer(StubQuoteStreamServer):
+    """Sends ticks carrying nothing but a price, and only for the symbols in ``trading``."""
+
+    trading = {"AAPL"}
+
+    async def _tick(self, websocket, symbols):
+        while True:
+            await asyncio.sleep(self.tick_interval)
+            for symbol in list(symbols & self.trading):
+                await websocket.send(encode_pricing({'id': symbol, 'price': 190.0}))
+                self.ticks_sent += 1
+
+
+class FakeFetcher:
+    """Bulk quotes for the symbols in ``quotes``; records every request."""
+
+    def __init__(self, quotes):
+        self.quotes = quotes
+        self.requests = []
+
+    def get_quotes(self, tickers):
+        self.requests.append(list(tickers))
+        return {ticker: self.quotes[ticker] for ticker in tickers if ticker in self.quotes}
+
+
+class Collector:
+    def __init__(self):
+        self.quotes = {}
+        self._changed = threading.Condition()
+
+    def __call__(self, quotes):
+        with self._changed:
+            self.quotes.update(quotes)
+            self._changed.notify_all()
+
+    def wait_for(self, *symbols, timeout=5.0):
+        with self._changed:
+            return self._changed.wait_for(lambda: set(symbols) <= set(self.quotes), timeout)
+
+
+def wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def server():
+    server = PriceOnlyServer(tick_interval=0.05)
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_first_tick_without_change_fields_has_every_key():
+    quote = quote_from_pricing({'id': 'AAPL', 'price': 190.0})
+
+    assert set(QUOTE_KEYS) <= set(quote)
+    assert quote['change'] == 0 and quote['change_percent'] == 0 and quote['volume'] == 0
+
+    merged = quote_from_pricing({'id': 'AAPL', 'price': 191.0, 'change': 1.0}, quote)
+    assert (merged['price'], merged['change'], merged['previous_close']) == (191.0, 1.0, 0)
+
+
+def test_price_only_ticks_reach_subscribers(server):
+    bus = QuoteBus(coalesce_seconds=0.01)
+    fetcher = FakeFetcher({"IDLE": {'symbol': "IDLE", 'price': 12.0, 'change': 0.5, 'change_percent': 4.3}})
+    producer = StreamingQuoteProducer(bus, server.url, PollingQuoteProducer(bus, fetcher, interval=3600))
+    received = Collector()
+    bus.subscribe(["AAPL", "IDLE"], received)
+    producer.start()
+    try:
+        # IDLE never trades, so its only quote is the one seeded on connect
+        assert received.wait_for("AAPL", "IDLE")
+        assert received.quotes["AAPL"]['price'] == 190.0
+        assert received.quotes["IDLE"]['price'] == 12.0
+
+        # Consumers index these keys directly
+        movers = MoversEngine(k=2)
+        movers.update_quotes(received.quotes.values())
+        assert len(movers) == 2
+
+        # A symbol subscribed while streaming is seeded as well
+        fetcher.quotes["LATE"] = {'symbol': "LATE", 'price': 3.0, 'change': 0, 'change_percent': 0}
+        late = Collector()
+        bus.subscribe(["LATE"], late)
+        assert late.wait_for("LATE")
+        assert producer.connected
+    finally:
+        producer.stop()
+
+    # Only the symbol without a quote was requested
+    assert fetcher.requests[-1] == ["LATE"]
+    assert wait_until(lambda: not producer._thread.is_alive())